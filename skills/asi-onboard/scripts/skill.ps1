@@ -12,6 +12,8 @@ Commands:
   validate                     Verify the skill is runnable (read-only)
   schema                       Emit JSON schema for plan input
   run --stdin                  Execute onboard via plan JSON
+  index                        Build or update the repository file index
+  query [filters]              Query the file index (--language, --glob, --largest N, --limit N)
 
 Execution backend: asi CLI
 "@
@@ -39,6 +41,14 @@ function Invoke-Run {
     & asi onboard run --stdin
 }
 
+function Invoke-Index {
+    & asi onboard index
+}
+
+function Invoke-Query([string[]]$Filters) {
+    & asi onboard query @Filters
+}
+
 $command = if ($args.Count -gt 0) { $args[0] } else { "help" }
 
 switch ($command) {
@@ -47,6 +57,8 @@ switch ($command) {
     "validate" { Invoke-Validate }
     "schema" { Invoke-Schema }
     "run" { Invoke-Run }
+    "index" { Invoke-Index }
+    "query" { Invoke-Query @($args | Select-Object -Skip 1) }
     default {
         Write-Error "error: unknown command '$command'"
         exit 1
@@ -12,6 +12,8 @@ Commands:
   validate                     Verify the skill is runnable (read-only)
   schema                       Emit JSON schema for plan input
   run --stdin                  Execute onboard via plan JSON
+  index                        Build or update the repository file index
+  query [filters]              Query the file index (--language, --glob, --largest N, --limit N)
 
 Execution backend: asi CLI
 EOF
@@ -37,11 +39,21 @@ cmd_run() {
     asi onboard run --stdin
 }
 
+cmd_index() {
+    asi onboard index
+}
+
+cmd_query() {
+    asi onboard query "$@"
+}
+
 case "${1:-help}" in
     help) cmd_help ;;
     init) cmd_init ;;
     validate) cmd_validate ;;
     schema) cmd_schema ;;
     run) cmd_run ;;
+    index) cmd_index ;;
+    query) shift; cmd_query "$@" ;;
     *) echo "error: unknown command '$1'" >&2; exit 1 ;;
 esac
@@ -0,0 +1,92 @@
+"""Microbenchmark: JSON codec backends on batch input and state rewrites.
+
+Times each available backend (`asi.util.codec`) parsing an NDJSON batch of
+`--ops` creator operations and encoding a creator state with `--decisions`
+decisions the way write_json does (two-space indent, sorted keys).
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_codec.py [--ops N] [--decisions N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Any
+
+from asi.util import codec
+
+
+def _batch_lines(n: int) -> list[str]:
+    op = {
+        "op": "suggest",
+        "params": {
+            "iteration_id": "0" * 64,
+            "suggestions": [
+                {
+                    "question_id": f"creator.q{q}",
+                    "options": [
+                        {
+                            "label": f"Option {k}",
+                            "value": f"value-{k}",
+                            "description": "d" * 80,
+                            "impact": "i" * 80,
+                        }
+                        for k in (1, 2, 3)
+                    ],
+                    "recommended": 1,
+                }
+                for q in range(3)
+            ],
+        },
+    }
+    line = codec.STDLIB.dumps(op, False, False)
+    return [line] * n
+
+
+def _state(n: int) -> dict[str, Any]:
+    return {
+        "version": 3,
+        "decisions": {
+            f"decision_{i}": {"value": f"value-{i}", "source": "option", "ask_set_id": f"{i:064x}"}
+            for i in range(n)
+        },
+        "last_ask_set": {},
+        "decision_log_ref": {"seq": n, "offset": n * 120},
+    }
+
+
+def _time_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--decisions", type=int, default=20000)
+    args = parser.parse_args()
+
+    lines = _batch_lines(args.ops)
+    state = _state(args.decisions)
+    rows = []
+    for backend in ("stdlib", "orjson"):
+        os.environ[codec.BACKEND_ENV] = backend
+        try:
+            active = codec.codec()
+        except ValueError as exc:
+            print(f"{backend}: skipped ({exc})")
+            continue
+        parse = _time_ms(lambda active=active: [active.loads(line) for line in lines])
+        rewrite = _time_ms(lambda active=active: active.dumps(state, True, True))
+        rows.append((backend, parse, rewrite))
+
+    print(f"{'backend':8} {'parse batch ms':>15} {'rewrite state ms':>17}")
+    for backend, parse, rewrite in rows:
+        print(f"{backend:8} {parse:>15.1f} {rewrite:>17.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""In-process timing of the creator loop with state I/O counters.
+
+Runs next -> suggest -> apply cycles in a scratch repo and reports, per
+command, how many times state.json was parsed and written and how often the
+legacy-path scan ran, plus the mean wall time per cycle.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_creator_loop.py [--cycles N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import asi.creator.state as state_mod
+from asi.creator.loop import cmd_apply, cmd_next, cmd_suggest
+
+
+COUNTS: Counter[str] = Counter()
+
+
+def _instrument() -> None:
+    read_json, write_json = state_mod.read_json, state_mod.write_json
+    legacy_scan = state_mod._legacy_paths_present
+
+    def counted_read(path: Path):
+        if path.name == "state.json":
+            COUNTS["state_reads"] += 1
+        return read_json(path)
+
+    def counted_write(path: Path, data):
+        if path.name == "state.json":
+            COUNTS["state_writes"] += 1
+        return write_json(path, data)
+
+    def counted_scan():
+        COUNTS["legacy_scans"] += 1
+        return legacy_scan()
+
+    state_mod.read_json = counted_read
+    state_mod.write_json = counted_write
+    state_mod._legacy_paths_present = counted_scan
+
+
+def _suggestions(questions: list[dict]) -> list[dict]:
+    return [
+        {
+            "question_id": q["id"],
+            "options": [
+                {"label": f"Option {n}", "value": f"value-{n}", "description": "d", "impact": "i"}
+                for n in (1, 2, 3)
+            ],
+            "recommended": 1,
+        }
+        for q in questions
+    ]
+
+
+def _cycle(per_command: dict[str, Counter[str]]) -> None:
+    def run(name, fn, *args):
+        before = COUNTS.copy()
+        result = fn(*args)
+        per_command[name] += COUNTS - before
+        return result
+
+    nxt = run("next", cmd_next)
+    ask = run(
+        "suggest",
+        cmd_suggest,
+        json.dumps(
+            {"iteration_id": nxt["iteration_id"], "suggestions": _suggestions(nxt["questions"])}
+        ),
+    )
+    answers = [{"question_id": q["id"], "selection": 1} for q in ask["questions"]]
+    run(
+        "apply",
+        cmd_apply,
+        json.dumps({"ask_set_id": ask["ask_set_id"], "confirmed": True, "answers": answers}),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=200)
+    args = parser.parse_args()
+
+    _instrument()
+    per_command: dict[str, Counter[str]] = {
+        "next": Counter(),
+        "suggest": Counter(),
+        "apply": Counter(),
+    }
+    with tempfile.TemporaryDirectory() as td:
+        cwd = Path(td)
+        (cwd / ".git").mkdir()
+        os.chdir(cwd)
+        state_file = cwd / ".asi" / "creator" / "state.json"
+        state_file.parent.mkdir(parents=True)
+        seed = json.dumps({"version": 2, "decisions": {}, "decision_log": [], "last_ask_set": {}})
+        elapsed = 0.0
+        for _ in range(args.cycles):
+            state_file.write_text(seed, encoding="utf-8")
+            start = time.perf_counter()
+            _cycle(per_command)
+            elapsed += time.perf_counter() - start
+
+    for name, counts in per_command.items():
+        per = {k: counts[k] / args.cycles for k in ("state_reads", "state_writes", "legacy_scans")}
+        print(f"{name:8} " + "  ".join(f"{k}={v:.1f}" for k, v in per.items()))
+    print(f"mean cycle {elapsed / args.cycles * 1000:.3f} ms over {args.cycles} cycles")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
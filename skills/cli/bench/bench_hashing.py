@@ -0,0 +1,112 @@
+"""Microbenchmark: canonical_hash vs the json.dumps + sha256 one-liner.
+
+Hashes the shapes the creator loop produces (iteration id, plan, ask sets of
+3 and `--questions` questions built from the real skeletons) both ways,
+checks the digests match, and reports time per hash plus the peak memory
+tracemalloc sees while hashing the large ask set.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_hashing.py [--rounds N] [--questions N]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from asi.creator.questions import question_skeletons
+from asi.util.hashing import canonical_hash
+
+
+def legacy_hash(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _ask_set(n: int) -> dict[str, Any]:
+    skeletons = question_skeletons({})
+    questions = []
+    for i in range(n):
+        q = skeletons[i % len(skeletons)]
+        options = [
+            {
+                "label": f"Option {k}",
+                "value": f"value-{i}-{k}",
+                "description": "d" * 60,
+                "impact": "i" * 60,
+            }
+            for k in (1, 2, 3)
+        ]
+        options.append(q["fixed_option_4"])
+        questions.append(
+            {
+                "id": f"{q['id']}.{i}",
+                "decision_key": q["decision_key"],
+                "answer_kind": q["answer_kind"],
+                "value_constraints": q["value_constraints"],
+                "prompt": q["prompt"],
+                "context": q["context"],
+                "options": options,
+                "recommended": 1,
+            }
+        )
+    return {"iteration_id": "0" * 64, "questions": questions}
+
+
+def _plan() -> dict[str, Any]:
+    return {
+        "skill_name": "example-skill",
+        "skill_purpose": "Summarize build failures",
+        "target_directory": "skills/example-skill",
+        "files": [f"skills/example-skill/references/{n:02d}_SECTION.md" for n in range(12)],
+    }
+
+
+def _time(fn, value: Any, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(value)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def _peak(fn, value: Any) -> int:
+    tracemalloc.start()
+    fn(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--questions", type=int, default=200)
+    args = parser.parse_args()
+
+    ids = {"questions": [q["id"] for q in question_skeletons({})]}
+    large = _ask_set(args.questions)
+    cases = [
+        ("iteration id", ids, args.rounds),
+        ("plan", _plan(), args.rounds),
+        ("ask set (3)", _ask_set(3), args.rounds),
+        (f"ask set ({args.questions})", large, max(1, args.rounds // 50)),
+    ]
+
+    print(f"{'input':16} {'legacy us':>10} {'canonical us':>13} {'speedup':>8}")
+    for name, value, rounds in cases:
+        if canonical_hash(value) != legacy_hash(value):
+            print(f"digest mismatch: {name}", file=sys.stderr)
+            return 1
+        legacy = _time(legacy_hash, value, rounds)
+        new = _time(canonical_hash, value, rounds)
+        print(f"{name:16} {legacy:>10.2f} {new:>13.2f} {legacy / new:>7.2f}x")
+
+    legacy_peak, new_peak = _peak(legacy_hash, large), _peak(canonical_hash, large)
+    print(f"\npeak bytes, ask set ({args.questions}): legacy {legacy_peak}, canonical {new_peak}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
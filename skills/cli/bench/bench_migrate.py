@@ -0,0 +1,89 @@
+r"""Microbenchmark: legacy migration, serial read/write vs pooled kernel copies.
+
+Builds a throwaway `.asi/exec` tree of `--files` files of `--kb` KiB and
+migrates it with the previous serial `write_bytes(read_bytes())` loop, with
+`migrate_legacy` (copy mode, `--jobs`; hashes every target for the
+manifest), reruns it against that manifest with nothing changed, and with
+`migrate_legacy(link=True)`. Reports wall time and peak Python allocation
+(tracemalloc) per mode.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_migrate.py \
+        [--files N] [--kb N] [--jobs N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from asi.creator.migrate import migrate_legacy
+from asi.util.paths import REPO_ROOT_ENV
+
+
+def _make_tree(root: Path, files: int, kb: int) -> None:
+    (root / ".git").mkdir(parents=True)
+    blob = os.urandom(kb * 1024)
+    for i in range(files):
+        path = root / ".asi" / "exec" / f"task_{i // 100}" / f"output_{i}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(blob)
+
+
+def _serial(root: Path) -> None:
+    src = root / ".asi" / "exec"
+    for path in src.rglob("*"):
+        if path.is_dir():
+            continue
+        target = root / ".asi" / "creator" / "exec" / path.relative_to(src)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(path.read_bytes())
+
+
+def _measure(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) * 1e3
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--kb", type=int, default=256)
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    # (mode, start from an empty .asi/creator, run)
+    modes = [
+        ("serial", True, lambda: _serial(root)),
+        (f"pool x{args.jobs}", True, lambda: migrate_legacy(jobs=args.jobs)),
+        ("rerun", False, lambda: migrate_legacy(jobs=args.jobs)),
+        ("link", True, lambda: migrate_legacy(jobs=args.jobs, link=True)),
+    ]
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td) / "repo"
+        _make_tree(root, args.files, args.kb)
+        os.environ[REPO_ROOT_ENV] = str(root)
+        rows = []
+        for mode, fresh, run in modes:
+            if fresh:
+                shutil.rmtree(root / ".asi" / "creator", ignore_errors=True)
+            rows.append((mode, *_measure(run)))
+
+    print(f"{args.files} files x {args.kb} KiB")
+    print(f"{'mode':10} {'ms':>9} {'peak MiB':>9}")
+    for mode, ms, peak in rows:
+        print(f"{mode:10} {ms:>9.1f} {peak:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
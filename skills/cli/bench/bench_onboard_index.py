@@ -0,0 +1,76 @@
+r"""Microbenchmark: `asi onboard index`, full build vs incremental updates, and queries.
+
+Builds a throwaway tree of `--files` source files of `--kb` KiB (no `.git`, so
+files come from the walk) and times `update_index` from scratch, again with
+nothing changed, after touching `--touch` files, and a `--largest 20` query.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_onboard_index.py \
+        [--files N] [--kb N] [--touch N] [--jobs N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from asi.onboard.index import index_path, query_index, update_index
+from asi.util.paths import REPO_ROOT_ENV
+
+
+def _make_tree(root: Path, files: int, kb: int) -> list[Path]:
+    body = "".join(
+        f"def function_{i}(value):\n    return value + {i}\n\n" for i in range(kb * 1024 // 40)
+    )
+    paths = []
+    for i in range(files):
+        path = root / "src" / f"pkg_{i // 200}" / f"module_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"class Module{i}:\n    pass\n\n{body}", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--kb", type=int, default=16)
+    parser.add_argument("--touch", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        paths = _make_tree(root, args.files, args.kb)
+        os.environ[REPO_ROOT_ENV] = str(root)
+
+        def touch() -> None:
+            for path in paths[: args.touch]:
+                os.utime(path, ns=(1, 1))
+            update_index(jobs=args.jobs)
+
+        rows = [
+            ("full", _ms(lambda: update_index(jobs=args.jobs))),
+            ("unchanged", _ms(lambda: update_index(jobs=args.jobs))),
+            (f"{args.touch} touched", _ms(touch)),
+            ("query", _ms(lambda: query_index(largest=20))),
+        ]
+        size = index_path().stat().st_size / 2**20
+
+    print(f"{args.files} files x {args.kb} KiB, index {size:.2f} MiB")
+    print(f"{'mode':12} {'ms':>9}")
+    for mode, ms in rows:
+        print(f"{mode:12} {ms:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+r"""Microbenchmark: `asi skill init` reference emission, uncached vs cached.
+
+Builds a throwaway skill with `--files` references of `--kb` KiB each and
+times `emit_references` into a null sink with the cache off, on a cold cache
+(render + store) and on a warm cache (stamp check + copy).
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_skill_init.py \
+        [--files N] [--kb N] [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from asi.commands import skill
+from asi.util.cache import CACHE_ENV
+
+
+def _make_skill(root: Path, files: int, kb: int) -> Path:
+    refs = root / "skill" / "references"
+    refs.mkdir(parents=True)
+    body = ("lorem ipsum dolor sit amet " * 40 + "\n") * max(1, kb * 1024 // 1081)
+    for i in range(1, files + 1):
+        (refs / f"{i:02d}_REF{i}.md").write_text(
+            f"---\nname: ref{i}\ndescription: Reference number {i}\n---\n\n{body}", encoding="utf-8"
+        )
+    return refs.parent
+
+
+def _best_ms(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1e3)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=12)
+    parser.add_argument("--kb", type=int, default=64)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as td, open(os.devnull, "wb") as sink:
+        root = Path(td)
+        skill_dir = _make_skill(root, args.files, args.kb)
+        os.environ[CACHE_ENV] = str(root / "cache")
+
+        def cold() -> None:
+            shutil.rmtree(root / "cache", ignore_errors=True)
+            skill.emit_references(skill_dir, out=sink)
+
+        rows = [
+            (
+                "no cache",
+                _best_ms(
+                    lambda: skill.emit_references(skill_dir, use_cache=False, out=sink), args.runs
+                ),
+            ),
+            ("cold", _best_ms(cold, args.runs)),
+            ("warm", _best_ms(lambda: skill.emit_references(skill_dir, out=sink), args.runs)),
+        ]
+
+    print(f"{args.files} references x {args.kb} KiB")
+    print(f"{'mode':9} {'best ms':>8}")
+    for mode, ms in rows:
+        print(f"{mode:9} {ms:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
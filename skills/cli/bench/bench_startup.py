@@ -0,0 +1,113 @@
+"""Cold-start import budget check for the asi CLI.
+
+Runs each scenario under `python -X importtime`, sums the cumulative import
+time of top-level modules that a bare interpreter does not already load, and
+fails when the median exceeds the budget recorded in startup_budget.json.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_startup.py [--runs N] [--record]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+BUDGET_PATH = BENCH_DIR / "startup_budget.json"
+SRC_DIR = BENCH_DIR.parent / "src"
+
+SCENARIOS: dict[str, list[str]] = {
+    "version": ["--version"],
+    "doctor": ["doctor"],
+    "onboard_schema": ["onboard", "--schema"],
+    "creator_schema": ["creator", "--schema"],
+    "creator_next": ["creator", "next"],
+}
+
+# Budgets are recorded with headroom so the check flags regressions, not noise.
+RECORD_HEADROOM = 2.0
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue  # nested import, already counted by its parent
+        out[name.strip()] = int(cumulative)
+    return out
+
+
+def _run(argv: list[str], cwd: Path, env: dict[str, str]) -> dict[str, int]:
+    code = f"import sys; from asi.cli import main; sys.exit(main({argv!r}))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(cwd),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return _import_times(result.stderr)
+
+
+def measure(runs: int) -> dict[str, int]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR)
+    with tempfile.TemporaryDirectory() as td:
+        cwd = Path(td)
+        (cwd / ".git").mkdir()
+        baseline = set(_run_bare(cwd, env))
+        results: dict[str, int] = {}
+        for name, argv in SCENARIOS.items():
+            samples = []
+            for _ in range(runs):
+                times = _run(argv, cwd, env)
+                samples.append(sum(us for mod, us in times.items() if mod not in baseline))
+            results[name] = int(statistics.median(samples))
+    return results
+
+
+def _run_bare(cwd: Path, env: dict[str, str]) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        cwd=str(cwd),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return _import_times(result.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--record", action="store_true", help="Rewrite the budget file")
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    if args.record:
+        budget = {name: int(us * RECORD_HEADROOM) for name, us in results.items()}
+        text = json.dumps(budget, indent=2, sort_keys=True) + "\n"
+        BUDGET_PATH.write_text(text, encoding="utf-8")
+
+    budget = json.loads(BUDGET_PATH.read_text(encoding="utf-8"))
+    failed = False
+    for name, us in results.items():
+        limit = budget.get(name)
+        over = limit is not None and us > limit
+        failed = failed or over
+        shown = limit if limit is not None else "-"
+        print(f"{name:16} {us:8d} us  budget {shown:>8} {'FAIL' if over else 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
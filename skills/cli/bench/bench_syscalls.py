@@ -0,0 +1,110 @@
+"""Filesystem syscall counts per asi command.
+
+Wraps the os-level entry points pathlib and open() go through (stat, lstat,
+scandir, listdir, mkdir, open) and runs each command in-process via
+`asi.cli.main` from a directory nested `--depth` levels below the repo root,
+so the repo-root walk shows up in the counts.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_syscalls.py [--depth N]
+"""
+from __future__ import annotations
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from asi.cli import main as asi_main
+
+
+COUNTS: Counter[str] = Counter()
+WRAPPED = ("stat", "lstat", "scandir", "listdir", "mkdir", "getcwd")
+
+
+def _instrument() -> None:
+    def counting(name, fn):
+        def wrapper(*args, **kwargs):
+            COUNTS[name] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    for name in WRAPPED:
+        setattr(os, name, counting(name, getattr(os, name)))
+    builtins.open = io.open = counting("open", io.open)
+
+
+def _run(argv: list[str], stdin: str = "") -> tuple[Counter[str], str]:
+    out = io.StringIO()
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    before = COUNTS.copy()
+    try:
+        with contextlib.redirect_stdout(out):
+            asi_main(argv)
+    finally:
+        sys.stdin = saved_stdin
+    return COUNTS - before, out.getvalue()
+
+
+def _suggestions(questions: list[dict]) -> list[dict]:
+    return [
+        {
+            "question_id": q["id"],
+            "options": [
+                {"label": f"Option {n}", "value": f"value-{n}", "description": "d", "impact": "i"}
+                for n in (1, 2, 3)
+            ],
+            "recommended": 1,
+        }
+        for q in questions
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=6)
+    args = parser.parse_args()
+
+    rows: list[tuple[str, Counter[str]]] = []
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        (root / ".git").mkdir()
+        cwd = root.joinpath(*[f"d{n}" for n in range(args.depth)])
+        cwd.mkdir(parents=True, exist_ok=True)
+        os.chdir(cwd)
+        _instrument()
+
+        counts, out = _run(["creator", "next"])
+        rows.append(("creator next", counts))
+        nxt = json.loads(out)
+        suggest = json.dumps(
+            {"iteration_id": nxt["iteration_id"], "suggestions": _suggestions(nxt["questions"])}
+        )
+        counts, out = _run(["creator", "suggest", "--stdin"], suggest)
+        rows.append(("creator suggest", counts))
+        ask = json.loads(out)
+        answers = [{"question_id": q["id"], "selection": 1} for q in ask["questions"]]
+        apply = json.dumps({"ask_set_id": ask["ask_set_id"], "confirmed": True, "answers": answers})
+        counts, _ = _run(["creator", "apply", "--stdin"], apply)
+        rows.append(("creator apply", counts))
+        counts, _ = _run(["creator", "next"])
+        rows.append(("creator next (ready)", counts))
+        os.chdir(root)
+
+    columns = (*WRAPPED, "open")
+    print(f"{'command':22} " + " ".join(f"{c:>7}" for c in columns) + "   total")
+    for name, counts in rows:
+        total = sum(counts[c] for c in columns)
+        print(f"{name:22} " + " ".join(f"{counts[c]:>7}" for c in columns) + f" {total:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
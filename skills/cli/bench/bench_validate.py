@@ -0,0 +1,271 @@
+"""Microbenchmark: compiled schema validators vs the hand-rolled parsers.
+
+`legacy_*` below are verbatim copies of the imperative `require_*` parsers
+the creator schemas used before validators were compiled from the emitted
+JSON Schemas; they and the helpers live here only as the comparison baseline.
+
+Each pair is timed alternately `--repeat` times and the best run is kept,
+which damps noise from a busy machine.
+
+    PYTHONPATH=skills/cli/src python3 skills/cli/bench/bench_validate.py [--payloads N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from typing import Any
+
+from asi.creator.schemas import parse_apply_request, parse_suggestion_request
+
+
+def require_str(
+    data: dict[str, Any],
+    key: str,
+    *,
+    min_length: int | None = None,
+    max_length: int | None = None,
+    regex: str | None = None,
+    allow_missing: bool = False,
+) -> str | None:
+    if key not in data:
+        if allow_missing:
+            return None
+        raise ValueError(f"Missing required field: {key}")
+    val = data[key]
+    if not isinstance(val, str):
+        raise ValueError(f"Field '{key}' must be a string.")
+    if min_length is not None and len(val) < min_length:
+        raise ValueError(f"Field '{key}' must be at least {min_length} characters.")
+    if max_length is not None and len(val) > max_length:
+        raise ValueError(f"Field '{key}' must be at most {max_length} characters.")
+    if regex is not None and not re.match(regex, val):
+        raise ValueError(f"Field '{key}' does not match required pattern.")
+    return val
+
+
+def require_int(
+    data: dict[str, Any],
+    key: str,
+    *,
+    min_value: int | None = None,
+    max_value: int | None = None,
+    allow_missing: bool = False,
+) -> int | None:
+    if key not in data:
+        if allow_missing:
+            return None
+        raise ValueError(f"Missing required field: {key}")
+    val = data[key]
+    if not isinstance(val, int):
+        raise ValueError(f"Field '{key}' must be an integer.")
+    if min_value is not None and val < min_value:
+        raise ValueError(f"Field '{key}' must be >= {min_value}.")
+    if max_value is not None and val > max_value:
+        raise ValueError(f"Field '{key}' must be <= {max_value}.")
+    return val
+
+
+def require_bool(
+    data: dict[str, Any],
+    key: str,
+    *,
+    default: bool | None = None,
+    allow_missing: bool = False,
+) -> bool:
+    if key not in data:
+        if allow_missing:
+            return default if default is not None else False
+        raise ValueError(f"Missing required field: {key}")
+    val = data[key]
+    if not isinstance(val, bool):
+        raise ValueError(f"Field '{key}' must be a boolean.")
+    return val
+
+
+def require_list(
+    data: dict[str, Any],
+    key: str,
+    *,
+    min_length: int | None = None,
+    max_length: int | None = None,
+) -> list[Any]:
+    if key not in data:
+        raise ValueError(f"Missing required field: {key}")
+    val = data[key]
+    if not isinstance(val, list):
+        raise ValueError(f"Field '{key}' must be a list.")
+    if min_length is not None and len(val) < min_length:
+        raise ValueError(f"Field '{key}' must have at least {min_length} items.")
+    if max_length is not None and len(val) > max_length:
+        raise ValueError(f"Field '{key}' must have at most {max_length} items.")
+    return val
+
+
+def _require_object(item: Any, *, context: str) -> dict[str, Any]:
+    if not isinstance(item, dict):
+        raise ValueError(f"{context} must be an object.")
+    return item
+
+
+def legacy_suggestion_request(data: dict[str, Any]) -> dict[str, Any]:
+    iteration_id = require_str(data, "iteration_id", min_length=1, max_length=200)
+    suggestions = require_list(data, "suggestions", min_length=1, max_length=3)
+
+    parsed_suggestions: list[dict[str, Any]] = []
+    for i, item in enumerate(suggestions):
+        s = _require_object(item, context=f"suggestions[{i}]")
+        question_id = require_str(s, "question_id", min_length=1, max_length=120)
+        options = require_list(s, "options", min_length=3, max_length=3)
+        recommended = require_int(s, "recommended", min_value=1, max_value=3)
+
+        rationale = s.get("rationale", {})
+        if rationale is None:
+            rationale = {}
+        if not isinstance(rationale, dict):
+            raise ValueError(f"suggestions[{i}].rationale must be an object.")
+
+        parsed_options: list[dict[str, Any]] = []
+        for j, opt in enumerate(options):
+            o = _require_object(opt, context=f"suggestions[{i}].options[{j}]")
+            label = require_str(o, "label", min_length=1, max_length=80)
+            value = require_str(o, "value", min_length=1, max_length=200)
+            description = require_str(o, "description", min_length=1, max_length=180)
+            impact = require_str(o, "impact", min_length=1, max_length=180)
+            parsed_options.append(
+                {"label": label, "value": value, "description": description, "impact": impact}
+            )
+
+        parsed_suggestions.append(
+            {
+                "question_id": question_id,
+                "options": parsed_options,
+                "recommended": int(recommended) if recommended is not None else 1,
+                "rationale": rationale,
+            }
+        )
+
+    return {"iteration_id": iteration_id, "suggestions": parsed_suggestions}
+
+
+def legacy_apply_request(data: dict[str, Any]) -> dict[str, Any]:
+    ask_set_id = require_str(data, "ask_set_id", min_length=1, max_length=200)
+    confirmed = require_bool(data, "confirmed", default=False, allow_missing=True)
+    answers = require_list(data, "answers", min_length=1, max_length=3)
+    notes = require_str(data, "notes", min_length=1, max_length=2000, allow_missing=True)
+
+    parsed_answers: list[dict[str, Any]] = []
+    for i, item in enumerate(answers):
+        a = _require_object(item, context=f"answers[{i}]")
+        question_id = require_str(a, "question_id", min_length=1, max_length=120)
+        selection = require_int(a, "selection", min_value=1, max_value=4)
+
+        alternative_text = require_str(
+            a,
+            "alternative_text",
+            min_length=1,
+            max_length=500,
+            allow_missing=True,
+        )
+        answer_confirmed = require_bool(
+            a,
+            "user_confirmation",
+            default=False,
+            allow_missing=True,
+        )
+
+        if selection == 4 and not alternative_text:
+            raise ValueError("alternative_text is required when selection is 4.")
+
+        parsed_answers.append(
+            {
+                "question_id": question_id,
+                "selection": selection,
+                "alternative_text": alternative_text,
+                "user_confirmation": answer_confirmed,
+            }
+        )
+
+    out: dict[str, Any] = {
+        "ask_set_id": ask_set_id,
+        "confirmed": confirmed,
+        "answers": parsed_answers,
+    }
+    if notes:
+        out["notes"] = notes
+    return out
+
+
+def legacy_value_check(value: str, regex: str) -> None:
+    # The old per-option path imported re and matched an uncompiled pattern.
+    import re as _re
+
+    if not _re.match(regex, value):
+        raise ValueError("value does not match required pattern")
+
+
+def _suggest_payload(n: int) -> dict[str, Any]:
+    return {
+        "iteration_id": f"iter-{n}",
+        "suggestions": [
+            {
+                "question_id": f"q{q}",
+                "options": [
+                    {"label": f"L{k}", "value": f"v-{n}-{k}", "description": "d", "impact": "i"}
+                    for k in (1, 2, 3)
+                ],
+                "recommended": 1,
+            }
+            for q in range(3)
+        ],
+    }
+
+
+def _apply_payload(n: int) -> dict[str, Any]:
+    return {
+        "ask_set_id": f"ask-{n}",
+        "confirmed": True,
+        "answers": [{"question_id": f"q{q}", "selection": 1} for q in range(3)],
+    }
+
+
+def _time(fn, payloads: list[Any]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        fn(payload)
+    return (time.perf_counter() - start) / len(payloads) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payloads", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    suggest = [_suggest_payload(n) for n in range(args.payloads)]
+    apply = [_apply_payload(n) for n in range(args.payloads)]
+    values = [f"skill-{n}" for n in range(args.payloads)]
+    regex = r"^[a-z0-9][a-z0-9-]*$"
+    compiled = re.compile(regex)
+
+    pairs = [
+        ("suggest", legacy_suggestion_request, parse_suggestion_request, suggest),
+        ("apply", legacy_apply_request, parse_apply_request, apply),
+        ("value regex", lambda v: legacy_value_check(v, regex), compiled.match, values),
+    ]
+    rows = []
+    for name, legacy_fn, new_fn, payloads in pairs:
+        legacy = new = float("inf")
+        for _ in range(args.repeat):
+            legacy = min(legacy, _time(legacy_fn, payloads))
+            new = min(new, _time(new_fn, payloads))
+        rows.append((name, legacy, new))
+    print(f"{'payload':12} {'legacy us':>10} {'compiled us':>12} {'speedup':>8}")
+    for name, legacy, new in rows:
+        print(f"{name:12} {legacy:>10.2f} {new:>12.2f} {legacy / new:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,118 +1,400 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from pathlib import Path
+from collections.abc import Callable
+from typing import Any
 
 from asi import __version__
-from asi.commands import creator, doctor, onboard, skill
+from asi.util.codec import check_backend
+from asi.util.jsonio import OUTPUT_FORMATS, error_payload, project_fields, render
+
+
+def _emit(args: argparse.Namespace, result: dict[str, Any]) -> None:
+    """Print a command result in the requested --format, projected to --fields."""
+    if args.fields:
+        # Fields can be legitimately absent (e.g. a not_modified stub), so warn, don't fail.
+        absent = [name for name in args.fields if name not in result]
+        if absent:
+            print(f"warning: --fields not in this result: {', '.join(absent)}", file=sys.stderr)
+    print(render(project_fields(result, args.fields), args.format))
+
+
+def _print_json_error(
+    args: argparse.Namespace,
+    message: str,
+    schema_cmd: str | None = None,
+    errors: list[dict[str, str]] | None = None,
+) -> None:
+    # Errors are never projected: --fields names success fields.
+    print(render(error_payload(message, schema_cmd, errors), args.format))
+
+
+def _emit_schema(args: argparse.Namespace, kind: str) -> int:
+    """Serve a prebuilt schema without importing the command modules."""
+    from asi import schemas
+
+    fingerprint = schemas.fingerprint(kind)
+    if args.schema_if_changed == fingerprint:
+        _emit(args, {"not_modified": True, schemas.FINGERPRINT_KEY: fingerprint})
+    elif args.format == "pretty" and not args.fields and not schemas.needs_runtime_fields(kind):
+        sys.stdout.write(schemas.schema_text(kind))
+    else:
+        try:
+            schema = schemas.load_schema(kind)
+        except ValueError as exc:
+            # Runtime fields (the creator artifact model) need a valid storage backend.
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        _emit(args, schema)
+    return 0
 
 
-def _print_json_error(message: str, schema_cmd: str | None = None) -> None:
-    payload = {"error": message}
-    if schema_cmd:
-        payload["schema_cmd"] = schema_cmd
-    print(json.dumps(payload, indent=2))
+def _add_schema_if_changed(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--schema-if-changed",
+        metavar="FINGERPRINT",
+        help="Emit the schema only if its x-fingerprint differs (implies --schema)",
+    )
 
 
-def create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="asi",
-        description="ASI - Agent Skill Interface CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+def _token_budget(raw: str) -> int:
+    try:
+        budget = int(raw)
+    except ValueError:
+        budget = 0
+    if budget <= 0:
+        raise argparse.ArgumentTypeError("expected a positive number of tokens")
+    return budget
+
+
+def _field_list(raw: str) -> list[str]:
+    fields = [name.strip() for name in raw.split(",") if name.strip()]
+    if not fields:
+        raise argparse.ArgumentTypeError("expected comma-separated field names")
+    return fields
+
 
+def _add_doctor(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
-        "--version",
-        action="version",
-        version=f"asi {__version__}",
+        "--refresh", action="store_true", help="Re-probe tools instead of using the cache"
     )
+    parser.set_defaults(func=cmd_doctor)
 
-    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
-
-    # doctor
-    doctor_parser = subparsers.add_parser("doctor", help="Verify dependencies")
-    doctor_parser.set_defaults(func=cmd_doctor)
 
-    # skill init
-    skill_parser = subparsers.add_parser("skill", help="Skill utilities")
-    skill_sub = skill_parser.add_subparsers(dest="skill_cmd", metavar="<subcommand>")
+def _add_skill(parser: argparse.ArgumentParser) -> None:
+    skill_sub = parser.add_subparsers(dest="skill_cmd", metavar="<subcommand>")
     init_parser = skill_sub.add_parser("init", help="Emit concatenated references")
     init_parser.add_argument("--skill-dir", required=True)
+    init_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Read the reference files instead of the cached output ($ASI_CACHE_DIR)",
+    )
+    init_parser.add_argument(
+        "--budget",
+        type=_token_budget,
+        metavar="TOKENS",
+        help="Emit the reference index, then whole references while they fit; list the rest",
+    )
     init_parser.set_defaults(func=cmd_skill_init)
-
-    # onboard
-    onboard_parser = subparsers.add_parser("onboard", help="Onboard skill")
-    onboard_parser.add_argument("--schema", action="store_true")
-    onboard_sub = onboard_parser.add_subparsers(dest="onboard_cmd", metavar="<subcommand>")
+    index_parser = skill_sub.add_parser("index", help="Build and print the reference section index")
+    index_parser.add_argument("--skill-dir", required=True)
+    index_parser.set_defaults(func=cmd_skill_index)
+    section_parser = skill_sub.add_parser("section", help="Emit one reference section")
+    section_parser.add_argument("--skill-dir", required=True)
+    section_parser.add_argument("name", help="Section id (e.g. PROCEDURE/steps), or a unique title")
+    section_parser.set_defaults(func=cmd_skill_section)
+
+
+def _add_onboard(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--schema", action="store_true")
+    _add_schema_if_changed(parser)
+    onboard_sub = parser.add_subparsers(dest="onboard_cmd", metavar="<subcommand>")
     onboard_run = onboard_sub.add_parser("run", help="Run onboard via plan")
     onboard_run.add_argument("--stdin", action="store_true")
     onboard_run.set_defaults(func=cmd_onboard)
-    onboard_parser.set_defaults(func=cmd_onboard)
+    onboard_index = onboard_sub.add_parser(
+        "index", help="Build or update the repository file index"
+    )
+    onboard_index.add_argument(
+        "--jobs", type=int, default=8, help="Parallel file scans (default: 8)"
+    )
+    onboard_index.set_defaults(func=cmd_onboard_index)
+    onboard_query = onboard_sub.add_parser(
+        "query", help="Query the file index without touching the tree"
+    )
+    onboard_query.add_argument("--language", help="Only files of this language (e.g. python)")
+    onboard_query.add_argument(
+        "--glob", help="Only paths matching this glob (`**` spans directories)"
+    )
+    onboard_query.add_argument(
+        "--largest", type=int, metavar="N", help="The N largest matching files"
+    )
+    onboard_query.add_argument("--limit", type=int, metavar="N", help="Return at most N files")
+    onboard_query.set_defaults(func=cmd_onboard_query)
+    parser.set_defaults(func=cmd_onboard)
+
 
-    # creator
-    creator_parser = subparsers.add_parser("creator", help="Creator skill")
-    creator_parser.add_argument("--schema", action="store_true")
-    creator_sub = creator_parser.add_subparsers(dest="creator_cmd", metavar="<subcommand>")
+def _add_creator(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--schema", action="store_true")
+    _add_schema_if_changed(parser)
+    creator_sub = parser.add_subparsers(dest="creator_cmd", metavar="<subcommand>")
     creator_run = creator_sub.add_parser("run", help="Run creator via session goal")
     creator_run.add_argument("--stdin", action="store_true")
     creator_run.set_defaults(func=cmd_creator_run)
     creator_next = creator_sub.add_parser("next", help="Emit next questions")
+    creator_next.add_argument(
+        "--if-none-match", metavar="ETAG", help="Send only sections changed since this etag"
+    )
     creator_next.set_defaults(func=cmd_creator_next)
     creator_suggest = creator_sub.add_parser("suggest", help="Validate suggestions")
     creator_suggest.add_argument("--schema", action="store_true")
+    _add_schema_if_changed(creator_suggest)
     creator_suggest.add_argument("--stdin", action="store_true")
+    creator_suggest.add_argument(
+        "--all-errors", action="store_true", help="Report every violation, not just the first"
+    )
     creator_suggest.set_defaults(func=cmd_creator_suggest)
     creator_apply = creator_sub.add_parser("apply", help="Apply answers")
     creator_apply.add_argument("--schema", action="store_true")
+    _add_schema_if_changed(creator_apply)
     creator_apply.add_argument("--stdin", action="store_true")
+    creator_apply.add_argument(
+        "--all-errors", action="store_true", help="Report every violation, not just the first"
+    )
+    creator_apply.add_argument(
+        "--if-none-match",
+        metavar="ETAG",
+        help="Include the post-apply `next` sections changed since this etag",
+    )
     creator_apply.set_defaults(func=cmd_creator_apply)
     creator_migrate = creator_sub.add_parser("migrate", help="Migrate legacy artifacts")
     creator_migrate.add_argument("--from", dest="source", choices=["legacy"], required=True)
     creator_migrate.add_argument("--force", action="store_true")
+    creator_migrate.add_argument("--link", action="store_true", help="Hardlink instead of copying")
+    creator_migrate.add_argument(
+        "--jobs", type=int, default=8, help="Parallel copies (default: 8)"
+    )
+    creator_migrate.add_argument(
+        "--dry-run", action="store_true", help="Report the plan; write nothing"
+    )
+    creator_migrate.add_argument(
+        "--progress",
+        action="store_true",
+        help="Stream one NDJSON event per migrated file to stderr",
+    )
     creator_migrate.set_defaults(func=cmd_creator_migrate)
-    creator_parser.set_defaults(func=cmd_creator_root)
+    creator_receipt = creator_sub.add_parser("receipt", help="Show the receipt for an ask set")
+    creator_receipt.add_argument("--ask-set-id", required=True)
+    creator_receipt.set_defaults(func=cmd_creator_receipt)
+    creator_storage = creator_sub.add_parser("storage", help="Creator storage backend")
+    storage_sub = creator_storage.add_subparsers(dest="storage_cmd", metavar="<subcommand>")
+    storage_convert = storage_sub.add_parser("convert", help="Convert records to another backend")
+    storage_convert.add_argument("--to", dest="target", choices=["json", "sqlite"], required=True)
+    storage_convert.set_defaults(func=cmd_creator_storage_convert)
+    creator_gc = creator_sub.add_parser("gc", help="Collect unreferenced ask set snapshots")
+    creator_gc.add_argument("--keep-recent", type=int, default=0)
+    creator_gc.add_argument("--archive", action="store_true")
+    creator_gc.add_argument("--dry-run", action="store_true")
+    creator_gc.set_defaults(func=cmd_creator_gc)
+    parser.set_defaults(func=cmd_creator_root)
+
+
+def _add_serve(parser: argparse.ArgumentParser) -> None:
+    parser.set_defaults(func=cmd_serve)
+
+
+def _add_batch(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--stdin", action="store_true")
+    parser.add_argument("--continue-on-error", action="store_true")
+    parser.set_defaults(func=cmd_batch)
+
+
+# Top-level commands: name -> (help, sub-parser builder). Builders and the
+# command modules they dispatch to are only touched for the selected command.
+COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "doctor": ("Verify dependencies", _add_doctor),
+    "skill": ("Skill utilities", _add_skill),
+    "onboard": ("Onboard skill", _add_onboard),
+    "creator": ("Creator skill", _add_creator),
+    "serve": ("Answer newline-delimited JSON-RPC requests over stdio", _add_serve),
+    "batch": ("Run NDJSON operations in one process", _add_batch),
+}
+
+
+# Top-level long options, and whether each takes a value argument.
+_GLOBAL_OPTIONS = {"--help": False, "--version": False, "--format": True, "--fields": True}
+
+
+def _takes_value(arg: str) -> bool:
+    """Whether `arg` is a top-level option whose value is the next argument.
+
+    Abbreviations count, as argparse accepts any unambiguous prefix;
+    `--opt=value` carries its own value.
+    """
+    if not arg.startswith("--") or "=" in arg:
+        return False
+    if arg in _GLOBAL_OPTIONS:
+        return _GLOBAL_OPTIONS[arg]
+    matches = [name for name in _GLOBAL_OPTIONS if name.startswith(arg)]
+    return len(matches) == 1 and _GLOBAL_OPTIONS[matches[0]]
+
+
+def resolve_command(argv: list[str]) -> str | None:
+    """Return the top-level command named in argv, if any."""
+    args = iter(argv)
+    for arg in args:
+        if _takes_value(arg):
+            next(args, None)
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg if arg in COMMANDS else None
+    return None
+
+
+def create_parser(command: str | None = None, *, lazy: bool = False) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    With `lazy=True` only `command` gets its full sub-parser; every other
+    command is registered by name and help text alone.
+    """
+    parser = argparse.ArgumentParser(
+        prog="asi",
+        description="ASI - Agent Skill Interface CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"asi {__version__}",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="pretty",
+        help="JSON result layout: indented, one line, or NDJSON with one line per list item",
+    )
+    parser.add_argument(
+        "--fields",
+        type=_field_list,
+        help="Comma-separated top-level result fields to keep (e.g. status,iteration_id,questions)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    for name, (help_text, build) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if not lazy or name == command:
+            build(sub)
 
     return parser
 
 
-def cmd_doctor(_args: argparse.Namespace) -> int:
-    return doctor.cmd_doctor()
+def cmd_doctor(args: argparse.Namespace) -> int:
+    from asi.commands import doctor
+
+    result = doctor.run_doctor(refresh=args.refresh)
+    _emit(args, result)
+    return 0 if result["ok"] else 1
 
 
 def cmd_skill_init(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from asi.commands import skill
+
     skill_dir = Path(args.skill_dir).resolve()
-    skill.emit_references(skill_dir)
+    if args.budget:
+        skill.emit_budgeted(skill_dir, args.budget)
+    else:
+        skill.emit_references(skill_dir, use_cache=not args.no_cache)
+    return 0
+
+
+def cmd_skill_index(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from asi.commands import skill
+
+    _emit(args, skill.build_index(Path(args.skill_dir).resolve()))
+    return 0
+
+
+def cmd_skill_section(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from asi.commands import skill
+
+    try:
+        skill.emit_section(Path(args.skill_dir).resolve(), args.name)
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
     return 0
 
 
 def cmd_onboard(args: argparse.Namespace) -> int:
-    if args.schema:
-        print(json.dumps(onboard.emit_schema(), indent=2))
-        return 0
+    if args.schema or args.schema_if_changed:
+        return _emit_schema(args, "onboard")
+    from asi.commands import onboard
+
     if args.onboard_cmd != "run" or not args.stdin:
-        print("error: onboard requires `run --stdin` for plan input", file=sys.stderr)
+        print(
+            "error: onboard requires `run --stdin` for plan input (or `index`/`query`)",
+            file=sys.stderr,
+        )
         return 1
     raw = sys.stdin.read()
     try:
         result = onboard.cmd_run(raw)
     except ValueError as exc:
-        print(json.dumps({"error": str(exc)}, indent=2))
+        _print_json_error(args, str(exc))
+        return 1
+    _emit(args, result)
+    return 0
+
+
+def cmd_onboard_index(args: argparse.Namespace) -> int:
+    from asi.commands import onboard
+
+    try:
+        result = onboard.cmd_index(jobs=args.jobs)
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
         return 1
-    print(json.dumps(result, indent=2))
+    _emit(args, result)
+    return 0
+
+
+def cmd_onboard_query(args: argparse.Namespace) -> int:
+    from asi.commands import onboard
+
+    try:
+        result = onboard.cmd_query(
+            language=args.language, glob=args.glob, largest=args.largest, limit=args.limit
+        )
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
+    _emit(args, result)
     return 0
 
 
 def cmd_creator_root(args: argparse.Namespace) -> int:
-    if args.schema:
-        print(json.dumps(creator.emit_schema(), indent=2))
-        return 0
-    print("error: creator requires a subcommand (run|next|suggest|apply|migrate)", file=sys.stderr)
+    if args.schema or args.schema_if_changed:
+        return _emit_schema(args, "creator.run")
+    print(
+        "error: creator requires a subcommand (run|next|suggest|apply|migrate|receipt|storage|gc)",
+        file=sys.stderr,
+    )
     return 1
 
 
 def cmd_creator_run(args: argparse.Namespace) -> int:
+    from asi.commands import creator
+
     if not args.stdin:
         print("error: creator run requires --stdin", file=sys.stderr)
         return 1
@@ -120,49 +402,59 @@ def cmd_creator_run(args: argparse.Namespace) -> int:
     try:
         result = creator.cmd_run(raw)
     except ValueError as exc:
-        print(json.dumps({"error": str(exc)}, indent=2))
+        _print_json_error(args, str(exc))
         return 1
-    print(json.dumps(result, indent=2))
+    _emit(args, result)
     return 0
 
 
-def cmd_creator_next(_args: argparse.Namespace) -> int:
-    result = creator.cmd_next_json()
-    print(json.dumps(result, indent=2))
+def cmd_creator_next(args: argparse.Namespace) -> int:
+    from asi.commands import creator
+
+    result = creator.cmd_next_json(if_none_match=args.if_none_match)
+    _emit(args, result)
     return 0
 
 
 def cmd_creator_suggest(args: argparse.Namespace) -> int:
-    if args.schema:
-        print(json.dumps(creator.emit_suggest_schema(), indent=2))
-        return 0
+    if args.schema or args.schema_if_changed:
+        return _emit_schema(args, "creator.suggest")
+    from asi.commands import creator
+
     if not args.stdin:
         print("error: creator suggest requires --stdin", file=sys.stderr)
         return 1
     raw = sys.stdin.read()
     try:
-        result = creator.cmd_suggest_json(raw)
+        result = creator.cmd_suggest_json(raw, all_errors=args.all_errors)
     except ValueError as exc:
-        _print_json_error(str(exc), "asi creator suggest --schema")
+        _print_json_error(
+            args, str(exc), "asi creator suggest --schema", getattr(exc, "errors", None)
+        )
         return 1
-    print(json.dumps(result, indent=2))
+    _emit(args, result)
     return 0
 
 
 def cmd_creator_apply(args: argparse.Namespace) -> int:
-    if args.schema:
-        print(json.dumps(creator.emit_apply_schema(), indent=2))
-        return 0
+    if args.schema or args.schema_if_changed:
+        return _emit_schema(args, "creator.apply")
+    from asi.commands import creator
+
     if not args.stdin:
         print("error: creator apply requires --stdin", file=sys.stderr)
         return 1
     raw = sys.stdin.read()
     try:
-        result = creator.cmd_apply_json(raw)
+        result = creator.cmd_apply_json(
+            raw, all_errors=args.all_errors, if_none_match=args.if_none_match
+        )
     except ValueError as exc:
-        _print_json_error(str(exc), "asi creator apply --schema")
+        _print_json_error(
+            args, str(exc), "asi creator apply --schema", getattr(exc, "errors", None)
+        )
         return 1
-    print(json.dumps(result, indent=2))
+    _emit(args, result)
     return 0
 
 
@@ -171,13 +463,86 @@ def cmd_creator_migrate(args: argparse.Namespace) -> int:
         print("error: only legacy migration supported", file=sys.stderr)
         return 1
     from asi.creator.migrate import migrate_legacy
-    result = migrate_legacy(force=args.force)
-    print(json.dumps(result, indent=2))
+    from asi.util.codec import dumps
+
+    def progress(event: dict[str, Any]) -> None:
+        print(dumps(event), file=sys.stderr, flush=True)
+
+    try:
+        result = migrate_legacy(
+            force=args.force,
+            link=args.link,
+            jobs=args.jobs,
+            dry_run=args.dry_run,
+            progress=progress if args.progress else None,
+        )
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
+    _emit(args, result)
+    return 0
+
+
+def cmd_creator_receipt(args: argparse.Namespace) -> int:
+    from asi.creator.receipts import read_receipt
+
+    try:
+        receipt = read_receipt(args.ask_set_id)
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
+    if receipt is None:
+        _print_json_error(args, f"No receipt for ask_set_id: {args.ask_set_id}")
+        return 1
+    _emit(args, receipt)
+    return 0
+
+
+def cmd_creator_storage_convert(args: argparse.Namespace) -> int:
+    from asi.creator.state import convert_storage
+
+    try:
+        result = convert_storage(args.target)
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
+    _emit(args, result)
     return 0
 
 
+def cmd_creator_gc(args: argparse.Namespace) -> int:
+    from asi.creator.gc import collect_garbage
+
+    try:
+        result = collect_garbage(
+            keep_recent=args.keep_recent, archive=args.archive, dry_run=args.dry_run
+        )
+    except ValueError as exc:
+        _print_json_error(args, str(exc))
+        return 1
+    _emit(args, result)
+    return 0
+
+
+def cmd_serve(_args: argparse.Namespace) -> int:
+    from asi.commands import serve
+
+    return serve.serve()
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    from asi.commands import batch
+
+    if not args.stdin:
+        print("error: batch requires --stdin", file=sys.stderr)
+        return 1
+    return batch.run_batch(continue_on_error=args.continue_on_error)
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = create_parser(resolve_command(argv), lazy=True)
     args = parser.parse_args(argv)
 
     if args.command is None:
@@ -185,6 +550,17 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if hasattr(args, "func"):
+        try:
+            check_backend()
+            # Prebuilt schemas need no storage; _emit_schema checks the one that embeds it.
+            schema_only = getattr(args, "schema", False) or getattr(args, "schema_if_changed", None)
+            if args.command in ("creator", "serve", "batch") and not schema_only:
+                from asi.creator.model import check_storage_backend
+
+                check_storage_backend()
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
         return args.func(args)
 
     return 0
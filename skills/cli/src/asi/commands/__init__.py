@@ -1,21 +1,35 @@
-from asi.commands.creator import emit_schema as creator_schema
-from asi.commands.creator import cmd_apply_json as creator_apply
-from asi.commands.creator import cmd_next_json as creator_next
-from asi.commands.creator import cmd_run as creator_run
-from asi.commands.creator import cmd_suggest_json as creator_suggest
-from asi.commands.doctor import cmd_doctor
-from asi.commands.onboard import emit_schema as onboard_schema
-from asi.commands.onboard import cmd_run as onboard_run
-from asi.commands.skill import emit_references as skill_init
+from __future__ import annotations
 
-__all__ = [
-    "creator_apply",
-    "creator_next",
-    "creator_run",
-    "creator_schema",
-    "creator_suggest",
-    "cmd_doctor",
-    "onboard_run",
-    "onboard_schema",
-    "skill_init",
-]
+import importlib
+from typing import Any
+
+# Public name -> (module, attribute). Resolved on first access so importing one
+# command module does not drag in the others.
+_EXPORTS = {
+    "creator_apply": ("asi.commands.creator", "cmd_apply_json"),
+    "creator_next": ("asi.commands.creator", "cmd_next_json"),
+    "creator_run": ("asi.commands.creator", "cmd_run"),
+    "creator_schema": ("asi.commands.creator", "emit_schema"),
+    "creator_suggest": ("asi.commands.creator", "cmd_suggest_json"),
+    "cmd_doctor": ("asi.commands.doctor", "cmd_doctor"),
+    "onboard_index": ("asi.commands.onboard", "cmd_index"),
+    "onboard_query": ("asi.commands.onboard", "cmd_query"),
+    "onboard_run": ("asi.commands.onboard", "cmd_run"),
+    "onboard_schema": ("asi.commands.onboard", "emit_schema"),
+    "run_batch": ("asi.commands.batch", "run_batch"),
+    "serve_stdio": ("asi.commands.serve", "serve"),
+    "skill_index": ("asi.commands.skill", "build_index"),
+    "skill_init": ("asi.commands.skill", "emit_references"),
+    "skill_section": ("asi.commands.skill", "emit_section"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _EXPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
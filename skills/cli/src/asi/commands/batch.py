@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import copy
+import sys
+from typing import Any, TextIO
+
+from asi.commands.serve import METHODS
+from asi.creator.session import CreatorSession
+from asi.util.codec import JSONDecodeError, dumps, loads
+from asi.util.jsonio import error_payload
+
+
+class _Batch:
+    """Loads the creator session on first use and shares it across ops."""
+
+    def __init__(self) -> None:
+        self._session: CreatorSession | None = None
+
+    def session(self) -> CreatorSession:
+        if self._session is None:
+            self._session = CreatorSession.load()
+        return self._session
+
+    def flush(self) -> bool:
+        return self._session.flush() if self._session is not None else False
+
+    def snapshot(self) -> tuple[dict[str, Any], set[str]] | None:
+        if self._session is None:
+            return None
+        return copy.deepcopy(self._session.state), set(self._session.dirty)
+
+    def rollback(self, snapshot: tuple[dict[str, Any], set[str]] | None) -> None:
+        """Undo an op that raised partway through, so its leftovers are never flushed."""
+        if snapshot is None:
+            # The session was (being) loaded by the failed op; reload it next time.
+            self._session = None
+        else:
+            self._session.state, self._session.dirty = snapshot
+
+
+def _run_op(index: int, line: str, batch: _Batch) -> dict[str, Any]:
+    out: dict[str, Any] = {"index": index}
+    try:
+        item = loads(line)
+    except JSONDecodeError as exc:
+        return {**out, "ok": False, **error_payload(f"Invalid JSON: {exc}")}
+    if not isinstance(item, dict) or not isinstance(item.get("op"), str):
+        message = "Each line must be an object with a string op."
+        return {**out, "ok": False, **error_payload(message)}
+
+    op = item["op"]
+    out["op"] = op
+    if "id" in item:
+        out["id"] = item["id"]
+
+    if op == "checkpoint":
+        return {**out, "ok": True, "result": {"flushed": batch.flush()}}
+    if op not in METHODS:
+        return {**out, "ok": False, **error_payload(f"Unknown op: {op}")}
+
+    params = item.get("input", {})
+    if params is None:
+        params = {}
+    if not isinstance(params, dict):
+        return {**out, "ok": False, **error_payload("input must be an object.")}
+
+    handler, schema_cmd = METHODS[op]
+    uses_session = op.startswith("creator.") and op != "creator.schema"
+    snapshot = batch.snapshot() if uses_session else None
+    try:
+        result = handler(params, batch.session() if uses_session else None)
+    except ValueError as exc:
+        errors = getattr(exc, "errors", None)
+        return {**out, "ok": False, **error_payload(str(exc), schema_cmd, errors)}
+    except Exception as exc:  # noqa: BLE001 - reported as the op's result line, like any failure
+        if uses_session:
+            batch.rollback(snapshot)
+        message = str(exc) or type(exc).__name__
+        return {**out, "ok": False, **error_payload(f"Internal error: {message}")}
+    return {**out, "ok": True, "result": result}
+
+
+def run_batch(
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+    *,
+    continue_on_error: bool = False,
+) -> int:
+    """Run NDJSON ops (`{"op": ..., "input": {...}}`) in order, one result line each."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    batch = _Batch()
+    failed = False
+    index = 0
+    try:
+        for line in stdin:
+            line = line.strip()
+            if not line:
+                continue
+            result = _run_op(index, line, batch)
+            index += 1
+            stdout.write(dumps(result) + "\n")
+            if not result["ok"]:
+                failed = True
+                if not continue_on_error:
+                    break
+    finally:
+        # Ops already executed may have written ask sets/receipts; keep state in step.
+        batch.flush()
+        stdout.flush()
+    return 1 if failed else 0
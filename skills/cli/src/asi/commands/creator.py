@@ -1,54 +1,61 @@
 from __future__ import annotations
 
+from typing import Any
+
 from asi.creator.loop import cmd_apply, cmd_next, cmd_suggest
-from asi.creator.schemas import (
-    emit_creator_apply_schema,
-    emit_creator_run_schema,
-    emit_creator_schema,
-    emit_creator_suggest_schema,
-    parse_creator_run_plan,
-)
+from asi.creator.schemas import parse_creator_run_plan
+from asi.creator.session import CreatorSession
 from asi.creator.state import stable_hash
+from asi.schemas import load_schema
 
 
 def emit_schema(kind: str = "run") -> dict:
-    if kind == "run":
-        return emit_creator_schema()
-    if kind == "suggest":
-        return emit_creator_suggest_schema()
-    if kind == "apply":
-        return emit_creator_apply_schema()
-    raise ValueError("unknown schema kind")
+    if kind not in ("run", "suggest", "apply"):
+        raise ValueError("unknown schema kind")
+    return load_schema(f"creator.{kind}")
 
 
 def emit_run_schema() -> dict:
-    return emit_creator_run_schema()
+    return load_schema("creator.run")
 
 
 def emit_suggest_schema() -> dict:
-    return emit_creator_suggest_schema()
+    return load_schema("creator.suggest")
 
 
 def emit_apply_schema() -> dict:
-    return emit_creator_apply_schema()
+    return load_schema("creator.apply")
 
 
-def cmd_run(raw: str) -> dict:
+def cmd_run(raw: str | dict[str, Any], session: CreatorSession | None = None) -> dict:
     plan = parse_creator_run_plan(raw)
     # Run currently seeds the same interactive loop response as `next`.
-    result = cmd_next()
+    result = cmd_next(session)
     result["plan"] = plan
     result["run_id"] = stable_hash(plan)
     return result
 
 
-def cmd_next_json() -> dict:
-    return cmd_next()
+def cmd_next_json(
+    session: CreatorSession | None = None, *, if_none_match: str | None = None
+) -> dict:
+    return cmd_next(session, if_none_match=if_none_match)
 
 
-def cmd_suggest_json(raw: str) -> dict:
-    return cmd_suggest(raw)
+def cmd_suggest_json(
+    raw: str | dict[str, Any],
+    session: CreatorSession | None = None,
+    *,
+    all_errors: bool = False,
+) -> dict:
+    return cmd_suggest(raw, session, all_errors=all_errors)
 
 
-def cmd_apply_json(raw: str) -> dict:
-    return cmd_apply(raw)
+def cmd_apply_json(
+    raw: str | dict[str, Any],
+    session: CreatorSession | None = None,
+    *,
+    all_errors: bool = False,
+    if_none_match: str | None = None,
+) -> dict:
+    return cmd_apply(raw, session, all_errors=all_errors, if_none_match=if_none_match)
@@ -1,63 +1,189 @@
+"""`asi doctor`: which external tools are available, and at which version.
+
+Tools are probed concurrently (`shutil.which`, then `<tool> --version` with a
+per-probe timeout). Results are cached in `cache_dir("doctor")` under a key
+built from $PATH and the mtime of every $PATH directory, and each cached
+binary's size and mtime are checked on reuse. A warm `asi doctor` is
+therefore a handful of stats until a tool is installed, removed or upgraded.
+"""
 from __future__ import annotations
 
-import json
+import os
+import re
 import shutil
+import signal
+import time
+from pathlib import Path
 from typing import Any
 
+from asi.util.cache import cache_dir
+from asi.util.codec import JSONDecodeError, codec, dumps, loads
+from asi.util.hashing import canonical_hash
+
 
 REQUIRED_TOOLS = {
     "git": {
         "name": "git",
         "install": "https://git-scm.com/downloads",
+        "version_args": ["--version"],
     },
     "jq": {
         "name": "jq",
         "install": "https://jqlang.github.io/jq/download/",
         "optional": True,
+        "version_args": ["--version"],
     },
 }
 
+CACHE_VERSION = 1
+PROBE_TIMEOUT_S = 2.0
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)+")
 
-def check_tool(name: str) -> dict[str, Any]:
-    path = shutil.which(name)
-    info = REQUIRED_TOOLS.get(name, {"name": name, "install": "Unknown"})
 
-    if not path:
-        return {
-            "name": name,
-            "available": False,
-            "path": None,
-            "install": info["install"],
-            "optional": info.get("optional", False),
-        }
+def _probe_version(path: str, args: list[str], timeout: float) -> dict[str, Any]:
+    import subprocess
 
-    return {
+    try:
+        # Own session, so a timeout can kill anything the tool spawned that
+        # would otherwise hold our pipes open.
+        proc = subprocess.Popen(
+            [path, *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            start_new_session=True,
+        )
+    except OSError as exc:
+        return {"version": None, "version_text": None, "error": str(exc)}
+    try:
+        out, err = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+        proc.communicate()
+        error = f"--version timed out after {timeout}s"
+        return {"version": None, "version_text": None, "error": error}
+    lines = (out or err).strip().splitlines()
+    text = lines[0].strip() if lines else ""
+    match = _VERSION_RE.search(text)
+    return {"version": match.group(0) if match else None, "version_text": text or None}
+
+
+def check_tool(name: str, *, timeout: float | None = None) -> dict[str, Any]:
+    """Presence, version and probe time of one tool; `timeout` defaults to PROBE_TIMEOUT_S."""
+    start = time.perf_counter()
+    path = shutil.which(name)
+    info = REQUIRED_TOOLS.get(name, {"name": name, "install": "Unknown"})
+    result: dict[str, Any] = {
         "name": name,
-        "available": True,
+        "available": bool(path),
         "path": path,
+        "version": None,
+        "version_text": None,
         "install": info["install"],
         "optional": info.get("optional", False),
     }
+    if path and info.get("version_args"):
+        result.update(_probe_version(path, info["version_args"], timeout or PROBE_TIMEOUT_S))
+    result["probe_ms"] = round((time.perf_counter() - start) * 1e3, 3)
+    return result
+
+
+def _environment_key() -> str:
+    """$PATH plus each of its directories' mtimes: tools appearing or vanishing change it."""
+    dirs = []
+    for entry in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            dirs.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            dirs.append([entry, None])
+    return canonical_hash([CACHE_VERSION, sorted(REQUIRED_TOOLS), dirs])
+
+
+def _binary_stamp(path: str | None) -> list[int] | None:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def cache_path() -> Path:
+    return cache_dir("doctor") / "tools.json"
+
+
+def _cached_tools(key: str) -> dict[str, Any] | None:
+    try:
+        cached = loads(cache_path().read_bytes())
+    except (OSError, JSONDecodeError):
+        return None
+    if cached.get("key") != key:
+        return None
+    for name, stamp in cached.get("binaries", {}).items():
+        if _binary_stamp(cached["tools"][name]["path"]) != stamp:
+            return None
+    return cached["tools"]
+
+
+def _store_tools(key: str, tools: dict[str, Any]) -> None:
+    path = cache_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    data = {
+        "key": key,
+        "binaries": {name: _binary_stamp(check["path"]) for name, check in tools.items()},
+        "tools": tools,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unsorted: a cache hit returns tool fields in the same order as a probe.
+        tmp.write_text(dumps(data, indent=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # A cache only: failing to write it costs the next run a re-probe.
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def probe_tools(*, timeout: float | None = None) -> dict[str, Any]:
+    """check_tool for every REQUIRED_TOOLS entry, run concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
 
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_TOOLS)) as pool:
+        checks = list(pool.map(lambda name: check_tool(name, timeout=timeout), REQUIRED_TOOLS))
+    return {check["name"]: check for check in checks}
 
-def run_doctor() -> dict[str, Any]:
-    results: dict[str, Any] = {}
-    all_ok = True
 
-    for tool in REQUIRED_TOOLS:
-        check = check_tool(tool)
-        results[tool] = check
-        if not check["available"] and not check.get("optional", False):
-            all_ok = False
+def run_doctor(*, refresh: bool = False) -> dict[str, Any]:
+    """Tool report; `refresh` ignores the probe cache (and rewrites it)."""
+    key = _environment_key()
+    tools = None if refresh else _cached_tools(key)
+    cached = tools is not None
+    if tools is None:
+        tools = probe_tools()
+        # A probe that failed or timed out says nothing stable about the tool.
+        if not any("error" in check for check in tools.values()):
+            _store_tools(key, tools)
 
+    all_ok = all(check["available"] or check.get("optional", False) for check in tools.values())
     return {
         "ok": all_ok,
-        "tools": results,
+        "tools": tools,
+        "cached": cached,
+        "json_backend": codec().name,
         "message": "All required dependencies available" if all_ok else "Missing dependencies",
     }
 
 
 def cmd_doctor() -> int:
+    """Print the doctor report as indented JSON; exit status 1 when a required tool is missing."""
     result = run_doctor()
-    print(json.dumps(result, indent=2))
+    print(dumps(result, indent=True))
     return 0 if result["ok"] else 1
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from typing import Any
+
+from asi.onboard.index import query_index, update_index
 from asi.onboard.runner import run_plan
-from asi.onboard.schemas import emit_onboard_schema
+from asi.schemas import load_schema
 
 
 def emit_schema() -> dict:
-    return emit_onboard_schema()
+    return load_schema("onboard")
 
 
-def cmd_run(raw: str) -> dict:
+def cmd_run(raw: str | dict[str, Any]) -> dict:
     return run_plan(raw)
+
+
+def cmd_index(*, jobs: int = 8) -> dict:
+    return update_index(jobs=jobs)
+
+
+def cmd_query(**filters: Any) -> dict:
+    return query_index(**filters)
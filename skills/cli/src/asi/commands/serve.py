@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from asi.commands import creator, doctor, onboard
+from asi.creator.model import forget_creator_config
+from asi.creator.session import CreatorSession
+from asi.creator.state import state_stamp
+from asi.util.codec import JSONDecodeError, dumps, loads
+from asi.util.jsonio import error_payload
+
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+COMMAND_ERROR = -32000
+
+
+def _creator_schema(params: dict[str, Any], _session: CreatorSession | None) -> dict:
+    return creator.emit_schema(params.get("kind", "run"))
+
+
+def _if_none_match(params: dict[str, Any]) -> str | None:
+    token = params.get("if_none_match")
+    if token is not None and not isinstance(token, str):
+        raise ValueError("if_none_match must be a string.")
+    return token
+
+
+def _creator_next(params: dict[str, Any], session: CreatorSession | None) -> dict:
+    return creator.cmd_next_json(session, if_none_match=_if_none_match(params))
+
+
+def _creator_apply(params: dict[str, Any], session: CreatorSession | None) -> dict:
+    # if_none_match rides alongside the apply input but is not part of it.
+    token = _if_none_match(params)
+    request = {k: v for k, v in params.items() if k != "if_none_match"}
+    return creator.cmd_apply_json(request, session, if_none_match=token)
+
+
+# Handlers take (params, session): the creator session the caller keeps and
+# flushes, or None for handlers that do not use one.
+METHODS: dict[
+    str, tuple[Callable[[dict[str, Any], CreatorSession | None], Any], str | None]
+] = {
+    "creator.schema": (_creator_schema, None),
+    "creator.run": (creator.cmd_run, None),
+    "creator.next": (_creator_next, None),
+    "creator.suggest": (creator.cmd_suggest_json, "asi creator suggest --schema"),
+    "creator.apply": (_creator_apply, "asi creator apply --schema"),
+    "onboard.schema": (lambda _p, _s: onboard.emit_schema(), None),
+    "onboard.run": (lambda p, _s: onboard.cmd_run(p), None),
+    "doctor": (lambda p, _s: doctor.run_doctor(refresh=bool(p.get("refresh"))), None),
+}
+
+
+def _error(req_id: Any, code: int, message: str, data: Any = None) -> dict[str, Any]:
+    err: dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        err["data"] = data
+    return {"jsonrpc": "2.0", "id": req_id, "error": err}
+
+
+class _Server:
+    """Keeps one creator session for the life of the server.
+
+    The session is reloaded only when the state on disk changed since it was
+    loaded or last flushed, e.g. by a CLI run between two requests.
+    """
+
+    def __init__(self) -> None:
+        self._session: CreatorSession | None = None
+        self._stamp: tuple[Any, ...] | None = None
+
+    def session(self) -> CreatorSession:
+        if self._session is None or state_stamp() != self._stamp:
+            # The config may have changed too (e.g. a storage conversion); the
+            # new stamp is taken before loading, so a racing write reloads again.
+            forget_creator_config()
+            self._stamp = state_stamp()
+            self._session = CreatorSession.load()
+        return self._session
+
+    def flush(self) -> None:
+        if self._session is not None and self._session.flush():
+            self._stamp = state_stamp()
+
+    def discard(self) -> None:
+        """Drop the session after a failed request; its leftovers are never flushed."""
+        self._session = None
+
+
+def handle_request(request: Any, server: _Server | None = None) -> dict[str, Any] | None:
+    """Handle one decoded JSON-RPC 2.0 request; returns None for notifications.
+
+    Without a `server`, creator methods load and flush a session of their own.
+    """
+    if server is None:
+        server = _Server()
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _error(None, INVALID_REQUEST, "Request must be an object with a string method.")
+
+    req_id = request.get("id")
+    method = request["method"]
+    params = request.get("params", {})
+    if params is None:
+        params = {}
+
+    if method == "shutdown":
+        response = {"jsonrpc": "2.0", "id": req_id, "result": None}
+    elif method not in METHODS:
+        response = _error(req_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+    elif not isinstance(params, dict):
+        response = _error(req_id, INVALID_PARAMS, "params must be an object.")
+    else:
+        handler, schema_cmd = METHODS[method]
+        uses_session = method.startswith("creator.") and method != "creator.schema"
+        try:
+            result = handler(params, server.session() if uses_session else None)
+            if uses_session:
+                server.flush()
+        except ValueError as exc:
+            if uses_session:
+                server.discard()
+            payload = error_payload(str(exc), schema_cmd, getattr(exc, "errors", None))
+            response = _error(req_id, COMMAND_ERROR, str(exc), payload)
+        except Exception as exc:  # noqa: BLE001 - the worker outlives any one request
+            if uses_session:
+                server.discard()
+            # A bug or corrupt state fails this request only; the worker keeps serving.
+            message = str(exc) or type(exc).__name__
+            response = _error(
+                req_id, INTERNAL_ERROR, f"Internal error: {message}", error_payload(message)
+            )
+        else:
+            response = {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    return None if "id" not in request else response
+
+
+def serve(stdin: TextIO | None = None, stdout: TextIO | None = None) -> int:
+    """Answer newline-delimited JSON-RPC requests until EOF or `shutdown`."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    server = _Server()
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = loads(line)
+        except JSONDecodeError as exc:
+            request = None
+            response = _error(None, PARSE_ERROR, f"Invalid JSON: {exc}")
+        else:
+            response = handle_request(request, server)
+        if response is not None:
+            stdout.write(dumps(response) + "\n")
+            stdout.flush()
+        if isinstance(request, dict) and request.get("method") == "shutdown":
+            break
+    return 0
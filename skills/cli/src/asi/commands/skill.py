@@ -1,33 +1,179 @@
+"""`asi skill init`: a skill's numbered reference files as one document.
+
+`asi skill index` and `asi skill section` expose the reference index so a
+single section can be fetched when it is needed.
+
+Output is written as bytes and cached under `cache_dir("skill-init")`, one
+file per skill directory whose first line stamps the (name, size, mtime) of
+every reference; an unchanged skill is served by copying that file to stdout.
+With a token budget, the output is planned from the reference index instead.
+"""
 from __future__ import annotations
 
+import os
+import shutil
+import sys
 from pathlib import Path
+from typing import Any, BinaryIO
 
+from asi.skill.index import (
+    estimate_tokens,
+    index_path,
+    load_index,
+    read_description,
+    read_section,
+    reference_files,
+)
+from asi.util.cache import cache_dir
+from asi.util.hashing import canonical_hash
 
-def _read_description(path: Path) -> str:
-    for line in path.read_text(encoding="utf-8").splitlines()[:20]:
-        if line.startswith("description:"):
-            return line.split("description:", 1)[1].strip()
-    return ""
 
+CACHE_VERSION = "s1"
 
-def emit_references(skill_dir: Path) -> None:
-    refs_dir = skill_dir / "references"
-    files = sorted(refs_dir.glob("[0-9][0-9]_*.md"))
-    files = [f for f in files if f.name != "00_ROUTER.md"]
 
-    print("# References")
-    print("")
+def _render(files: list[Path], out: BinaryIO) -> None:
+    out.write(b"# References\n\n")
     for idx, f in enumerate(files, start=1):
         name = f.stem.split("_", 1)[-1]
-        desc = _read_description(f)
-        if desc:
-            print(f"{idx}. **{name}** — {desc}")
-        else:
-            print(f"{idx}. **{name}**")
-    print("")
-    print("---")
-    print("")
+        desc = read_description(f)
+        entry = f"{idx}. **{name}** — {desc}" if desc else f"{idx}. **{name}**"
+        out.write(entry.encode("utf-8") + b"\n")
+    out.write(b"\n---\n\n")
+    for f in files:
+        with f.open("rb") as src:
+            shutil.copyfileobj(src, out)
+        out.write(b"\n\n")
+
 
+def _stamp(skill_dir: Path, files: list[Path]) -> bytes:
+    stats = []
     for f in files:
-        print(f.read_text(encoding="utf-8"))
-        print("")
+        st = f.stat()
+        stats.append([f.name, st.st_size, st.st_mtime_ns])
+    return f"{CACHE_VERSION}:{canonical_hash([str(skill_dir), stats])}\n".encode("ascii")
+
+
+def _serve_cached(entry: Path, stamp: bytes, out: BinaryIO) -> bool:
+    try:
+        handle = entry.open("rb")
+    except OSError:
+        return False
+    with handle:
+        if handle.readline() != stamp:
+            return False
+        shutil.copyfileobj(handle, out)
+    return True
+
+
+def _store(entry: Path, stamp: bytes, files: list[Path]) -> bool:
+    tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as handle:
+            handle.write(stamp)
+            _render(files, handle)
+        os.replace(tmp, entry)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def emit_references(
+    skill_dir: Path, *, use_cache: bool = True, out: BinaryIO | None = None
+) -> None:
+    stream = out if out is not None else sys.stdout.buffer
+    files = reference_files(skill_dir)
+    if use_cache:
+        stamp = _stamp(skill_dir, files)
+        entry = cache_dir("skill-init") / f"{canonical_hash(str(skill_dir))[:24]}.md"
+        if _serve_cached(entry, stamp, stream) or (
+            _store(entry, stamp, files) and _serve_cached(entry, stamp, stream)
+        ):
+            stream.flush()
+            return
+    _render(files, stream)
+    stream.flush()
+
+
+def _cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+def emit_budgeted(skill_dir: Path, budget: int, *, out: BinaryIO | None = None) -> None:
+    """Index table, then whole references in router order while they fit `budget` tokens.
+
+    The table and the included references count against the budget; references
+    after the first one that does not fit are listed as omitted with their
+    paths and estimates, to be read on demand.
+    """
+    stream = out if out is not None else sys.stdout.buffer
+    entries = load_index(skill_dir)
+    table = ["# References", "", "| # | Reference | ~Tokens | Description |", "|---|---|---|---|"]
+    for idx, entry in enumerate(entries, start=1):
+        description = _cell(entry["description"])
+        table.append(f"| {idx} | {entry['name']} | {entry['tokens']} | {description} |")
+    head = ("\n".join(table) + "\n\n---\n\n").encode("utf-8")
+
+    used = estimate_tokens(len(head))
+    included = 0
+    for entry in entries:
+        cost = estimate_tokens(entry["size"] + 2)
+        if used + cost > budget:
+            break
+        used += cost
+        included += 1
+
+    stream.write(head)
+    refs_dir = skill_dir / "references"
+    for entry in entries[:included]:
+        with (refs_dir / entry["file"]).open("rb") as src:
+            shutil.copyfileobj(src, stream)
+        stream.write(b"\n\n")
+    omitted = entries[included:]
+    summary = (
+        f"Budget: {budget} tokens; {included} of {len(entries)} references included"
+        f" (~{used} tokens).\n"
+    )
+    if omitted:
+        lines = [
+            "---",
+            "",
+            "# Omitted References",
+            "",
+            summary.rstrip("\n"),
+            f"Fetch one section with `asi skill section --skill-dir {skill_dir} <id>`;"
+            " ids: `asi skill index`.",
+            "",
+        ]
+        for entry in omitted:
+            line = (
+                f"- **{entry['name']}** (`references/{entry['file']}`, ~{entry['tokens']} tokens)"
+            )
+            lines.append(f"{line} — {entry['description']}" if entry["description"] else line)
+        stream.write(("\n".join(lines) + "\n").encode("utf-8"))
+    else:
+        stream.write(summary.encode("utf-8"))
+    stream.flush()
+
+
+def build_index(skill_dir: Path) -> dict[str, Any]:
+    """Reference index (rebuilt where stale) with section ids, offsets and estimates."""
+    references = [
+        {key: value for key, value in entry.items() if key not in ("size", "mtime_ns")}
+        for entry in load_index(skill_dir)
+    ]
+    return {
+        "skill_dir": str(skill_dir),
+        "index": str(index_path(skill_dir)),
+        "references": references,
+    }
+
+
+def emit_section(skill_dir: Path, name: str, *, out: BinaryIO | None = None) -> None:
+    stream = out if out is not None else sys.stdout.buffer
+    stream.write(read_section(skill_dir, name))
+    stream.flush()
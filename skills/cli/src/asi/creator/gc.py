@@ -0,0 +1,84 @@
+"""Garbage collection for content-addressed ask set snapshots.
+
+An ask set is live while anything still points at it: the in-flight ask set
+or a decision in state, a receipt, or a decision log event. Everything else
+(typically suggestions that were retried and never applied) is collectable.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from asi.creator.state import creator_root, get_storage
+from asi.creator.storage import Storage
+from asi.util.codec import dumps, loads
+from asi.util.paths import ensure_dir
+
+
+def referenced_ask_set_ids(storage: Storage) -> set[str]:
+    refs: set[str] = set()
+    state = storage.read_state() or {}
+    last = state.get("last_ask_set")
+    if isinstance(last, dict) and last.get("ask_set_id"):
+        refs.add(str(last["ask_set_id"]))
+    for decision in (state.get("decisions") or {}).values():
+        if isinstance(decision, dict) and decision.get("ask_set_id"):
+            refs.add(str(decision["ask_set_id"]))
+    for _, text in storage.iter_receipts():
+        ask_set_id = loads(text).get("ask_set_id")
+        if ask_set_id:
+            refs.add(str(ask_set_id))
+    for line in storage.decision_lines():
+        ask_set_id = loads(line).get("ask_set_id")
+        if ask_set_id:
+            refs.add(str(ask_set_id))
+    return refs
+
+
+def archive_path() -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return creator_root() / "archive" / f"ask_sets-{stamp}.jsonl"
+
+
+def collect_garbage(
+    *,
+    keep_recent: int = 0,
+    archive: bool = False,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Remove (or archive, then remove) unreferenced ask set snapshots.
+
+    `keep_recent` retains that many of the most recently written unreferenced
+    snapshots, so a suggestion awaiting a retry is not collected from under it.
+    """
+    if keep_recent < 0:
+        raise ValueError("--keep-recent must be >= 0.")
+    storage = get_storage()
+    stored = storage.ask_set_ids()
+    refs = referenced_ask_set_ids(storage)
+    unreferenced = [ask_set_id for ask_set_id in stored if ask_set_id not in refs]
+    collectable = unreferenced[: max(len(unreferenced) - keep_recent, 0)]
+
+    archived_to = ""
+    if collectable and not dry_run:
+        if archive:
+            path = archive_path()
+            ensure_dir(path.parent)
+            with path.open("w", encoding="utf-8") as handle:
+                for ask_set_id in collectable:
+                    text = storage.ask_set_text(ask_set_id)
+                    if text is not None:
+                        handle.write(dumps(loads(text), sort_keys=True) + "\n")
+            archived_to = str(path)
+        storage.remove_ask_sets(collectable)
+
+    return {
+        "status": "dry_run" if dry_run else "ok",
+        "scanned": len(stored),
+        "referenced": len(stored) - len(unreferenced),
+        "retained": len(unreferenced) - len(collectable),
+        "collected": collectable,
+        "mode": "archive" if archive else "delete",
+        "archived_to": archived_to,
+    }
@@ -1,66 +1,98 @@
 from __future__ import annotations
 
-import hashlib
-import json
+import re
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+from asi.creator.model import artifact_model
 from asi.creator.questions import missing_decision_ids, question_skeletons
+from asi.creator.receipts import encode_receipt
 from asi.creator.schemas import parse_apply_request, parse_suggestion_request
+from asi.creator.session import CreatorSession
 from asi.creator.state import (
+    advance_decision_log_ref,
     append_decision_event,
-    artifact_model,
-    legacy_warnings,
-    load_state,
-    save_state,
     stable_hash,
     write_ask_set_snapshot,
     write_receipt,
 )
+from asi.util.hashing import canonical_hash, freeze
+from asi.util.validate import ErrorCollector
 
 
 def _hash_value(value: Any) -> str:
-    raw = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    return canonical_hash(value, default=str)
 
 
-def _validate_value(question: dict[str, Any], value: str) -> None:
-    kind = question.get("answer_kind")
-    constraints = question.get("value_constraints", {}) or {}
+@lru_cache(maxsize=None)
+def _iteration_id(question_ids: tuple[str, ...]) -> str:
+    # Question ids come from QUESTION_DEFS, so there are only a handful of keys.
+    return stable_hash({"questions": list(question_ids)})
 
-    if not isinstance(value, str) or not value:
-        raise ValueError("Option value must be a non-empty string.")
 
+def _compile_value_check(kind: str, constraints: dict[str, Any]) -> Callable[[str], None]:
     min_len = constraints.get("min_length")
     max_len = constraints.get("max_length")
-    if min_len is not None and len(value) < int(min_len):
-        raise ValueError(f"value is shorter than min_length {min_len}")
-    if max_len is not None and len(value) > int(max_len):
-        raise ValueError(f"value exceeds max_length {max_len}")
+
+    def check_length(value: str) -> None:
+        if min_len is not None and len(value) < int(min_len):
+            raise ValueError(f"value is shorter than min_length {min_len}")
+        if max_len is not None and len(value) > int(max_len):
+            raise ValueError(f"value exceeds max_length {max_len}")
 
     if kind == "string":
         regex = constraints.get("regex")
-        if regex:
-            import re
-            if not re.match(regex, value):
+        pattern = re.compile(regex) if regex else None
+
+        def check_string(value: str) -> None:
+            check_length(value)
+            if pattern is not None and not pattern.match(value):
                 raise ValueError("value does not match required pattern")
-        return
+
+        return check_string
 
     if kind == "path_repo_relative":
-        must_not_start_with = constraints.get("must_not_start_with", [])
-        for prefix in must_not_start_with:
-            if value.startswith(prefix):
-                raise ValueError(f"value must not start with '{prefix}'")
-        must_not_contain = constraints.get("must_not_contain", [])
-        for token in must_not_contain:
-            if token in value:
-                raise ValueError(f"value must not contain '{token}'")
-        # Basic Windows absolute path guard.
-        if len(value) >= 2 and value[1] == ":":
-            raise ValueError("value must be repo-relative, not an absolute drive path")
-        return
-
-    raise ValueError(f"Unknown answer_kind: {kind}")
+        must_not_start_with = tuple(constraints.get("must_not_start_with", []))
+        must_not_contain = tuple(constraints.get("must_not_contain", []))
+
+        def check_path(value: str) -> None:
+            check_length(value)
+            for prefix in must_not_start_with:
+                if value.startswith(prefix):
+                    raise ValueError(f"value must not start with '{prefix}'")
+            for token in must_not_contain:
+                if token in value:
+                    raise ValueError(f"value must not contain '{token}'")
+            # Basic Windows absolute path guard.
+            if len(value) >= 2 and value[1] == ":":
+                raise ValueError("value must be repo-relative, not an absolute drive path")
+
+        return check_path
+
+    def check_unknown(value: str) -> None:
+        check_length(value)
+        raise ValueError(f"Unknown answer_kind: {kind}")
+
+    return check_unknown
+
+
+# (answer_kind, canonical constraints JSON) -> compiled check. Ask sets carry
+# their questions' constraints, so the key is the constraints themselves.
+_VALUE_CHECKS: dict[tuple[Any, str], Callable[[str], None]] = {}
+
+
+def _validate_value(question: dict[str, Any], value: str) -> None:
+    if not isinstance(value, str) or not value:
+        raise ValueError("Option value must be a non-empty string.")
+    kind = question.get("answer_kind")
+    constraints = question.get("value_constraints", {}) or {}
+    key = (kind, canonical_hash(constraints))
+    check = _VALUE_CHECKS.get(key)
+    if check is None:
+        check = _VALUE_CHECKS[key] = _compile_value_check(kind, constraints)
+    check(value)
 
 
 def build_reflection(decisions: dict[str, Any]) -> dict[str, Any]:
@@ -77,56 +109,162 @@ def build_reflection(decisions: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def cmd_next() -> dict[str, Any]:
-    state = load_state()
-    decisions = state.get("decisions", {})
+_SCHEMA_POINTERS = freeze(
+    {
+        "suggest": "asi creator suggest --schema",
+        "apply": "asi creator apply --schema",
+    }
+)
+_REQUIREMENTS = freeze(
+    {
+        "max_questions": 3,
+        "options_per_question": 4,
+        "recommended_option_range": [1, 3],
+        "option_4_label": "Respond with an alternative",
+    }
+)
+
+# `next` sections covered by its etag, in token order. `status` is always sent.
+NEXT_SECTIONS = (
+    "iteration_id",
+    "artifact_model",
+    "schemas",
+    "warnings",
+    "questions",
+    "reflection",
+    "requirements",
+)
+_ETAG_VERSION = "n1"
+_SECTION_TAG_CHARS = 10
+
+
+def _next_payload(session: CreatorSession) -> dict[str, Any]:
+    decisions = session.decisions
     questions = question_skeletons(decisions)
-    iteration_id = stable_hash({"questions": [q["id"] for q in questions]})
+    iteration_id = _iteration_id(tuple(q["id"] for q in questions))
 
     status = "need_suggestions" if questions else "ready"
     return {
         "status": status,
         "iteration_id": iteration_id,
         "artifact_model": artifact_model(),
-        "schemas": {
-            "suggest": "asi creator suggest --schema",
-            "apply": "asi creator apply --schema",
-        },
-        "warnings": legacy_warnings(),
+        "schemas": _SCHEMA_POINTERS,
+        "warnings": session.warnings(),
         "questions": questions,
         "reflection": build_reflection(decisions),
-        "requirements": {
-            "max_questions": 3,
-            "options_per_question": 4,
-            "recommended_option_range": [1, 3],
-            "option_4_label": "Respond with an alternative",
-        },
+        "requirements": _REQUIREMENTS,
     }
 
 
-def cmd_suggest(raw: str) -> dict[str, Any]:
-    request = parse_suggestion_request(raw)
-
-    expected = cmd_next()
+def _versioned(payload: dict[str, Any], if_none_match: str | None) -> dict[str, Any]:
+    """Add the etag; against a client's etag, send only the sections that changed.
+
+    The etag is the version prefix plus a short hash per NEXT_SECTIONS entry,
+    so the sections a client already holds can be told apart without any
+    server-side record of what was sent. Unrecognized tokens get everything.
+    """
+    tags = [canonical_hash(payload[name])[:_SECTION_TAG_CHARS] for name in NEXT_SECTIONS]
+    etag = ".".join([_ETAG_VERSION, *tags])
+    held = if_none_match.split(".") if if_none_match else []
+    if len(held) != len(tags) + 1 or held[0] != _ETAG_VERSION:
+        return {**payload, "etag": etag}
+    unchanged = [name for name, tag, old in zip(NEXT_SECTIONS, tags, held[1:]) if tag == old]
+    if len(unchanged) == len(NEXT_SECTIONS):
+        return {"status": payload["status"], "etag": etag, "not_modified": True}
+    delta = {name: payload[name] for name in NEXT_SECTIONS if name not in unchanged}
+    return {"status": payload["status"], "etag": etag, **delta, "unchanged": unchanged}
+
+
+def cmd_next(
+    session: CreatorSession | None = None, *, if_none_match: str | None = None
+) -> dict[str, Any]:
+    """Open questions and session context, with an `etag` for `if_none_match`."""
+    if session is None:
+        session = CreatorSession.load()
+    return _versioned(_next_payload(session), if_none_match)
+
+
+def cmd_suggest(
+    raw: str | dict[str, Any],
+    session: CreatorSession | None = None,
+    *,
+    all_errors: bool = False,
+) -> dict[str, Any]:
+    """Validate suggestions into an ask set.
+
+    When `session` is supplied the caller owns flushing it. With `all_errors`
+    every schema, coverage and option-value violation is reported
+    (ValidationErrors) in one pass instead of only the first.
+    """
+    collector = ErrorCollector(all_errors)
+    request = parse_suggestion_request(raw, collector=collector)
+    if session is not None:
+        return _suggest(request, session, collector)
+    with CreatorSession.load() as owned:
+        return _suggest(request, owned, collector)
+
+
+def _entries(
+    request: dict[str, Any], field: str, collector: ErrorCollector
+) -> tuple[list[tuple[int, dict[str, Any]]], bool]:
+    """(index, item) for the `request[field]` items whose question_id validated,
+    and whether that is every item (only then can coverage be checked)."""
+    items = request.get(field)
+    if not isinstance(items, list):
+        return [], False
+    usable = [
+        (i, item)
+        for i, item in enumerate(items)
+        if isinstance(item, dict)
+        and "question_id" in item
+        and not collector.failed(f"{field}[{i}].question_id")
+    ]
+    return usable, len(usable) == len(items)
+
+
+def _suggest(
+    request: dict[str, Any], session: CreatorSession, collector: ErrorCollector
+) -> dict[str, Any]:
+    expected = _next_payload(session)
     if expected["status"] != "need_suggestions":
+        collector.raise_if_any()
         return {
             "status": "ready",
             "message": "No suggestions required.",
             "reflection": expected["reflection"],
         }
 
-    if request["iteration_id"] != expected["iteration_id"]:
-        raise ValueError("iteration_id does not match the current question set.")
+    # Schema violations are already in `collector`; fields that failed there
+    # are skipped here, and everything else is still checked.
+    if not collector.failed("iteration_id") and request["iteration_id"] != expected["iteration_id"]:
+        collector.add("iteration_id", "iteration_id does not match the current question set.")
 
     question_ids = [q["id"] for q in expected["questions"]]
-    provided_ids = [s["question_id"] for s in request["suggestions"]]
-
-    if sorted(question_ids) != sorted(provided_ids):
-        raise ValueError("Suggestions must cover all questions in this iteration.")
+    entries, complete = _entries(request, "suggestions", collector)
+    if complete and sorted(question_ids) != sorted(s["question_id"] for _, s in entries):
+        collector.add("suggestions", "Suggestions must cover all questions in this iteration.")
+
+    by_question: dict[str, tuple[int, dict[str, Any]]] = {}
+    for i, suggestion in entries:
+        by_question.setdefault(suggestion["question_id"], (i, suggestion))
+    for q in expected["questions"]:
+        if q["id"] not in by_question:
+            continue
+        i, suggestion = by_question[q["id"]]
+        options = suggestion.get("options")
+        for j, opt in enumerate(options if isinstance(options, list) else ()):
+            path = f"suggestions[{i}].options[{j}].value"
+            if not isinstance(opt, dict) or "value" not in opt or collector.failed(path):
+                continue
+            try:
+                _validate_value(q, opt["value"])
+            except ValueError as exc:
+                collector.add(path, f"suggestions[{i}].options[{j}] ({q['id']}): {exc}")
+    collector.raise_if_any()
 
     ask_questions = []
-    for i, q in enumerate(expected["questions"]):
-        suggestion = next(s for s in request["suggestions"] if s["question_id"] == q["id"])
+    for q in expected["questions"]:
+        _, suggestion = by_question[q["id"]]
         options = [
             {
                 "label": opt["label"],
@@ -136,15 +274,6 @@ def cmd_suggest(raw: str) -> dict[str, Any]:
             }
             for opt in suggestion["options"]
         ]
-
-        for j, opt in enumerate(options):
-            try:
-                _validate_value(q, opt["value"])
-            except ValueError as exc:
-                raise ValueError(
-                    f"suggestions[{i}].options[{j}] ({q['id']}): {exc}"
-                ) from exc
-
         options.append(q["fixed_option_4"])
 
         ask_questions.append(
@@ -166,57 +295,90 @@ def cmd_suggest(raw: str) -> dict[str, Any]:
     }
     ask_set_id = stable_hash(ask_set)
 
-    state = load_state()
-    state["last_ask_set"] = {
-        "ask_set_id": ask_set_id,
-        "ask_set": ask_set,
-    }
-    save_state(state)
+    session.set("last_ask_set", {"ask_set_id": ask_set_id, "ask_set": ask_set})
     ask_set_path = write_ask_set_snapshot(ask_set_id, ask_set)
 
     return {
         "status": "need_answers",
         "ask_set_id": ask_set_id,
         "artifacts": {"ask_set_path": str(ask_set_path)},
-        "warnings": legacy_warnings(),
+        "warnings": session.warnings(),
         "questions": ask_questions,
         "reflection": expected["reflection"],
     }
 
 
-def cmd_apply(raw: str) -> dict[str, Any]:
-    request = parse_apply_request(raw)
-
-    state = load_state()
-    last = state.get("last_ask_set", {})
-    if not last or last.get("ask_set_id") != request["ask_set_id"]:
-        raise ValueError("ask_set_id does not match the latest ask set.")
-
-    ask_set = last.get("ask_set", {})
-    questions = {q["id"]: q for q in ask_set.get("questions", [])}
+def cmd_apply(
+    raw: str | dict[str, Any],
+    session: CreatorSession | None = None,
+    *,
+    all_errors: bool = False,
+    if_none_match: str | None = None,
+) -> dict[str, Any]:
+    """Apply confirmed answers to the latest ask set.
+
+    When `session` is supplied the caller owns flushing it. `all_errors`
+    reports every schema, coverage, confirmation and value violation in one
+    pass instead of only the first. With `if_none_match` (an etag from
+    `next`) the response also carries `next`: the post-apply `next` sections
+    that changed against that etag.
+    """
+    collector = ErrorCollector(all_errors)
+    request = parse_apply_request(raw, collector=collector)
+    if session is not None:
+        return _apply(request, session, collector, if_none_match)
+    with CreatorSession.load() as owned:
+        return _apply(request, owned, collector, if_none_match)
+
+
+def _apply(
+    request: dict[str, Any],
+    session: CreatorSession,
+    collector: ErrorCollector,
+    if_none_match: str | None = None,
+) -> dict[str, Any]:
+    state = session.state
+    # Schema violations are already in `collector`; fields that failed there
+    # are skipped here, and everything else is still checked.
+    questions: dict[str, dict[str, Any]] | None = None
+    if not collector.failed("ask_set_id"):
+        last = state.get("last_ask_set", {})
+        if not last or last.get("ask_set_id") != request["ask_set_id"]:
+            collector.add("ask_set_id", "ask_set_id does not match the latest ask set.")
+        else:
+            questions = {q["id"]: q for q in last.get("ask_set", {}).get("questions", [])}
 
-    answer_ids = [a["question_id"] for a in request["answers"]]
-    if sorted(answer_ids) != sorted(questions.keys()):
-        raise ValueError("Answers must cover all questions in the latest ask set.")
+    entries, complete = _entries(request, "answers", collector)
+    if (
+        questions is not None
+        and complete
+        and sorted(a["question_id"] for _, a in entries) != sorted(questions)
+    ):
+        collector.add("answers", "Answers must cover all questions in the latest ask set.")
 
     global_confirmed = bool(request.get("confirmed", False))
-
-    for answer in request["answers"]:
-        if answer["question_id"] not in questions:
-            raise ValueError(f"Unknown question_id: {answer['question_id']}")
-        if answer["selection"] == 4 and not answer.get("alternative_text"):
-            raise ValueError("alternative_text is required when selection is 4.")
-        if not global_confirmed and not answer.get("user_confirmation", False):
-            qid = answer["question_id"]
-            raise ValueError(
+    answers = request.get("answers")
+    for i, answer in enumerate(answers if isinstance(answers, list) else ()):
+        if (
+            isinstance(answer, dict)
+            and not global_confirmed
+            and not answer.get("user_confirmation", False)
+            and not collector.failed(f"answers[{i}].user_confirmation")
+        ):
+            qid = answer.get("question_id")
+            collector.add(
+                f"answers[{i}].user_confirmation",
                 f"user_confirmation must be true for answer '{qid}'. "
-                "Set user_confirmation: true per answer, or set top-level confirmed: true."
+                "Set user_confirmation: true per answer, or set top-level confirmed: true.",
             )
 
-    decisions: dict[str, Any] = state.get("decisions", {})
-    decision_log_path = None
-    for answer in request["answers"]:
-        question = questions[answer["question_id"]]
+    # Resolve and validate every answer before touching state so a failing
+    # answer never leaves a partially applied ask set behind.
+    resolved: list[tuple[dict[str, Any], str, Any, str, str]] = []
+    for i, answer in entries:
+        question = (questions or {}).get(answer["question_id"])
+        if question is None or collector.failed(f"answers[{i}].selection"):
+            continue
         if answer["selection"] in (1, 2, 3):
             chosen_value = question["options"][answer["selection"] - 1]["value"]
             chosen_label = question["options"][answer["selection"] - 1]["label"]
@@ -226,15 +388,26 @@ def cmd_apply(raw: str) -> dict[str, Any]:
             chosen_label = "(alternative)"
             chosen_source = "alternative"
 
-        if chosen_value is None:
-            raise ValueError("Internal error: chosen value is None")
+        field = "alternative_text" if chosen_source == "alternative" else "selection"
+        if chosen_value is None or collector.failed(f"answers[{i}].{field}"):
+            # A missing alternative_text is reported by parse_apply_request.
+            continue
 
-        _validate_value(question, str(chosen_value))
+        try:
+            _validate_value(question, str(chosen_value))
+        except ValueError as exc:
+            collector.add(f"answers[{i}].{field}", str(exc))
+            continue
 
         decision_key = question.get("decision_key")
         if not decision_key:
             raise ValueError(f"Question missing decision_key: {answer['question_id']}")
+        resolved.append((answer, decision_key, chosen_value, chosen_label, chosen_source))
+    collector.raise_if_any()
 
+    decisions = session.decisions
+    decision_log_path = None
+    for answer, decision_key, chosen_value, chosen_label, chosen_source in resolved:
         decisions[decision_key] = {
             "value": chosen_value,
             "source": chosen_source,
@@ -252,32 +425,41 @@ def cmd_apply(raw: str) -> dict[str, Any]:
             "value_hash": _hash_value(chosen_value),
             "confirmed": global_confirmed or answer.get("user_confirmation", False),
         }
-        state["decision_log"].append(event)
         decision_log_path = append_decision_event(event)
 
-    state["decisions"] = decisions
-    state["last_ask_set"] = {}
-    save_state(state)
-    receipt_path = write_receipt(
+    session.mark_dirty("decisions")
+    session.set(
+        "decision_log_ref",
+        advance_decision_log_ref(state.get("decision_log_ref", {}), len(resolved)),
+    )
+    session.set("last_ask_set", {})
+    record, receipt_head = encode_receipt(
         {
             "ask_set_id": request["ask_set_id"],
             "applied_at": datetime.now(timezone.utc).isoformat(),
             "answers": request["answers"],
             "decisions": decisions,
-        }
+        },
+        [decision_key for _, decision_key, *_ in resolved],
+        state.get("receipt_head"),
     )
+    receipt_path = write_receipt(record)
+    session.set("receipt_head", receipt_head)
 
-    next_state = cmd_next()
-    return {
+    next_state = _next_payload(session)
+    result = {
         "status": next_state["status"],
         "next_action": "continue_loop" if next_state["status"] != "ready" else "execute_phase",
         "artifacts": {
             "decision_log_path": str(decision_log_path) if decision_log_path else "",
             "receipt_path": str(receipt_path),
         },
-        "warnings": legacy_warnings(),
+        "warnings": next_state["warnings"],
         "reflection": next_state["reflection"],
     }
+    if if_none_match is not None:
+        result["next"] = _versioned(next_state, if_none_match)
+    return result
 
 
 #
@@ -1,46 +1,303 @@
+"""Legacy `.asi/{kickoff,plan,exec}` migration into `.asi/creator/`.
+
+The walk that decides what to migrate is serial, so `migration_report.json`
+lists files in the same order however the work is scheduled. Per-file work
+runs in a bounded thread pool and never passes file contents through Python:
+`os.copy_file_range` (reflinks on filesystems that support them), falling
+back to `shutil.copyfile`, or hardlinks in link mode. Targets appear
+atomically (temporary name, then `os.replace`).
+
+`migration_manifest.jsonl` records each completed source -> target pair:
+source size and mtime, target size and mtime, and the target's sha256. A
+line is appended as soon as a file is done, so an interrupted run resumes
+where it stopped; the file is compacted when a run completes. Without
+`--force`, a rerun:
+
+- leaves a pair alone when both stats still match the manifest;
+- hashes only files whose stats moved, to tell a touched file from a
+  changed one;
+- recopies a changed source only while the target still holds what was
+  migrated, and skips (`exists`) targets edited since or of unknown origin
+  that differ from their source.
+"""
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any, TextIO
 
+from asi.creator.model import LEGACY_PHASES
+from asi.util.codec import JSONDecodeError, dumps, loads
 from asi.util.jsonio import write_json
-from asi.util.paths import repo_root, ensure_dir
+from asi.util.paths import ensure_dir, path_context
+
+
+DEFAULT_JOBS = 8
+# In-flight files per worker; bounds memory for very large trees.
+QUEUE_PER_JOB = 4
+MANIFEST_NAME = "migration_manifest.jsonl"
+TMP_SUFFIX = ".migrating"
+
+# Per-file outcomes: copy it, or skip it as up to date / as a conflict.
+COPY = "migrated"
+UNCHANGED = "unchanged"
+EXISTS = "exists"
+
+Item = tuple[str, str, Path, Path]
+Outcome = tuple[str, dict[str, Any] | None]
+
+
+def _sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
 
+def _stat(st: os.stat_result) -> dict[str, int]:
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
 
-def migrate_legacy(*, force: bool = False) -> dict:
-    root = repo_root()
-    legacy_root = root / ".asi"
-    creator_root = legacy_root / "creator"
-    ensure_dir(creator_root)
 
-    mapping = {
-        "kickoff": legacy_root / "kickoff",
-        "plan": legacy_root / "plan",
-        "exec": legacy_root / "exec",
+def _copy_into(src: Path, dst: Path) -> None:
+    """Copy contents like write_bytes(read_bytes()), but in the kernel."""
+    if hasattr(os, "copy_file_range"):
+        with src.open("rb") as fsrc, dst.open("wb") as fdst:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+                return
+            except OSError:
+                # EXDEV on older kernels, ENOSYS/EINVAL on some filesystems.
+                fdst.truncate(0)
+    shutil.copyfile(src, dst)
+
+
+def _transfer(src: Path, dst: Path, link: bool) -> None:
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}{TMP_SUFFIX}")
+    try:
+        if link:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                # Cross-device or no hardlink support: copy instead.
+                _copy_into(src, tmp)
+        else:
+            _copy_into(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _record(
+    phase: str, rel: str, src_st: os.stat_result, dst: Path, digest: str | None = None
+) -> dict[str, Any]:
+    return {
+        "phase": phase,
+        "path": rel,
+        "source": _stat(src_st),
+        "target": _stat(dst.stat()),
+        "sha256": digest or _sha256(dst),
     }
 
-    results = {"migrated": [], "skipped": [], "errors": []}
 
-    for name, src in mapping.items():
+def _up_to_date(item: Item, previous: dict[str, Any] | None) -> bool:
+    """Both stats still match the manifest: settled without a worker."""
+    if previous is None:
+        return False
+    try:
+        return (
+            _stat(item[2].stat()) == previous["source"]
+            and _stat(item[3].stat()) == previous["target"]
+        )
+    except FileNotFoundError:
+        return False
+
+
+def _decide(item: Item, previous: dict[str, Any] | None, force: bool) -> Outcome:
+    """(outcome, refreshed manifest record, or None when there is nothing new to record)."""
+    phase, rel, src, dst = item
+    try:
+        dst_st = dst.stat()
+    except FileNotFoundError:
+        return COPY, None
+    if force:
+        return COPY, None
+    src_st = src.stat()
+    if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+        # Linked by an earlier --link run: always identical.
+        record = _record(phase, rel, src_st, dst, previous["sha256"] if previous else None)
+        return UNCHANGED, None if record == previous else record
+    if previous is None:
+        digest = _sha256(dst)
+        if _sha256(src) == digest:
+            return UNCHANGED, _record(phase, rel, src_st, dst, digest)
+        return EXISTS, None
+    source_same = _stat(src_st) == previous["source"]
+    target_same = _stat(dst_st) == previous["target"]
+    if source_same and target_same:
+        return UNCHANGED, None
+    if not target_same and _sha256(dst) != previous["sha256"]:
+        # Edited after migration: not ours to overwrite.
+        return EXISTS, None
+    if source_same or _sha256(src) == previous["sha256"]:
+        return UNCHANGED, _record(phase, rel, src_st, dst, previous["sha256"])
+    return COPY, None
+
+
+def _process(
+    item: Item, previous: dict[str, Any] | None, force: bool, link: bool, dry_run: bool
+) -> Outcome:
+    outcome, record = _decide(item, previous, force)
+    if outcome == COPY and not dry_run:
+        phase, rel, src, dst = item
+        src_st = src.stat()
+        _transfer(src, dst, link)
+        record = _record(phase, rel, src_st, dst)
+    return outcome, record
+
+
+def manifest_path() -> Path:
+    return path_context().creator_root / MANIFEST_NAME
+
+
+def read_manifest(path: Path) -> dict[tuple[str, str], dict[str, Any]]:
+    """Latest record per (phase, path); a torn last line from a crash is ignored."""
+    records: dict[tuple[str, str], dict[str, Any]] = {}
+    try:
+        handle = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return records
+    with handle:
+        for line in handle:
+            try:
+                record = loads(line)
+            except JSONDecodeError:
+                continue
+            records[(record["phase"], record["path"])] = record
+    return records
+
+
+def _write_manifest(path: Path, records: list[dict[str, Any]]) -> None:
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(dumps(record, sort_keys=True) + "\n")
+    os.replace(tmp, path)
+
+
+def plan_migration() -> tuple[list[Any], list[Item]]:
+    """Report slots in walk order and the (phase, path, source, target) items.
+
+    A slot is a fixed `skipped` entry for a missing phase, or the index of
+    the item whose outcome fills it in.
+    """
+    ctx = path_context()
+    slots: list[Any] = []
+    items: list[Item] = []
+    for name in LEGACY_PHASES:
+        src = ctx.asi_root / name
         if not src.exists():
-            results["skipped"].append({"phase": name, "reason": "missing"})
+            slots.append({"phase": name, "reason": "missing"})
             continue
-        dest = creator_root / name
-        ensure_dir(dest)
+        dest = ctx.creator_root / name
         for path in src.rglob("*"):
             if path.is_dir():
                 continue
             rel = path.relative_to(src)
-            target = dest / rel
-            if target.exists() and not force:
-                results["skipped"].append(
-                    {"phase": name, "path": str(rel), "reason": "exists"}
-                )
-                continue
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_bytes(path.read_bytes())
-            results["migrated"].append({"phase": name, "path": str(rel)})
+            slots.append(len(items))
+            items.append((name, str(rel), path, dest / rel))
+    return slots, items
+
+
+def migrate_legacy(
+    *,
+    force: bool = False,
+    link: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    dry_run: bool = False,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Migrate new or changed legacy artifacts; `progress` gets one event per file.
+
+    `force` recopies every file. `link` hardlinks instead of copying, so a
+    file stays shared with its legacy original. `dry_run` returns the plan
+    (hashing where needed) without creating anything.
+    """
+    if jobs < 1:
+        raise ValueError("--jobs must be >= 1.")
+    ctx = path_context()
+    creator_root = ctx.creator_root
+    slots, items = plan_migration()
+    path = manifest_path()
+    previous = read_manifest(path)
+    outcomes = [""] * len(items)
+    records: list[dict[str, Any] | None] = [None] * len(items)
+
+    journal: TextIO | None = None
+    if not dry_run:
+        ensure_dir(creator_root)
+        for name in LEGACY_PHASES:
+            if (ctx.asi_root / name).exists():
+                ensure_dir(creator_root / name)
+        for parent in sorted({item[3].parent for item in items}):
+            parent.mkdir(parents=True, exist_ok=True)
+        journal = path.open("a", encoding="utf-8")
+
+    total = len(items)
+    done = 0
+    pending: dict[Future[Outcome], int] = {}
+
+    def settle(index: int, outcome: Outcome) -> None:
+        nonlocal done
+        outcomes[index], records[index] = outcome
+        if journal is not None and records[index] is not None:
+            journal.write(dumps(records[index], sort_keys=True) + "\n")
+            journal.flush()
+        done += 1
+        if progress is not None:
+            phase, rel = items[index][:2]
+            event = "skipped" if outcomes[index] == EXISTS else outcomes[index]
+            progress({"event": event, "phase": phase, "path": rel, "done": done, "total": total})
+
+    def finish(futures: set[Future[Outcome]]) -> None:
+        for future in futures:
+            settle(pending.pop(future), future.result())
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(jobs, total or 1)) as pool:
+            for index, item in enumerate(items):
+                entry = previous.get(item[:2])
+                if not force and _up_to_date(item, entry):
+                    settle(index, (UNCHANGED, None))
+                    continue
+                if len(pending) >= jobs * QUEUE_PER_JOB:
+                    finish(wait(pending, return_when=FIRST_COMPLETED).done)
+                pending[pool.submit(_process, item, entry, force, link, dry_run)] = index
+            finish(wait(pending).done)
+    finally:
+        if journal is not None:
+            journal.close()
+
+    results: dict[str, Any] = {"migrated": [], "skipped": [], "errors": []}
+    for slot in slots:
+        if isinstance(slot, dict):
+            results["skipped"].append(slot)
+            continue
+        phase, rel = items[slot][:2]
+        if outcomes[slot] == COPY:
+            results["migrated"].append({"phase": phase, "path": rel})
+        else:
+            results["skipped"].append({"phase": phase, "path": rel, "reason": outcomes[slot]})
+    if dry_run:
+        return {**results, "dry_run": True, "mode": "link" if link else "copy"}
 
+    kept = [records[index] or previous.get(item[:2]) for index, item in enumerate(items)]
+    _write_manifest(path, [record for record in kept if record is not None])
     report_path = creator_root / "migration_report.json"
     write_json(report_path, results)
     results["report"] = str(report_path)
+    results["manifest"] = str(path)
     return results
@@ -0,0 +1,94 @@
+"""Creator artifact model: where session artifacts live.
+
+Resolved from configuration and paths alone, without opening a storage
+backend, so schema emission can describe the model cheaply.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from asi.util.jsonio import read_json
+from asi.util.paths import path_context
+
+
+STORAGE_ENV = "ASI_CREATOR_STORAGE"
+BACKENDS = ("json", "sqlite")
+SQLITE_FILENAME = "creator.sqlite3"
+LEGACY_PHASES = ("kickoff", "plan", "exec")
+
+
+_CONFIGS: dict[Path, dict[str, Any]] = {}
+
+
+def config_path() -> Path:
+    return path_context().creator_root / "config.json"
+
+
+def creator_config() -> dict[str, Any]:
+    """`.asi/creator/config.json`, read once per creator root; treat it as read-only."""
+    root = path_context().creator_root
+    config = _CONFIGS.get(root)
+    if config is None:
+        config = _CONFIGS[root] = read_json(root / "config.json")
+    return config
+
+
+def forget_creator_config() -> None:
+    """Drop the cached configs, so the next lookup reads config.json again."""
+    _CONFIGS.clear()
+
+
+def storage_backend_name() -> str:
+    """Configured backend: $ASI_CREATOR_STORAGE, else .asi/creator/config.json, else json."""
+    env = os.environ.get(STORAGE_ENV)
+    if env:
+        return env
+    return str(creator_config().get("storage", "json"))
+
+
+def check_storage_backend() -> None:
+    """Raise ValueError for an unknown configured backend before any command opens storage."""
+    backend = storage_backend_name()
+    if backend not in BACKENDS:
+        source = STORAGE_ENV if os.environ.get(STORAGE_ENV) else str(config_path())
+        raise ValueError(
+            f"Unknown storage backend: {backend} (from {source}; expected: {', '.join(BACKENDS)})"
+        )
+
+
+def storage_location(backend: str, root: Path) -> Path:
+    """Where `backend` keeps its records under creator root `root`."""
+    if backend == "json":
+        return root
+    if backend == "sqlite":
+        return root / SQLITE_FILENAME
+    raise ValueError(f"Unknown storage backend: {backend} (expected: {', '.join(BACKENDS)})")
+
+
+def canonical_paths(backend: str, root: Path) -> dict[str, str]:
+    """Files and directories that hold the session records for `backend`."""
+    if backend == "sqlite":
+        return {"database": str(storage_location(backend, root))}
+    return {
+        "state": str(root / "state.json"),
+        "ask_sets": str(root / "ask_sets"),
+        "decision_log": str(root / "decisions.log.jsonl"),
+        "receipts": str(root / "receipts"),
+    }
+
+
+def artifact_model() -> dict[str, Any]:
+    ctx = path_context()
+    root = ctx.creator_root
+    backend = storage_backend_name()
+    return {
+        "version": "v1-session",
+        "storage": {"backend": backend, "location": str(storage_location(backend, root))},
+        "canonical_paths": canonical_paths(backend, root),
+        "legacy_paths": {
+            **{f"creator_{phase}": str(root / phase) for phase in LEGACY_PHASES},
+            **{f"global_{phase}": str(ctx.asi_root / phase) for phase in LEGACY_PHASES},
+        },
+    }
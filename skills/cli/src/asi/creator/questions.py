@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from asi.util.hashing import freeze
+
 
 @dataclass(frozen=True)
 class QuestionDef:
@@ -13,6 +15,9 @@ class QuestionDef:
     answer_kind: str
     value_constraints: dict[str, Any]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "value_constraints", freeze(self.value_constraints))
+
 
 QUESTION_DEFS: list[QuestionDef] = [
     QuestionDef(
@@ -54,6 +59,29 @@ QUESTION_DEFS: list[QuestionDef] = [
 ]
 
 
+# Shared by every skeleton and frozen (read-only) for hashing.
+OPTION_CONSTRAINTS: dict[str, Any] = freeze(
+    {
+        "required_fields": ["label", "value", "description", "impact"],
+        "max_label_chars": 80,
+        "max_value_chars": 200,
+        "max_description_chars": 180,
+        "max_impact_chars": 180,
+        "required_impact_field": True,
+        "value_must_satisfy": "value_constraints",
+        "must_include_risk": False,
+    }
+)
+FIXED_OPTION_4: dict[str, Any] = freeze(
+    {
+        "label": "Respond with an alternative",
+        "value": "__alternative__",
+        "description": "Provide your own answer",
+        "impact": "User-provided value",
+    }
+)
+
+
 def _decision_value(decisions: dict[str, Any], key: str) -> Any:
     """Extract decision value from versioned state formats."""
     if key not in decisions:
@@ -75,22 +103,8 @@ def question_skeletons(decisions: dict[str, Any], max_questions: int = 3) -> lis
             "decision_key": q.decision_key,
             "answer_kind": q.answer_kind,
             "value_constraints": q.value_constraints,
-            "option_constraints": {
-                "required_fields": ["label", "value", "description", "impact"],
-                "max_label_chars": 80,
-                "max_value_chars": 200,
-                "max_description_chars": 180,
-                "max_impact_chars": 180,
-                "required_impact_field": True,
-                "value_must_satisfy": "value_constraints",
-                "must_include_risk": False,
-            },
-            "fixed_option_4": {
-                "label": "Respond with an alternative",
-                "value": "__alternative__",
-                "description": "Provide your own answer",
-                "impact": "User-provided value",
-            },
+            "option_constraints": OPTION_CONSTRAINTS,
+            "fixed_option_4": FIXED_OPTION_4,
         }
         for q in selected
     ]
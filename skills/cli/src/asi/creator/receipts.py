@@ -0,0 +1,86 @@
+"""Delta-encoded apply receipts.
+
+Stored receipts record only the decisions an ask set changed plus the hash of
+the previous stored receipt. Every RECEIPT_CHECKPOINT_INTERVAL-th receipt (and
+the first of a chain) carries the full decisions map instead, so rebuilding
+any receipt reads at most one checkpoint interval of records.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from asi.creator.state import get_storage, stable_hash
+from asi.util.codec import loads
+
+
+RECEIPT_CHECKPOINT_INTERVAL = 16
+
+
+def encode_receipt(
+    payload: dict[str, Any],
+    changed_keys: Iterable[str],
+    head: dict[str, Any] | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build the stored record for a full receipt payload.
+
+    `head` is the state's `receipt_head` ({hash, seq}) or None for a new chain.
+    Returns the record and the new head.
+    """
+    seq = int(head["seq"]) + 1 if head else 1
+    record = {
+        "ask_set_id": payload["ask_set_id"],
+        "applied_at": payload["applied_at"],
+        "answers": payload["answers"],
+        "parent": head["hash"] if head else None,
+        "seq": seq,
+    }
+    decisions = payload["decisions"]
+    if head is None or (seq - 1) % RECEIPT_CHECKPOINT_INTERVAL == 0:
+        record["decisions"] = decisions
+    else:
+        record["changes"] = {key: decisions[key] for key in changed_keys}
+    return record, {"hash": stable_hash(record), "seq": seq}
+
+
+def reconstruct_receipt(records_newest_first: Iterable[str]) -> dict[str, Any]:
+    """Rebuild the full receipt for the first record from it and its ancestors.
+
+    Records without `changes` (checkpoints and pre-delta receipts) carry the
+    full decisions map and end the walk.
+    """
+    chain: list[dict[str, Any]] = []
+    for text in records_newest_first:
+        record = loads(text)
+        if chain and chain[-1].get("parent") != stable_hash(record):
+            raise ValueError(f"Receipt chain broken before seq {chain[-1].get('seq')}.")
+        chain.append(record)
+        if "changes" not in record:
+            break
+    else:
+        if not chain or "changes" in chain[-1]:
+            raise ValueError("Receipt chain has no checkpoint.")
+
+    decisions = dict(chain[-1]["decisions"])
+    for record in reversed(chain[:-1]):
+        decisions.update(record["changes"])
+    target = chain[0]
+    return {
+        "ask_set_id": target["ask_set_id"],
+        "applied_at": target["applied_at"],
+        "answers": target["answers"],
+        "decisions": decisions,
+    }
+
+
+def read_receipt(ask_set_id: str) -> dict[str, Any] | None:
+    """Full receipt for the latest apply of an ask set, as originally applied."""
+    records = get_storage().receipt_records_back(ask_set_id)
+    first = next(records, None)
+    if first is None:
+        return None
+
+    def chained():
+        yield first
+        yield from records
+
+    return reconstruct_receipt(chained())
@@ -1,23 +1,22 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from asi.util.validate import (
-    load_json,
-    require_bool,
-    require_enum_str,
-    require_int,
-    require_list,
-    require_str,
-)
-from asi.creator.state import artifact_model
+from asi.creator.model import artifact_model
+from asi.util.schema import Validator, compile_schema
+from asi.util.validate import ErrorCollector, load_json
 
 
 def emit_creator_run_schema() -> dict[str, Any]:
     """JSON Schema for `asi creator run --stdin` plan input."""
+    schema = creator_run_plan_schema()
+    return {"type": schema.pop("type"), "x-artifact-model": artifact_model(), **schema}
+
+
+def creator_run_plan_schema() -> dict[str, Any]:
     return {
         "type": "object",
-        "x-artifact-model": artifact_model(),
         "properties": {
             "goal": {
                 "type": "string",
@@ -61,7 +60,7 @@ def emit_creator_suggest_schema() -> dict[str, Any]:
                 "items": option_schema,
             },
             "recommended": {"type": "integer", "minimum": 1, "maximum": 3},
-            "rationale": {"type": "object"},
+            "rationale": {"type": ["object", "null"]},
         },
         "required": ["question_id", "options", "recommended"],
         "additionalProperties": False,
@@ -118,110 +117,77 @@ def emit_creator_schema() -> dict[str, Any]:
     return emit_creator_run_schema()
 
 
-def parse_creator_run_plan(raw: str) -> dict[str, Any]:
-    data = load_json(raw)
-    goal = require_str(data, "goal", min_length=1, max_length=500)
-    phase = require_enum_str(
-        data,
-        "phase",
-        allowed=["kickoff", "plan", "exec", "auto"],
-        default="auto",
-        allow_missing=True,
-    )
-    return {"goal": goal, "phase": phase}
-
-
-def _require_object(item: Any, *, context: str) -> dict[str, Any]:
-    if not isinstance(item, dict):
-        raise ValueError(f"{context} must be an object.")
-    return item
-
-
-def parse_suggestion_request(raw: str) -> dict[str, Any]:
-    data = load_json(raw)
-    iteration_id = require_str(data, "iteration_id", min_length=1, max_length=200)
-    suggestions = require_list(data, "suggestions", min_length=1, max_length=3)
-
-    parsed_suggestions: list[dict[str, Any]] = []
-    for i, item in enumerate(suggestions):
-        s = _require_object(item, context=f"suggestions[{i}]")
-        question_id = require_str(s, "question_id", min_length=1, max_length=120)
-        options = require_list(s, "options", min_length=3, max_length=3)
-        recommended = require_int(s, "recommended", min_value=1, max_value=3)
-
-        rationale = s.get("rationale", {})
-        if rationale is None:
-            rationale = {}
-        if not isinstance(rationale, dict):
-            raise ValueError(f"suggestions[{i}].rationale must be an object.")
-
-        parsed_options: list[dict[str, Any]] = []
-        for j, opt in enumerate(options):
-            o = _require_object(opt, context=f"suggestions[{i}].options[{j}]")
-            label = require_str(o, "label", min_length=1, max_length=80)
-            value = require_str(o, "value", min_length=1, max_length=200)
-            description = require_str(o, "description", min_length=1, max_length=180)
-            impact = require_str(o, "impact", min_length=1, max_length=180)
-            parsed_options.append(
-                {"label": label, "value": value, "description": description, "impact": impact}
-            )
-
-        parsed_suggestions.append(
-            {
-                "question_id": question_id,
-                "options": parsed_options,
-                "recommended": int(recommended) if recommended is not None else 1,
-                "rationale": rationale,
-            }
-        )
-
-    return {"iteration_id": iteration_id, "suggestions": parsed_suggestions}
-
-
-def parse_apply_request(raw: str) -> dict[str, Any]:
-    data = load_json(raw)
-    ask_set_id = require_str(data, "ask_set_id", min_length=1, max_length=200)
-    confirmed = require_bool(data, "confirmed", default=False, allow_missing=True)
-    answers = require_list(data, "answers", min_length=1, max_length=3)
-    notes = require_str(data, "notes", min_length=1, max_length=2000, allow_missing=True)
-
-    parsed_answers: list[dict[str, Any]] = []
-    for i, item in enumerate(answers):
-        a = _require_object(item, context=f"answers[{i}]")
-        question_id = require_str(a, "question_id", min_length=1, max_length=120)
-        selection = require_int(a, "selection", min_value=1, max_value=4)
-
-        alternative_text = require_str(
-            a,
-            "alternative_text",
-            min_length=1,
-            max_length=500,
-            allow_missing=True,
-        )
-        answer_confirmed = require_bool(
-            a,
-            "user_confirmation",
-            default=False,
-            allow_missing=True,
-        )
-
-        if selection == 4 and not alternative_text:
-            raise ValueError("alternative_text is required when selection is 4.")
-
-        parsed_answers.append(
-            {
-                "question_id": question_id,
-                "selection": selection,
-                "alternative_text": alternative_text,
-                "user_confirmation": answer_confirmed,
-            }
-        )
-
-    out: dict[str, Any] = {
-        "ask_set_id": ask_set_id,
-        "confirmed": confirmed,
-        "answers": parsed_answers,
-    }
-    if notes:
-        out["notes"] = notes
-    return out
+@lru_cache(maxsize=None)
+def _validator(kind: str) -> Validator:
+    # The run schema embeds the live artifact model; validation does not need it.
+    if kind == "run":
+        return compile_schema(creator_run_plan_schema())
+    if kind == "suggest":
+        return compile_schema(emit_creator_suggest_schema())
+    schema = emit_creator_apply_schema()
+    # Parsed requests always carry the optional flags. The defaults are filled
+    # in while validating instead of being published in the schema.
+    schema["properties"]["confirmed"]["default"] = False
+    answer = schema["properties"]["answers"]["items"]["properties"]
+    answer["alternative_text"]["default"] = None
+    answer["user_confirmation"]["default"] = False
+    return compile_schema(schema)
+
+
+def parse_creator_run_plan(raw: str | dict[str, Any]) -> dict[str, Any]:
+    return _validator("run")(load_json(raw))
+
+
+def parse_suggestion_request(
+    raw: str | dict[str, Any],
+    *,
+    all_errors: bool = False,
+    collector: ErrorCollector | None = None,
+) -> dict[str, Any]:
+    """Validated suggest request.
+
+    Given an all-errors `collector`, violations are recorded there and the
+    partially validated request is returned instead of raising.
+    """
+    request = _validator("suggest")(load_json(raw), all_errors=all_errors, collector=collector)
+    suggestions = request.get("suggestions")
+    for suggestion in suggestions if isinstance(suggestions, list) else ():
+        if isinstance(suggestion, dict):
+            suggestion["rationale"] = suggestion.get("rationale") or {}
+    return request
+
+
+def parse_apply_request(
+    raw: str | dict[str, Any],
+    *,
+    all_errors: bool = False,
+    collector: ErrorCollector | None = None,
+) -> dict[str, Any]:
+    """Validated apply request; `collector` works as for parse_suggestion_request."""
+    owned = collector is None
+    if owned and all_errors:
+        collector = ErrorCollector(True)
+    request = _validator("apply")(load_json(raw), collector=collector)
+    missing_text = []
+    answers = request.get("answers")
+    for i, answer in enumerate(answers if isinstance(answers, list) else ()):
+        if (
+            answer.__class__ is dict
+            and answer.get("selection") == 4
+            and not answer.get("alternative_text")
+        ):
+            missing_text.append(i)
+    if missing_text:
+        if collector is None:
+            collector = ErrorCollector()
+        for i in missing_text:
+            if not collector.failed(f"answers[{i}].selection") and not collector.failed(
+                f"answers[{i}].alternative_text"
+            ):
+                collector.add(
+                    f"answers[{i}].alternative_text",
+                    "alternative_text is required when selection is 4.",
+                )
+    if owned and collector is not None:
+        collector.raise_if_any()
+    return request
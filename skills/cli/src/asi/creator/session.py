@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any
+
+from asi.creator.state import legacy_warnings, load_state, save_state
+
+
+class CreatorSession:
+    """Unit of work over creator state: loaded once, written back at most once.
+
+    Commands read and mutate `state` in place and record what they touched
+    with `mark_dirty`; `flush` only writes when something changed.
+    """
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+        self.dirty: set[str] = set()
+        self._warnings: list[dict[str, str]] | None = None
+
+    @classmethod
+    def load(cls) -> CreatorSession:
+        return cls(load_state())
+
+    @property
+    def decisions(self) -> dict[str, Any]:
+        return self.state.setdefault("decisions", {})
+
+    def set(self, field: str, value: Any) -> None:
+        self.state[field] = value
+        self.dirty.add(field)
+
+    def mark_dirty(self, field: str) -> None:
+        self.dirty.add(field)
+
+    def warnings(self) -> list[dict[str, str]]:
+        if self._warnings is None:
+            self._warnings = legacy_warnings()
+        return self._warnings
+
+    def flush(self) -> bool:
+        """Persist state if any field changed; returns whether a write happened."""
+        if not self.dirty:
+            return False
+        save_state(self.state)
+        self.dirty.clear()
+        return True
+
+    def __enter__(self) -> CreatorSession:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.flush()
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import hashlib
-import json
-from datetime import datetime, timezone
+import os
 from pathlib import Path
 from typing import Any
 
+from asi.creator.model import (
+    LEGACY_PHASES,
+    config_path,
+    creator_config,
+    forget_creator_config,
+    storage_backend_name,
+)
+from asi.creator.storage import Storage, convert, open_storage
+from asi.util.codec import dumps, loads
+from asi.util.hashing import canonical_hash
 from asi.util.jsonio import read_json, write_json
-from asi.util.paths import repo_root, ensure_dir
+from asi.util.paths import path_context
 
 
 def state_path() -> Path:
@@ -15,7 +23,7 @@ def state_path() -> Path:
 
 
 def creator_root() -> Path:
-    return repo_root() / ".asi" / "creator"
+    return path_context().creator_root
 
 
 def ask_sets_dir() -> Path:
@@ -30,34 +38,58 @@ def decision_log_jsonl_path() -> Path:
     return creator_root() / "decisions.log.jsonl"
 
 
-def artifact_model() -> dict[str, Any]:
+_STORAGES: dict[tuple[str, str], Storage] = {}
+
+
+def get_storage(backend: str | None = None) -> Storage:
     root = creator_root()
+    name = backend or storage_backend_name()
+    key = (str(root), name)
+    if key not in _STORAGES:
+        options = {}
+        segment_bytes = creator_config().get("receipt_segment_bytes")
+        if name == "json" and segment_bytes:
+            options["receipt_segment_bytes"] = int(segment_bytes)
+        _STORAGES[key] = open_storage(root, name, **options)
+    return _STORAGES[key]
+
+
+def convert_storage(target: str) -> dict[str, Any]:
+    """Copy all creator records into `target` and make it the configured backend."""
+    source_name = storage_backend_name()
+    if target == source_name:
+        raise ValueError(f"Storage is already '{target}'.")
+    source = get_storage(source_name)
+    counts = convert(source, get_storage(target))
+    config = read_json(config_path())
+    config["storage"] = target
+    write_json(config_path(), config)
+    forget_creator_config()
     return {
-        "version": "v1-session",
-        "canonical_paths": {
-            "state": str(root / "state.json"),
-            "ask_sets": str(root / "ask_sets"),
-            "decision_log": str(root / "decisions.log.jsonl"),
-            "receipts": str(root / "receipts"),
-        },
-        "legacy_paths": {
-            "creator_kickoff": str(root / "kickoff"),
-            "creator_plan": str(root / "plan"),
-            "creator_exec": str(root / "exec"),
-            "global_kickoff": str(repo_root() / ".asi" / "kickoff"),
-            "global_plan": str(repo_root() / ".asi" / "plan"),
-            "global_exec": str(repo_root() / ".asi" / "exec"),
-        },
+        "from": source_name,
+        "to": target,
+        "counts": counts,
+        "config_path": str(config_path()),
     }
 
 
+def _entries(path: Path) -> set[str]:
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def _legacy_paths_present() -> list[Path]:
-    model = artifact_model()
-    out: list[Path] = []
-    for _name, path in model["legacy_paths"].items():
-        p = Path(path)
-        if p.exists():
-            out.append(p)
+    # One directory listing per parent instead of a stat per legacy path.
+    ctx = path_context()
+    asi_names = _entries(ctx.asi_root)
+    if not asi_names:
+        return []
+    creator_names = _entries(ctx.creator_root) if "creator" in asi_names else set()
+    out = [ctx.creator_root / phase for phase in LEGACY_PHASES if phase in creator_names]
+    out += [ctx.asi_root / phase for phase in LEGACY_PHASES if phase in asi_names]
     return out
 
 
@@ -96,45 +128,98 @@ def _migrate_to_v2(state: dict[str, Any]) -> dict[str, Any]:
     return state
 
 
+def _migrate_to_v3(state: dict[str, Any]) -> dict[str, Any]:
+    """Move the in-state decision_log into the decision log and keep only a reference.
+
+    Apply has always mirrored events into the log, so only events missing
+    from it (e.g. migration markers) are appended. Existing lines are
+    re-encoded before comparing, since they may come from another JSON backend.
+    """
+    storage = get_storage()
+    lines = list(storage.decision_lines())
+    seen = {dumps(loads(line), sort_keys=True) for line in lines}
+    pending = [
+        line
+        for line in (dumps(event, sort_keys=True) for event in state.pop("decision_log", []))
+        if line not in seen
+    ]
+    pending.append(dumps({"event": "migrated_to_v3"}, sort_keys=True))
+    storage.append_decision_lines(pending)
+
+    state["version"] = 3
+    state["decision_log_ref"] = {
+        "seq": len(lines) + len(pending),
+        "offset": storage.log_position(),
+    }
+    return state
+
+
 def load_state() -> dict[str, Any]:
-    path = state_path()
-    state = read_json(path) if path.exists() else {}
+    state = get_storage().read_state()
+    if state is None:
+        return {
+            "version": 3,
+            "decisions": {},
+            "last_ask_set": {},
+            "decision_log_ref": {"seq": 0, "offset": 0},
+        }
     state.setdefault("version", 1)
     state.setdefault("decisions", {})
-    state.setdefault("decision_log", [])
     state.setdefault("last_ask_set", {})
     if state.get("version", 1) < 2:
         state = _migrate_to_v2(state)
+    if state.get("version", 1) < 3:
+        state = _migrate_to_v3(state)
+        # The log now owns the events; persist so they are not re-appended.
+        save_state(state)
+    state.setdefault("decision_log_ref", {"seq": 0, "offset": 0})
     return state
 
 
 def save_state(state: dict[str, Any]) -> None:
-    path = state_path()
-    ensure_dir(path.parent)
-    write_json(path, state)
+    get_storage().write_state(state)
+
+
+def state_stamp() -> tuple[Any, ...]:
+    """Backend name plus (mtime_ns, size) of config.json and each file holding the state.
+
+    It changes whenever any process writes the state or the creator config,
+    so a long-lived reader can tell when its loaded copy went stale without
+    reading it.
+    """
+    storage = get_storage()
+    stamp: list[Any] = [storage.name]
+    for path in [config_path(), *storage.state_files()]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
 
 
 def write_ask_set_snapshot(ask_set_id: str, ask_set: dict[str, Any]) -> Path:
-    path = ask_sets_dir() / f"{ask_set_id}.json"
-    write_json(path, {"ask_set_id": ask_set_id, "ask_set": ask_set})
-    return path
+    return get_storage().write_ask_set(ask_set_id, {"ask_set_id": ask_set_id, "ask_set": ask_set})
 
 
 def append_decision_event(event: dict[str, Any]) -> Path:
-    path = decision_log_jsonl_path()
-    ensure_dir(path.parent)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, sort_keys=True) + "\n")
-    return path
+    return get_storage().append_decision_lines([dumps(event, sort_keys=True)])
+
+
+def advance_decision_log_ref(ref: dict[str, int], count: int) -> dict[str, int]:
+    """Reference after `count` events were appended past `ref`."""
+    return {"seq": int(ref.get("seq", 0)) + count, "offset": get_storage().log_position()}
+
+
+def read_decision_log(offset: int = 0) -> list[dict[str, Any]]:
+    """Decision events from the log, starting at a backend position (see decision_log_ref)."""
+    return [loads(line) for line in get_storage().decision_lines(offset)]
 
 
 def write_receipt(payload: dict[str, Any]) -> Path:
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
-    path = receipts_dir() / f"{ts}.json"
-    write_json(path, payload)
-    return path
+    return get_storage().write_receipt(payload)
 
 
 def stable_hash(data: dict[str, Any]) -> str:
-    raw = json.dumps(data, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    return canonical_hash(data)
@@ -0,0 +1,518 @@
+"""Storage backends for creator session artifacts.
+
+Both backends store the same records; bodies are kept as the exact JSON text
+the JSON-files layout writes, so converting between them is lossless.
+"""
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from asi.creator.model import BACKENDS, SQLITE_FILENAME
+from asi.util.codec import dumps, loads
+from asi.util.jsonio import read_json, write_json
+from asi.util.paths import ensure_dir
+
+
+RECEIPT_SEGMENT_BYTES = 4 * 1024 * 1024
+RECEIPT_INDEX_FILENAME = "index.jsonl"
+
+
+def _dump_file(data: dict[str, Any]) -> str:
+    # Matches asi.util.jsonio.write_json byte-for-byte.
+    return dumps(data, indent=True, sort_keys=True)
+
+
+def _dump_line(data: dict[str, Any]) -> str:
+    return dumps(data, sort_keys=True)
+
+
+def _as_line(text: str) -> str:
+    # Legacy per-file receipts are indented; segment records are single lines.
+    return text if "\n" not in text else _dump_line(loads(text))
+
+
+def _receipt_name() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ") + ".json"
+
+
+class JsonFilesStorage:
+    """Default layout: state.json, ask_sets/, decisions.log.jsonl, receipts/.
+
+    Ask sets are content-addressed and sharded as `ask_sets/ab/cd/<hash>.json`;
+    flat `ask_sets/<hash>.json` files from older layouts are still read.
+    Receipts are appended to rolling `receipts/segment-NNNNNN.jsonl` files with
+    a sidecar `receipts/index.jsonl` (ask_set_id -> segment, offset, length).
+    A segment is never written again once a newer one exists.
+    """
+
+    name = "json"
+
+    def __init__(self, root: Path, *, receipt_segment_bytes: int = RECEIPT_SEGMENT_BYTES) -> None:
+        self.root = root
+        self.receipt_segment_bytes = receipt_segment_bytes
+
+    @property
+    def location(self) -> Path:
+        return self.root
+
+    def state_path(self) -> Path:
+        return self.root / "state.json"
+
+    def ask_sets_dir(self) -> Path:
+        return self.root / "ask_sets"
+
+    def receipts_dir(self) -> Path:
+        return self.root / "receipts"
+
+    def decision_log_path(self) -> Path:
+        return self.root / "decisions.log.jsonl"
+
+    def state_files(self) -> list[Path]:
+        """Files a state write changes."""
+        return [self.state_path()]
+
+    def read_state(self) -> dict[str, Any] | None:
+        path = self.state_path()
+        return read_json(path) if path.exists() else None
+
+    def write_state(self, state: dict[str, Any]) -> Path:
+        path = self.state_path()
+        ensure_dir(path.parent)
+        write_json(path, state)
+        return path
+
+    def ask_set_path(self, ask_set_id: str) -> Path:
+        if len(ask_set_id) < 4:
+            return self.ask_sets_dir() / f"{ask_set_id}.json"
+        return self.ask_sets_dir() / ask_set_id[:2] / ask_set_id[2:4] / f"{ask_set_id}.json"
+
+    def _existing_ask_set(self, ask_set_id: str) -> Path | None:
+        for path in (self.ask_set_path(ask_set_id), self.ask_sets_dir() / f"{ask_set_id}.json"):
+            if path.exists():
+                return path
+        return None
+
+    def write_ask_set(self, ask_set_id: str, body: dict[str, Any]) -> Path:
+        """Write a snapshot unless its content address already exists."""
+        existing = self._existing_ask_set(ask_set_id)
+        if existing is not None:
+            return existing
+        path = self.ask_set_path(ask_set_id)
+        write_json(path, body)
+        return path
+
+    def _ask_set_files(self) -> list[Path]:
+        root = self.ask_sets_dir()
+        return sorted([*root.glob("*.json"), *root.glob("*/*/*.json")], key=lambda p: p.name)
+
+    def ask_set_ids(self) -> list[str]:
+        """Stored ask set ids, oldest write first."""
+        files = [(path.stat().st_mtime_ns, path.stem) for path in self._ask_set_files()]
+        return [ask_set_id for _, ask_set_id in sorted(files)]
+
+    def ask_set_text(self, ask_set_id: str) -> str | None:
+        path = self._existing_ask_set(ask_set_id)
+        return path.read_text(encoding="utf-8") if path is not None else None
+
+    def remove_ask_sets(self, ask_set_ids: list[str]) -> None:
+        root = self.ask_sets_dir()
+        for ask_set_id in ask_set_ids:
+            path = self._existing_ask_set(ask_set_id)
+            if path is None:
+                continue
+            path.unlink()
+            # Drop emptied shard directories so listings stay short.
+            for parent in (path.parent, path.parent.parent):
+                if parent != root and parent.is_relative_to(root) and not any(parent.iterdir()):
+                    parent.rmdir()
+
+    def append_decision_lines(self, lines: list[str]) -> Path:
+        path = self.decision_log_path()
+        ensure_dir(path.parent)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(line + "\n" for line in lines))
+        return path
+
+    def decision_lines(self, position: int = 0) -> Iterator[str]:
+        path = self.decision_log_path()
+        if not path.exists():
+            return
+        with path.open("rb") as handle:
+            handle.seek(position)
+            for raw in handle:
+                line = raw.decode("utf-8").rstrip("\n")
+                if line:
+                    yield line
+
+    def log_position(self) -> int:
+        """Byte offset of the end of the decision log."""
+        path = self.decision_log_path()
+        return path.stat().st_size if path.exists() else 0
+
+    def receipt_index_path(self) -> Path:
+        return self.receipts_dir() / RECEIPT_INDEX_FILENAME
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.receipts_dir().glob("segment-*.jsonl"))
+
+    def _writable_segment(self, size: int) -> Path:
+        segments = self._segments()
+        if segments:
+            current = segments[-1]
+            used = current.stat().st_size
+            if used == 0 or used + size <= self.receipt_segment_bytes:
+                return current
+            number = int(current.stem.split("-", 1)[1]) + 1
+        else:
+            number = 1
+        return self.receipts_dir() / f"segment-{number:06d}.jsonl"
+
+    def _append_receipt(self, name: str, line: str) -> Path:
+        data = (line + "\n").encode("utf-8")
+        ensure_dir(self.receipts_dir())
+        segment = self._writable_segment(len(data))
+        with segment.open("ab") as handle:
+            offset = handle.tell()
+            handle.write(data)
+        entry = {
+            "ask_set_id": loads(line).get("ask_set_id"),
+            "name": name,
+            "segment": segment.name,
+            "offset": offset,
+            "length": len(data) - 1,
+        }
+        with self.receipt_index_path().open("a", encoding="utf-8") as handle:
+            handle.write(_dump_line(entry) + "\n")
+        return segment
+
+    def write_receipt(self, body: dict[str, Any], name: str | None = None) -> Path:
+        return self._append_receipt(name or _receipt_name(), _dump_line(body))
+
+    def _index_entries(self) -> Iterator[dict[str, Any]]:
+        path = self.receipt_index_path()
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield loads(line)
+
+    def _read_record(self, entry: dict[str, Any]) -> str:
+        with (self.receipts_dir() / entry["segment"]).open("rb") as handle:
+            handle.seek(entry["offset"])
+            return handle.read(entry["length"]).decode("utf-8")
+
+    def _legacy_receipts(self) -> list[Path]:
+        return sorted(self.receipts_dir().glob("*.json"))
+
+    def receipt_records_back(self, ask_set_id: str) -> Iterator[str]:
+        """Latest receipt record for an ask set, then every older record, newest first.
+
+        The index is matched textually before parsing; records are read by seek.
+        """
+        needle = dumps(ask_set_id)
+        lines: list[str] = []
+        target = -1
+        path = self.receipt_index_path()
+        if path.exists():
+            with path.open("r", encoding="utf-8") as handle:
+                lines = [line for line in handle if line.strip()]
+            for i in range(len(lines) - 1, -1, -1):
+                if needle in lines[i] and loads(lines[i]).get("ask_set_id") == ask_set_id:
+                    target = i
+                    break
+        legacy = self._legacy_receipts()
+        if target < 0:
+            bodies = [_as_line(p.read_text(encoding="utf-8")) for p in legacy]
+            matches = [
+                i for i, text in enumerate(bodies) if loads(text).get("ask_set_id") == ask_set_id
+            ]
+            if matches:
+                yield from reversed(bodies[: matches[-1] + 1])
+            return
+        for i in range(target, -1, -1):
+            yield self._read_record(loads(lines[i]))
+        for legacy_path in reversed(legacy):
+            yield _as_line(legacy_path.read_text(encoding="utf-8"))
+
+    def iter_ask_sets(self) -> Iterator[tuple[str, str]]:
+        for path in self._ask_set_files():
+            yield path.stem, path.read_text(encoding="utf-8")
+
+    def iter_receipts(self) -> Iterator[tuple[str, str]]:
+        for path in self._legacy_receipts():
+            yield path.name, _as_line(path.read_text(encoding="utf-8"))
+        for entry in self._index_entries():
+            yield entry["name"], self._read_record(entry)
+
+    def position_after(self, seq: int) -> int:
+        """Log position just past the first `seq` events."""
+        path = self.decision_log_path()
+        if seq <= 0 or not path.exists():
+            return 0
+        with path.open("rb") as handle:
+            for _ in range(seq):
+                handle.readline()
+            return handle.tell()
+
+    def import_records(
+        self,
+        ask_sets: list[tuple[str, str]],
+        decision_lines: list[str],
+        receipts: list[tuple[str, str]],
+    ) -> None:
+        ensure_dir(self.root)
+        for ask_set_id, text in ask_sets:
+            path = self.ask_set_path(ask_set_id)
+            ensure_dir(path.parent)
+            path.write_text(text, encoding="utf-8")
+        self.decision_log_path().unlink(missing_ok=True)
+        if decision_lines:
+            self.append_decision_lines(decision_lines)
+        # Imported receipts replace same-named ones, as INSERT OR REPLACE does on
+        # the SQLite side; the receipts directory is rewritten so a repeated
+        # import never duplicates records.
+        names = {name for name, _ in receipts}
+        kept = [(name, text) for name, text in self.iter_receipts() if name not in names]
+        for path in [*self._legacy_receipts(), *self._segments(), self.receipt_index_path()]:
+            path.unlink(missing_ok=True)
+        for name, text in [*kept, *receipts]:
+            self._append_receipt(name, _as_line(text))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ask_sets (
+    ask_set_id TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decision_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ask_set_id TEXT,
+    decision_key TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decision_events_ask_set ON decision_events (ask_set_id);
+CREATE INDEX IF NOT EXISTS decision_events_key ON decision_events (decision_key);
+CREATE TABLE IF NOT EXISTS receipts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    ask_set_id TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS receipts_ask_set ON receipts (ask_set_id);
+"""
+
+
+_INSERT_EVENT = "INSERT INTO decision_events (ask_set_id, decision_key, body) VALUES (?, ?, ?)"
+
+
+def _event_rows(lines: list[str]) -> list[tuple[Any, Any, str]]:
+    rows = []
+    for line in lines:
+        event = loads(line)
+        rows.append((event.get("ask_set_id"), event.get("decision_key"), line))
+    return rows
+
+
+class SqliteStorage:
+    """Opt-in single-file layout: indexed tables in WAL mode."""
+
+    name = "sqlite"
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def location(self) -> Path:
+        return self.root / SQLITE_FILENAME
+
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            ensure_dir(self.root)
+            conn = sqlite3.connect(str(self.location))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def state_files(self) -> list[Path]:
+        """Files a state write changes: in WAL mode, the log until a checkpoint."""
+        return [self.location, self.location.with_name(f"{SQLITE_FILENAME}-wal")]
+
+    def read_state(self) -> dict[str, Any] | None:
+        text = self.state_text()
+        return loads(text) if text is not None else None
+
+    def state_text(self) -> str | None:
+        if not self.location.exists():
+            return None
+        row = self.conn().execute("SELECT body FROM state WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def write_state(self, state: dict[str, Any]) -> Path:
+        with self.conn() as conn:
+            conn.execute(
+                "INSERT INTO state (id, body) VALUES (1, ?) "
+                "ON CONFLICT(id) DO UPDATE SET body = excluded.body",
+                (_dump_file(state),),
+            )
+        return self.location
+
+    def write_ask_set(self, ask_set_id: str, body: dict[str, Any]) -> Path:
+        with self.conn() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO ask_sets (ask_set_id, body) VALUES (?, ?)",
+                (ask_set_id, _dump_file(body)),
+            )
+        return self.location
+
+    def ask_set_ids(self) -> list[str]:
+        """Stored ask set ids, oldest write first."""
+        if not self.location.exists():
+            return []
+        rows = self.conn().execute("SELECT ask_set_id FROM ask_sets ORDER BY rowid")
+        return [row[0] for row in rows]
+
+    def ask_set_text(self, ask_set_id: str) -> str | None:
+        if not self.location.exists():
+            return None
+        row = self.conn().execute(
+            "SELECT body FROM ask_sets WHERE ask_set_id = ?", (ask_set_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def remove_ask_sets(self, ask_set_ids: list[str]) -> None:
+        with self.conn() as conn:
+            conn.executemany(
+                "DELETE FROM ask_sets WHERE ask_set_id = ?", [(i,) for i in ask_set_ids]
+            )
+
+    def append_decision_lines(self, lines: list[str]) -> Path:
+        with self.conn() as conn:
+            conn.executemany(_INSERT_EVENT, _event_rows(lines))
+        return self.location
+
+    def decision_lines(self, position: int = 0) -> Iterator[str]:
+        if not self.location.exists():
+            return
+        cur = self.conn().execute(
+            "SELECT body FROM decision_events WHERE seq > ? ORDER BY seq", (position,)
+        )
+        for (body,) in cur:
+            yield body
+
+    def log_position(self) -> int:
+        """Highest decision event sequence number."""
+        if not self.location.exists():
+            return 0
+        row = self.conn().execute("SELECT COALESCE(MAX(seq), 0) FROM decision_events").fetchone()
+        return int(row[0])
+
+    def write_receipt(self, body: dict[str, Any], name: str | None = None) -> Path:
+        with self.conn() as conn:
+            conn.execute(
+                "INSERT INTO receipts (name, ask_set_id, body) VALUES (?, ?, ?)",
+                (name or _receipt_name(), body.get("ask_set_id"), _dump_line(body)),
+            )
+        return self.location
+
+    def receipt_records_back(self, ask_set_id: str) -> Iterator[str]:
+        """Latest receipt record for an ask set, then every older record, newest first."""
+        if not self.location.exists():
+            return
+        conn = self.conn()
+        row = conn.execute(
+            "SELECT id FROM receipts WHERE ask_set_id = ? ORDER BY id DESC LIMIT 1",
+            (ask_set_id,),
+        ).fetchone()
+        if row is None:
+            return
+        for (body,) in conn.execute(
+            "SELECT body FROM receipts WHERE id <= ? ORDER BY id DESC", (row[0],)
+        ):
+            yield body
+
+    def iter_ask_sets(self) -> Iterator[tuple[str, str]]:
+        if not self.location.exists():
+            return
+        yield from self.conn().execute("SELECT ask_set_id, body FROM ask_sets ORDER BY ask_set_id")
+
+    def iter_receipts(self) -> Iterator[tuple[str, str]]:
+        if not self.location.exists():
+            return
+        yield from self.conn().execute("SELECT name, body FROM receipts ORDER BY id")
+
+    def position_after(self, seq: int) -> int:
+        """Log position just past the first `seq` events."""
+        if seq <= 0:
+            return 0
+        row = self.conn().execute(
+            "SELECT seq FROM decision_events ORDER BY seq LIMIT 1 OFFSET ?", (seq - 1,)
+        ).fetchone()
+        return int(row[0]) if row else self.log_position()
+
+    def import_records(
+        self,
+        ask_sets: list[tuple[str, str]],
+        decision_lines: list[str],
+        receipts: list[tuple[str, str]],
+    ) -> None:
+        with self.conn() as conn:
+            conn.execute("DELETE FROM decision_events")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'decision_events'")
+            conn.executemany(
+                "INSERT OR REPLACE INTO ask_sets (ask_set_id, body) VALUES (?, ?)", ask_sets
+            )
+            conn.executemany(_INSERT_EVENT, _event_rows(decision_lines))
+            conn.executemany(
+                "INSERT OR REPLACE INTO receipts (name, ask_set_id, body) VALUES (?, ?, ?)",
+                [
+                    (name, loads(text).get("ask_set_id"), _as_line(text))
+                    for name, text in receipts
+                ],
+            )
+
+
+Storage = JsonFilesStorage | SqliteStorage
+
+
+def open_storage(root: Path, backend: str, **options: Any) -> Storage:
+    if backend == "json":
+        return JsonFilesStorage(root, **options)
+    if backend == "sqlite":
+        return SqliteStorage(root)
+    raise ValueError(f"Unknown storage backend: {backend} (expected: {', '.join(BACKENDS)})")
+
+
+def convert(source: Storage, target: Storage) -> dict[str, int]:
+    """Copy every record from source to target; returns per-kind counts.
+
+    Record bodies are copied verbatim. The only rewritten field is the state's
+    `decision_log_ref.offset`, which is re-expressed as a target log position.
+    """
+    ask_sets = list(source.iter_ask_sets())
+    lines = list(source.decision_lines())
+    receipts = list(source.iter_receipts())
+    target.import_records(ask_sets, lines, receipts)
+
+    state = source.read_state()
+    if state is not None:
+        ref = state.get("decision_log_ref")
+        if isinstance(ref, dict):
+            ref["offset"] = target.position_after(int(ref.get("seq", 0)))
+        target.write_state(state)
+    return {
+        "state": 0 if state is None else 1,
+        "ask_sets": len(ask_sets),
+        "decision_events": len(lines),
+        "receipts": len(receipts),
+    }
@@ -0,0 +1,331 @@
+"""Persistent, incremental file index for onboarding (`.asi/onboard/index.json`).
+
+One record per tracked file (`git ls-files`, or a walk when the repo is not
+a git checkout): path, size, mtime, sha256, language, line count and
+top-level symbols. An update stats every tracked file and re-reads only the
+files whose (size, mtime) changed, in a bounded thread pool; queries read
+the index alone and never touch the tree, so their answers are as fresh as
+the last `asi onboard index`.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from asi.onboard.ingest import BINARY_SNIFF_BYTES, CHUNK_BYTES
+from asi.util.codec import dumps, loads
+from asi.util.paths import path_context
+
+
+INDEX_VERSION = 1
+INDEX_NAME = "index.json"
+DEFAULT_JOBS = 8
+# Symbols come from the head of a file only, and at most this many per file.
+SYMBOL_SCAN_BYTES = 1 << 20
+MAX_SYMBOLS = 200
+# Skipped by the fallback walk; git checkouts use `git ls-files` instead.
+WALK_SKIP_DIRS = {
+    ".git",
+    ".asi",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    "dist",
+    "build",
+}
+
+LANGUAGES_BY_EXTENSION = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".rb": "ruby",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".ps1": "powershell",
+    ".md": "markdown",
+    ".json": "json",
+    ".jsonl": "json",
+    ".toml": "toml",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".html": "html",
+    ".css": "css",
+    ".sql": "sql",
+    ".txt": "text",
+}
+LANGUAGES_BY_NAME = {"Makefile": "make", "Dockerfile": "dockerfile", "llms.txt": "text"}
+
+# Column-0 definitions (headings for markdown): one capture group each.
+SYMBOL_PATTERNS = {
+    "python": re.compile(rb"^(?:async\s+def|def|class)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "javascript": re.compile(
+        rb"^(?:export\s+)?(?:default\s+)?(?:async\s+)?(?:function\*?|class|const|let|var)\s+([A-Za-z_$][\w$]*)",
+        re.MULTILINE,
+    ),
+    "typescript": re.compile(
+        rb"^(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+        rb"(?:function\*?|class|const|let|var|interface|type|enum)\s+([A-Za-z_$][\w$]*)",
+        re.MULTILINE,
+    ),
+    "go": re.compile(rb"^(?:func(?:\s*\([^)]*\))?|type)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "rust": re.compile(
+        rb"^(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?(?:fn|struct|enum|trait|mod|type|const|static)\s+([A-Za-z_]\w*)",
+        re.MULTILINE,
+    ),
+    "shell": re.compile(rb"^(?:function\s+)?([A-Za-z_][\w-]*)\s*\(\)", re.MULTILINE),
+    "markdown": re.compile(rb"^#{1,2}[ \t]+(.+?)[ \t#]*$", re.MULTILINE),
+}
+
+
+def index_path() -> Path:
+    return path_context().asi_root / "onboard" / INDEX_NAME
+
+
+def detect_language(rel: str) -> str | None:
+    name = rel.rsplit("/", 1)[-1]
+    if name in LANGUAGES_BY_NAME:
+        return LANGUAGES_BY_NAME[name]
+    return LANGUAGES_BY_EXTENSION.get(os.path.splitext(name)[1].lower())
+
+
+def _symbols(language: str | None, head: bytes) -> list[str]:
+    pattern = SYMBOL_PATTERNS.get(language or "")
+    if pattern is None:
+        return []
+    found = []
+    for match in pattern.finditer(head):
+        found.append(match.group(1).decode("utf-8", errors="replace").strip())
+        if len(found) == MAX_SYMBOLS:
+            break
+    return found
+
+
+def scan_file(root: Path, rel: str) -> dict[str, Any] | None:
+    """Index record for one file, or None when it is gone, not a regular file,
+    or a symlink resolving outside `root` (which must be resolved)."""
+    path = root / rel
+    try:
+        st = os.lstat(path)
+        if stat.S_ISLNK(st.st_mode):
+            # Tracked and walked paths never pass through a symlinked directory,
+            # so only the file itself can lead out of the repo.
+            path = path.resolve()
+            if not path.is_relative_to(root):
+                return None
+            st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        # O_NONBLOCK: a regular file swapped for a FIFO since the stat must not hang the open.
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as handle:
+        st = os.fstat(handle.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        head = handle.read(SYMBOL_SCAN_BYTES)
+        hasher = hashlib.sha256(head)
+        newlines = head.count(b"\n")
+        size = len(head)
+        last = head[-1:]
+        while chunk := handle.read(CHUNK_BYTES):
+            hasher.update(chunk)
+            newlines += chunk.count(b"\n")
+            size += len(chunk)
+            last = chunk[-1:]
+    binary = b"\0" in head[:BINARY_SNIFF_BYTES]
+    language = None if binary else detect_language(rel)
+    return {
+        "path": rel,
+        "size": size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": hasher.hexdigest(),
+        "language": language,
+        "binary": binary,
+        "lines": None if binary else newlines + (1 if size and last != b"\n" else 0),
+        "symbols": _symbols(language, head),
+    }
+
+
+def tracked_files(root: Path) -> tuple[str, list[str]]:
+    """("git", `git ls-files`) for a git checkout, else ("walk", every file
+    outside WALK_SKIP_DIRS)."""
+    if (root / ".git").exists():
+        import subprocess
+
+        try:
+            proc = subprocess.run(
+                ["git", "-C", str(root), "ls-files", "-z", "--cached"],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            pass
+        else:
+            paths = proc.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+            return "git", sorted({p for p in paths if p and not p.startswith(".asi/")})
+    paths = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in WALK_SKIP_DIRS]
+        base = os.path.relpath(current, root)
+        for name in files:
+            paths.append(name if base == "." else f"{base}/{name}".replace(os.sep, "/"))
+    return "walk", sorted(paths)
+
+
+def read_index(path: Path | None = None) -> dict[str, Any]:
+    path = path or index_path()
+    try:
+        data = loads(path.read_bytes())
+    except FileNotFoundError:
+        raise ValueError("No onboard index yet. Run `asi onboard index` first.") from None
+    if data.get("version") != INDEX_VERSION:
+        raise ValueError("Onboard index format changed. Run `asi onboard index` to rebuild it.")
+    return data
+
+
+def update_index(*, jobs: int = DEFAULT_JOBS) -> dict[str, Any]:
+    """Bring the index up to date; re-reads only new files and files whose size or mtime changed."""
+    if jobs < 1:
+        raise ValueError("--jobs must be >= 1.")
+    root = path_context().repo_root.resolve()
+    path = index_path()
+    try:
+        previous = {record["path"]: record for record in read_index(path)["files"]}
+    except ValueError:
+        previous = {}
+    source, paths = tracked_files(root)
+
+    records: dict[str, dict[str, Any]] = {}
+    stale = []
+    for rel in paths:
+        old = previous.get(rel)
+        if old is not None:
+            try:
+                st = os.lstat(root / rel)
+            except OSError:
+                continue
+            # Symlinks are always rescanned, so a retargeted link is re-checked
+            # against the repo root.
+            if (
+                stat.S_ISREG(st.st_mode)
+                and old["size"] == st.st_size
+                and old["mtime_ns"] == st.st_mtime_ns
+            ):
+                records[rel] = old
+                continue
+        stale.append(rel)
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(stale)))) as pool:
+        for record in pool.map(lambda rel: scan_file(root, rel), stale):
+            if record is not None:
+                records[record["path"]] = record
+
+    added = sum(1 for rel in stale if rel in records and rel not in previous)
+    updated = sum(
+        1 for rel in stale if rel in records and rel in previous and records[rel] != previous[rel]
+    )
+    removed = sum(1 for rel in previous if rel not in records)
+    files = [records[rel] for rel in sorted(records)]
+    if added or updated or removed or not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        data = {"version": INDEX_VERSION, "source": source, "files": files}
+        tmp.write_text(dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+
+    languages: dict[str, int] = {}
+    for record in files:
+        if record["language"]:
+            languages[record["language"]] = languages.get(record["language"], 0) + 1
+    return {
+        "index": str(path),
+        "source": source,
+        "files": len(files),
+        "added": added,
+        "updated": updated,
+        "removed": removed,
+        "unchanged": len(files) - added - updated,
+        "languages": dict(sorted(languages.items(), key=lambda item: (-item[1], item[0]))),
+    }
+
+
+def glob_regex(pattern: str) -> re.Pattern[str]:
+    """Path glob: `*` and `?` stay within a segment, `**` spans segments.
+
+    A pattern without `/` matches file names anywhere, as in .gitignore.
+    """
+    if "/" not in pattern:
+        pattern = f"**/{pattern}"
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+def query_index(
+    *,
+    language: str | None = None,
+    glob: str | None = None,
+    largest: int | None = None,
+    limit: int | None = None,
+) -> dict[str, Any]:
+    """Index records matching every given filter, from the index alone.
+
+    Sorted by path, or by size (largest first) with `largest`, which also
+    caps the result at that many files.
+    """
+    for name, value in (("--largest", largest), ("--limit", limit)):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be >= 1.")
+    path = index_path()
+    files = read_index(path)["files"]
+    if language:
+        wanted = language.lower()
+        files = [record for record in files if record["language"] == wanted]
+    if glob:
+        matcher = glob_regex(glob).match
+        files = [record for record in files if matcher(record["path"])]
+    matched = len(files)
+    if largest is not None:
+        files = sorted(files, key=lambda record: (-record["size"], record["path"]))[:largest]
+    if limit is not None:
+        files = files[:limit]
+    return {"index": str(path), "matched": matched, "files": files}
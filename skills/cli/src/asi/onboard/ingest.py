@@ -0,0 +1,124 @@
+"""Read onboard entrypoints into a manifest, so the agent does not open each file.
+
+Local entrypoints (paths relative to the repo root, or absolute paths inside
+it) are read in a bounded thread pool. Each readable text file yields its
+size, line count, sha256 and a head excerpt of at most `excerpt_bytes`,
+cut at a line boundary when one is in range. Files from MMAP_BYTES up are
+mapped and hashed/counted in chunks, so memory stays bounded. URLs,
+invalid paths, directories, other non-regular files (FIFOs, sockets,
+devices), files outside the repo and binaries (a NUL byte in the first
+BINARY_SNIFF_BYTES) are listed with a `skipped` reason and not read. The
+manifest has one entry per entrypoint, in input order.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from asi.util.paths import path_context
+
+
+DEFAULT_EXCERPT_BYTES = 4096
+MAX_JOBS = 8
+MMAP_BYTES = 1 << 20
+CHUNK_BYTES = 1 << 20
+BINARY_SNIFF_BYTES = 8192
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+
+
+def _excerpt(head: bytes, size: int, excerpt_bytes: int) -> tuple[str, bool]:
+    if size <= excerpt_bytes:
+        return head.decode("utf-8", errors="replace"), False
+    cut = head.rfind(b"\n")
+    head = head[: cut + 1] if cut >= 0 else head
+    # errors="ignore" only drops a multi-byte character split by the cut.
+    return head.decode("utf-8", errors="ignore"), True
+
+
+def _lines(newlines: int, size: int, last: bytes) -> int:
+    return newlines + (1 if size and last != b"\n" else 0)
+
+
+def _read_file(path: Path, excerpt_bytes: int) -> dict[str, Any]:
+    # O_NONBLOCK: a regular file swapped for a FIFO since the lstat must not hang the open.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    with os.fdopen(fd, "rb") as handle:
+        st = os.fstat(handle.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return {"skipped": "special_file"}
+        size = st.st_size
+        if size < MMAP_BYTES:
+            data = handle.read()
+            size = len(data)
+            if b"\0" in data[:BINARY_SNIFF_BYTES]:
+                return {"skipped": "binary", "size": size}
+            head = data[:excerpt_bytes]
+            digest = hashlib.sha256(data).hexdigest()
+            lines = _lines(data.count(b"\n"), size, data[-1:])
+        else:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped.find(b"\0", 0, BINARY_SNIFF_BYTES) >= 0:
+                    return {"skipped": "binary", "size": size}
+                head = mapped[:excerpt_bytes]
+                hasher = hashlib.sha256()
+                newlines = 0
+                for start in range(0, size, CHUNK_BYTES):
+                    chunk = mapped[start : start + CHUNK_BYTES]
+                    hasher.update(chunk)
+                    newlines += chunk.count(b"\n")
+                digest = hasher.hexdigest()
+                lines = _lines(newlines, size, mapped[size - 1 : size])
+    excerpt, truncated = _excerpt(head, size, excerpt_bytes)
+    return {
+        "size": size,
+        "lines": lines,
+        "sha256": digest,
+        "excerpt": excerpt,
+        "truncated": truncated,
+    }
+
+
+def ingest_entrypoint(entry: str, root: Path, excerpt_bytes: int) -> dict[str, Any]:
+    result: dict[str, Any] = {"entrypoint": entry}
+    if _URL_RE.match(entry):
+        return {**result, "skipped": "url"}
+    try:
+        path = Path(entry)
+        path = (path if path.is_absolute() else root / path).resolve()
+    except ValueError:
+        # An embedded NUL byte: no such file can exist.
+        return {**result, "skipped": "invalid_path"}
+    try:
+        result["path"] = str(path.relative_to(root))
+    except ValueError:
+        return {**result, "skipped": "outside_repo"}
+    try:
+        mode = os.lstat(path).st_mode
+        if stat.S_ISDIR(mode):
+            return {**result, "skipped": "directory"}
+        if not stat.S_ISREG(mode):
+            return {**result, "skipped": "special_file"}
+        return {**result, **_read_file(path, excerpt_bytes)}
+    except FileNotFoundError:
+        return {**result, "skipped": "missing"}
+    except OSError as exc:
+        return {**result, "skipped": "unreadable", "error": exc.strerror or str(exc)}
+
+
+def ingest_entrypoints(
+    entrypoints: list[str], *, excerpt_bytes: int = DEFAULT_EXCERPT_BYTES
+) -> list[dict[str, Any]]:
+    """Manifest entries for `entrypoints`, in input order."""
+    if not entrypoints:
+        return []
+    root = path_context().repo_root.resolve()
+    with ThreadPoolExecutor(max_workers=min(MAX_JOBS, len(entrypoints))) as pool:
+        return list(
+            pool.map(lambda entry: ingest_entrypoint(entry, root, excerpt_bytes), entrypoints)
+        )
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import json
+from typing import Any
 
+from asi.onboard.ingest import ingest_entrypoints
 from asi.onboard.schemas import parse_onboard_plan
 
 
-def run_plan(raw: str) -> dict:
+def run_plan(raw: str | dict[str, Any]) -> dict:
     plan = parse_onboard_plan(raw)
     return {
         "status": "ready",
         "message": "Onboard plan accepted. Execution is CLI-owned and deterministic.",
         "plan": plan,
+        "entrypoints": ingest_entrypoints(
+            plan.get("entrypoints", []), excerpt_bytes=plan["excerpt_bytes"]
+        ),
     }
@@ -1,35 +1,46 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from asi.util.validate import load_json, require_list, require_str
+from asi.util.schema import Validator, compile_schema
+from asi.util.validate import load_json
 
 
 def emit_onboard_schema() -> dict[str, Any]:
     return {
         "type": "object",
         "properties": {
-            "topic": {"type": "string", "minLength": 1, "description": "Short onboarding topic"},
+            "topic": {
+                "type": "string",
+                "minLength": 1,
+                "maxLength": 200,
+                "description": "Short onboarding topic",
+            },
             "entrypoints": {
                 "type": "array",
                 "items": {"type": "string"},
+                "maxItems": 200,
+                "default": [],
                 "description": "Optional entrypoints to read (paths or URLs)",
             },
+            "excerpt_bytes": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 65536,
+                "default": 4096,
+                "description": "Head excerpt budget per local entrypoint, in bytes",
+            },
         },
         "required": ["topic"],
         "additionalProperties": False,
     }
 
 
-def parse_onboard_plan(raw: str) -> dict[str, Any]:
-    data = load_json(raw)
-    topic = require_str(data, "topic", min_length=1, max_length=200)
-    entrypoints = []
-    if "entrypoints" in data:
-        entrypoints = require_list(data, "entrypoints", min_length=0, max_length=200)
-        for i, item in enumerate(entrypoints):
-            if not isinstance(item, str):
-                raise ValueError(f"entrypoints[{i}] must be a string.")
+@lru_cache(maxsize=None)
+def _validator() -> Validator:
+    return compile_schema(emit_onboard_schema())
 
-    return {"topic": topic, "entrypoints": entrypoints}
 
+def parse_onboard_plan(raw: str | dict[str, Any]) -> dict[str, Any]:
+    return _validator()(load_json(raw))
@@ -0,0 +1,70 @@
+"""Prebuilt JSON Schemas shipped as package data.
+
+The `emit_*_schema` functions stay the source of truth (validators compile
+from them); `python -m asi.schemas.build` writes their output here so the CLI
+can serve a schema without importing the creator or onboard modules. Each
+file carries `x-fingerprint`, the canonical hash of the schema without that
+key, and `manifest.json` maps kind -> fingerprint so checking a cached copy
+reads one small file. The creator run schema gets `x-artifact-model` when it
+is emitted; that block describes the caller's repo and is not fingerprinted.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from asi.util.codec import loads
+
+
+SCHEMA_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST = "manifest.json"
+FINGERPRINT_KEY = "x-fingerprint"
+# Schema kind -> file name.
+KINDS = {
+    "creator.run": "creator_run.json",
+    "creator.suggest": "creator_suggest.json",
+    "creator.apply": "creator_apply.json",
+    "onboard": "onboard.json",
+}
+
+_MANIFEST: dict[str, str] = {}
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCHEMA_DIR, name), encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _file(kind: str) -> str:
+    if kind not in KINDS:
+        raise ValueError(f"Unknown schema kind: {kind} (expected: {', '.join(KINDS)})")
+    return KINDS[kind]
+
+
+def fingerprint(kind: str) -> str:
+    _file(kind)
+    if not _MANIFEST:
+        # stdlib: a few hundred bytes do not justify importing a faster backend.
+        _MANIFEST.update(json.loads(_read(MANIFEST)))
+    return _MANIFEST[kind]
+
+
+def schema_text(kind: str) -> str:
+    """The prebuilt schema file verbatim (indented JSON, trailing newline)."""
+    return _read(_file(kind))
+
+
+def needs_runtime_fields(kind: str) -> bool:
+    """True when load_schema adds fields the prebuilt file does not hold."""
+    return kind == "creator.run"
+
+
+def load_schema(kind: str) -> dict[str, Any]:
+    """The schema as emitted: prebuilt file plus any runtime fields."""
+    schema = loads(schema_text(kind))
+    if kind == "creator.run":
+        from asi.creator.model import artifact_model
+
+        schema = {"type": schema.pop("type"), "x-artifact-model": artifact_model(), **schema}
+    return schema
@@ -0,0 +1,74 @@
+"""Regenerate the prebuilt schema files from the emit functions.
+
+    PYTHONPATH=skills/cli/src python3 -m asi.schemas.build [--check]
+
+`--check` writes nothing and exits 1 when a file is missing or stale.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+from asi.creator.schemas import (
+    creator_run_plan_schema,
+    emit_creator_apply_schema,
+    emit_creator_suggest_schema,
+)
+from asi.onboard.schemas import emit_onboard_schema
+from asi.schemas import FINGERPRINT_KEY, KINDS, MANIFEST, SCHEMA_DIR
+from asi.util.hashing import canonical_hash
+
+
+def _sources() -> dict[str, dict[str, Any]]:
+    # The run schema is stored without x-artifact-model; load_schema adds it.
+    return {
+        "creator.run": creator_run_plan_schema(),
+        "creator.suggest": emit_creator_suggest_schema(),
+        "creator.apply": emit_creator_apply_schema(),
+        "onboard": emit_onboard_schema(),
+    }
+
+
+def build() -> dict[str, str]:
+    """File name -> contents for every prebuilt schema and the manifest."""
+    # Always the stdlib encoder, so the files do not depend on ASI_JSON_BACKEND.
+    files: dict[str, str] = {}
+    manifest: dict[str, str] = {}
+    for kind, schema in _sources().items():
+        manifest[kind] = canonical_hash(schema)
+        stamped = {**schema, FINGERPRINT_KEY: manifest[kind]}
+        files[KINDS[kind]] = json.dumps(stamped, indent=2) + "\n"
+    files[MANIFEST] = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args(argv)
+
+    stale = []
+    for name, text in build().items():
+        path = os.path.join(SCHEMA_DIR, name)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                current = handle.read()
+        except FileNotFoundError:
+            current = None
+        if current == text:
+            continue
+        stale.append(name)
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+    if stale:
+        verb = "stale" if args.check else "wrote"
+        print(f"{verb}: {', '.join(stale)}", file=sys.stderr)
+    return 1 if stale and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
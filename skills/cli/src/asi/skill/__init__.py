@@ -0,0 +1 @@
+"""Skill reference modules."""
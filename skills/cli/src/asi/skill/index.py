@@ -0,0 +1,250 @@
+"""Persistent reference index for a skill directory.
+
+One JSON file per skill under `cache_dir("skill-index")` records, for each
+`references/NN_*.md`, its size, mtime, frontmatter description and token
+estimate, plus its `#`/`##` sections as byte ranges, so one section can be
+read with a seek. Entries are reused while a file keeps its size and mtime,
+so a rebuild only re-reads the references that changed.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from asi.util.cache import cache_dir
+from asi.util.codec import JSONDecodeError, dumps, loads
+from asi.util.hashing import canonical_hash
+
+
+INDEX_VERSION = 3
+# Rough English-prose ratio; estimates are for budgeting, not billing.
+BYTES_PER_TOKEN = 4
+# `description:` frontmatter is looked for in the first lines only.
+DESCRIPTION_LINES = 20
+DESCRIPTION_LINE_CHARS = 4096
+# Deeper headings stay inside their `##` section.
+SECTION_LEVELS = 2
+SECTION_DESCRIPTION_CHARS = 120
+
+
+def estimate_tokens(size: int) -> int:
+    return -(-size // BYTES_PER_TOKEN)
+
+
+def reference_files(skill_dir: Path) -> list[Path]:
+    """Numbered references in router order (00_ROUTER.md excluded)."""
+    files = sorted((skill_dir / "references").glob("[0-9][0-9]_*.md"))
+    return [f for f in files if f.name != "00_ROUTER.md"]
+
+
+def _description(line: str) -> str | None:
+    if line.startswith("description:"):
+        return line.split("description:", 1)[1].strip()
+    return None
+
+
+def read_description(path: Path) -> str:
+    with path.open(encoding="utf-8") as handle:
+        for _ in range(DESCRIPTION_LINES):
+            line = handle.readline(DESCRIPTION_LINE_CHARS)
+            if not line:
+                break
+            found = _description(line)
+            if found is not None:
+                return found
+    return ""
+
+
+def _slug(title: str) -> str:
+    return "-".join("".join(ch if ch.isalnum() else " " for ch in title.lower()).split())
+
+
+def _heading(line: bytes) -> tuple[int, str] | None:
+    level = len(line) - len(line.lstrip(b"#"))
+    if not 1 <= level <= SECTION_LEVELS or line[level : level + 1] not in (b" ", b"\t"):
+        return None
+    return level, line[level:].strip().decode("utf-8")
+
+
+def _summary(lines: list[bytes]) -> str:
+    """First prose line of a section body, shortened."""
+    fenced = False
+    for raw in lines:
+        line = raw.strip().decode("utf-8")
+        if line.startswith(("```", "~~~")):
+            fenced = not fenced
+        elif line and not fenced and not line.startswith("#"):
+            limit = SECTION_DESCRIPTION_CHARS
+            return line if len(line) <= limit else line[: limit - 1].rstrip() + "…"
+    return ""
+
+
+def scan_sections(data: bytes, reference: str) -> list[dict[str, Any]]:
+    """`#`/`##` sections of a reference as byte ranges, in file order.
+
+    A section runs from its heading to the next heading of the same or a
+    higher level, so a `#` section contains its `##` sections. Headings in
+    YAML frontmatter and fenced code blocks are ignored. Ids are
+    `<REFERENCE>/<slug>`, suffixed `-2`, `-3`... when a slug repeats.
+    """
+    lines = data.splitlines(keepends=True)
+    starts = []
+    pos = 0
+    for line in lines:
+        starts.append(pos)
+        pos += len(line)
+    first = 0
+    if lines and lines[0].rstrip() == b"---":
+        for i in range(1, len(lines)):
+            if lines[i].rstrip() == b"---":
+                first = i + 1
+                break
+    heads = []
+    fenced = False
+    for i in range(first, len(lines)):
+        stripped = lines[i].lstrip()
+        if stripped.startswith((b"```", b"~~~")):
+            fenced = not fenced
+        elif not fenced:
+            heading = _heading(lines[i])
+            if heading is not None:
+                heads.append((i, *heading))
+
+    sections = []
+    seen: dict[str, int] = {}
+    for n, (i, level, title) in enumerate(heads):
+        end = next((j for j, lvl, _ in heads[n + 1 :] if lvl <= level), len(lines))
+        slug = _slug(title) or "section"
+        seen[slug] = seen.get(slug, 0) + 1
+        if seen[slug] > 1:
+            slug = f"{slug}-{seen[slug]}"
+        offset = starts[i]
+        length = (starts[end] if end < len(lines) else len(data)) - offset
+        sections.append(
+            {
+                "id": f"{reference}/{slug}",
+                "title": title,
+                "level": level,
+                "offset": offset,
+                "length": length,
+                "tokens": estimate_tokens(length),
+                "description": _summary(lines[i + 1 : end]),
+            }
+        )
+    return sections
+
+
+def index_path(skill_dir: Path) -> Path:
+    return cache_dir("skill-index") / f"{canonical_hash(str(skill_dir))[:24]}.json"
+
+
+def _scan(path: Path) -> dict[str, Any]:
+    with path.open("rb") as handle:
+        st = os.fstat(handle.fileno())
+        data = handle.read()
+    name = path.stem.split("_", 1)[-1]
+    description = ""
+    for raw in data.splitlines()[:DESCRIPTION_LINES]:
+        found = _description(raw.decode("utf-8")[:DESCRIPTION_LINE_CHARS])
+        if found is not None:
+            description = found
+            break
+    return {
+        "file": path.name,
+        "name": name,
+        # Stat and content come from one open file, so they always agree.
+        "size": len(data),
+        "mtime_ns": st.st_mtime_ns,
+        "description": description,
+        "tokens": estimate_tokens(len(data)),
+        "sections": scan_sections(data, name),
+    }
+
+
+def _read_stored(path: Path, skill_dir: Path) -> dict[str, dict[str, Any]]:
+    try:
+        stored = loads(path.read_bytes())
+    except (OSError, JSONDecodeError):
+        return {}
+    if stored.get("version") != INDEX_VERSION or stored.get("skill_dir") != str(skill_dir):
+        return {}
+    return {entry["file"]: entry for entry in stored.get("references", [])}
+
+
+def _store(path: Path, skill_dir: Path, entries: list[dict[str, Any]]) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    data = {"version": INDEX_VERSION, "skill_dir": str(skill_dir), "references": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unsorted: entries read back from the index keep their scan order.
+        tmp.write_text(dumps(data, indent=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # The index is a cache: an unwritable cache dir only costs a rescan.
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_index(skill_dir: Path) -> list[dict[str, Any]]:
+    """Index entries in router order, rescanning only changed references."""
+    path = index_path(skill_dir)
+    stored = _read_stored(path, skill_dir)
+    entries = []
+    changed = False
+    for ref in reference_files(skill_dir):
+        st = ref.stat()
+        entry = stored.get(ref.name)
+        if entry is None or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+            entry = _scan(ref)
+            changed = True
+        entries.append(entry)
+    if changed or len(entries) != len(stored):
+        _store(path, skill_dir, entries)
+    return entries
+
+
+def find_section(entries: list[dict[str, Any]], name: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """(reference entry, section) for a section id, or a unique id/title/slug match.
+
+    Exact ids win; otherwise matching ignores case. Raises ValueError when
+    nothing or more than one section matches.
+    """
+    wanted = name.strip().lower()
+    exact = []
+    loose = []
+    for entry in entries:
+        for section in entry["sections"]:
+            if section["id"] == name:
+                exact.append((entry, section))
+            elif wanted in (
+                section["id"].lower(),
+                section["title"].lower(),
+                section["id"].split("/", 1)[1],
+            ):
+                loose.append((entry, section))
+    matches = exact or loose
+    if len(matches) == 1:
+        return matches[0]
+    if not matches:
+        raise ValueError(f"Unknown section: {name} (list ids with `asi skill index`)")
+    ids = ", ".join(section["id"] for _, section in matches)
+    raise ValueError(f"Ambiguous section: {name} (matches: {ids})")
+
+
+def read_section(skill_dir: Path, name: str) -> bytes:
+    """Bytes of one section, read with a seek into its reference file."""
+    entry, section = find_section(load_index(skill_dir), name)
+    path = skill_dir / "references" / entry["file"]
+    with path.open("rb") as handle:
+        st = os.fstat(handle.fileno())
+        if st.st_size != entry["size"] or st.st_mtime_ns != entry["mtime_ns"]:
+            # Changed after the index was checked: find the section in what is there now.
+            data = handle.read()
+            fresh = {**entry, "sections": scan_sections(data, entry["name"])}
+            _, section = find_section([fresh], name)
+            return data[section["offset"] : section["offset"] + section["length"]]
+        handle.seek(section["offset"])
+        return handle.read(section["length"])
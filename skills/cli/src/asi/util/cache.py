@@ -0,0 +1,22 @@
+"""Per-user cache for derived CLI output that is safe to delete at any time."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+CACHE_ENV = "ASI_CACHE_DIR"
+
+
+def cache_dir(*parts: str) -> Path:
+    """$ASI_CACHE_DIR, else $XDG_CACHE_HOME/asi, else ~/.cache/asi; joined with `parts`.
+
+    Not created here: writers create it and treat OSError as "no cache".
+    """
+    base = os.environ.get(CACHE_ENV)
+    if base:
+        root = Path(base).expanduser()
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        root = (Path(xdg).expanduser() if xdg else Path.home() / ".cache") / "asi"
+    return root.joinpath(*parts)
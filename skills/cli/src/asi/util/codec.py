@@ -0,0 +1,135 @@
+"""JSON codec shared by every reader and writer in the CLI.
+
+The backend is configuration: $ASI_JSON_BACKEND = auto (default) | stdlib |
+orjson, where `auto` picks orjson when it is installed. Both backends sort
+keys when asked, indent with two spaces and otherwise write without spaces,
+so output is deterministic for a given backend; only non-ASCII escaping
+differs between them, and either backend reads what the other wrote. Values
+orjson cannot represent the way stdlib does (non-str keys and ints beyond 64
+bits on encode; ints beyond 64 bits, which orjson would turn into floats, and
+NaN/Infinity on decode) go through stdlib, so both backends produce the same
+Python values. Content hashes never depend on the backend: they go through
+`asi.util.hashing`, which always uses the stdlib encoder.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Callable
+from typing import Any
+
+
+BACKEND_ENV = "ASI_JSON_BACKEND"
+BACKENDS = ("auto", "stdlib", "orjson")
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+
+class Codec:
+    # A plain class: dataclasses costs milliseconds of import on every command.
+    __slots__ = ("name", "loads", "dumps")
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[str | bytes], Any],
+        dumps: Callable[[Any, bool, bool], str],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+
+def _stdlib_dumps(value: Any, indent: bool, sort_keys: bool) -> str:
+    if indent:
+        return json.dumps(value, indent=2, sort_keys=sort_keys)
+    return json.dumps(value, separators=(",", ":"), sort_keys=sort_keys)
+
+
+STDLIB = Codec("stdlib", json.loads, _stdlib_dumps)
+
+
+def _orjson_codec() -> Codec | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    indent_opt, sort_opt = orjson.OPT_INDENT_2, orjson.OPT_SORT_KEYS
+    # orjson turns ints outside [-2**63, 2**64 - 1] into floats, and only runs
+    # of 19+ digits can be outside. Runs inside strings or fractions are
+    # checked too, which at worst costs a stdlib parse of that document.
+    digit_runs = re.compile(r"-?[0-9]{19,}").finditer
+    digit_runs_bytes = re.compile(rb"-?[0-9]{19,}").finditer
+    low, high = -(2**63), 2**64 - 1
+
+    def beyond_64_bits(data: str | bytes) -> bool:
+        runs = digit_runs_bytes if isinstance(data, (bytes, bytearray)) else digit_runs
+        for match in runs(data):
+            digits = match.group()
+            # More than a sign and 20 digits never fits; int() also caps its input length.
+            if len(digits) > 21 or not low <= int(digits) <= high:
+                return True
+        return False
+
+    def loads(data: str | bytes) -> Any:
+        if beyond_64_bits(data):
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity parse under stdlib; really invalid input gets stdlib's error.
+            return json.loads(data)
+
+    def dumps(value: Any, indent: bool, sort_keys: bool) -> str:
+        option = (indent_opt if indent else 0) | (sort_opt if sort_keys else 0)
+        try:
+            return orjson.dumps(value, option=option).decode("utf-8")
+        except TypeError:
+            # Non-str keys, ints beyond 64 bits: values only stdlib can encode.
+            return _stdlib_dumps(value, indent, sort_keys)
+
+    return Codec("orjson", loads, dumps)
+
+
+_CODECS: dict[str, Codec] = {}
+
+
+def _setting() -> str:
+    setting = os.environ.get(BACKEND_ENV, "") or "auto"
+    if setting not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {setting} (expected: {', '.join(BACKENDS)})")
+    return setting
+
+
+def check_backend() -> None:
+    """Raise ValueError for an unusable $ASI_JSON_BACKEND without importing the backend."""
+    if _setting() == "orjson":
+        from importlib.util import find_spec
+
+        if find_spec("orjson") is None:
+            raise ValueError(f"{BACKEND_ENV}=orjson but orjson is not installed")
+
+
+def codec() -> Codec:
+    """Active codec for $ASI_JSON_BACKEND, resolved once per setting."""
+    setting = _setting()
+    selected = _CODECS.get(setting)
+    if selected is None:
+        selected = STDLIB if setting == "stdlib" else _orjson_codec()
+        if selected is None:
+            if setting == "orjson":
+                raise ValueError(f"{BACKEND_ENV}=orjson but orjson is not installed")
+            selected = STDLIB
+        _CODECS[setting] = selected
+    return selected
+
+
+def loads(data: str | bytes) -> Any:
+    return codec().loads(data)
+
+
+def dumps(value: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode `value`; `indent` means two spaces, as everywhere in .asi/ and CLI output."""
+    return codec().dumps(value, indent, sort_keys)
@@ -0,0 +1,157 @@
+"""Canonical JSON hashing.
+
+`canonical_hash(value)` equals
+`sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()`
+byte for byte, so ids derived from it stay stable. Differences from the
+one-liner:
+
+- the sort_keys encoder (the C one when available) is built once per process
+  instead of per call;
+- lists of at least STREAM_ITEMS items (and the dicts holding them) are fed
+  to the hash STREAM_ITEMS members at a time, so a large ask set is never
+  materialized as one string plus a bytes copy; smaller values take a single
+  C encode, which is faster than any Python-level walk;
+- values built by `freeze` keep their encoding and digest, so hashing a
+  constant again costs a dict lookup. `freeze` returns a read-only copy
+  (dicts that raise TypeError on mutation, lists turned into tuples), so the
+  cached digest cannot go stale.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+# Lists shorter than this are encoded in one piece.
+STREAM_ITEMS = 64
+
+_ENCODERS: dict[Callable[[Any], Any] | None, Callable[[Any], str]] = {}
+# id -> (object, encoded bytes, hex digest). Holding the object keeps its id
+# from being reused while the entry exists.
+_FROZEN: dict[int, tuple[Any, bytes, str]] = {}
+
+
+def _encoder(default: Callable[[Any], Any] | None) -> Callable[[Any], str]:
+    encode = _ENCODERS.get(default)
+    if encode is None:
+        encoder = json.JSONEncoder(sort_keys=True, default=default)
+        if c_make_encoder is None:
+            encode = encoder.encode
+        else:
+            # The C encoder JSONEncoder.encode builds per call, built once.
+            # No circular-reference markers: hashed values come from JSON.
+            iterencode = c_make_encoder(
+                None, encoder.default, encode_basestring_ascii, None, ": ", ", ", True, False, True
+            )
+
+            def encode(value: Any) -> str:
+                return "".join(iterencode(value, 0))
+
+        _ENCODERS[default] = encode
+    return encode
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation; encodes and compares like the dict it copies."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("frozen JSON value is read-only; copy it first")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (dict, (thaw(self),))
+
+
+def _frozen_copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict({key: _frozen_copy(member) for key, member in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen_copy(member) for member in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value (FrozenDict -> dict, tuple -> list)."""
+    if isinstance(value, dict):
+        return {key: thaw(member) for key, member in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(member) for member in value]
+    return value
+
+
+def freeze(value: T) -> T:
+    """Read-only deep copy of a JSON value, with its encoding and digest cached.
+
+    Tuples encode as JSON arrays, so the digest equals the original value's.
+    """
+    frozen = _frozen_copy(value)
+    encoded = _encoder(None)(frozen).encode("utf-8")
+    _FROZEN[id(frozen)] = (frozen, encoded, hashlib.sha256(encoded).hexdigest())
+    return frozen
+
+
+def _frozen(value: Any) -> tuple[Any, bytes, str] | None:
+    entry = _FROZEN.get(id(value))
+    return entry if entry is not None and entry[0] is value else None
+
+
+def _streams(value: Any) -> bool:
+    kind = type(value)
+    if kind is list or kind is tuple:
+        return len(value) >= STREAM_ITEMS
+    if kind is not dict:
+        return False
+    for member in value.values():
+        if (type(member) is list or type(member) is tuple) and len(member) >= STREAM_ITEMS:
+            # Exact str keys only: json orders other key types before
+            # stringifying them, which the C encoder does for the whole dict.
+            return all(type(k) is str for k in value)
+    return False
+
+
+def _feed(update: Callable[[bytes], None], value: Any, encode: Callable[[Any], str]) -> None:
+    entry = _frozen(value)
+    if entry is not None:
+        update(entry[1])
+    elif not _streams(value):
+        update(encode(value).encode("utf-8"))
+    elif type(value) is dict:
+        separator = b"{"
+        for key in sorted(value):
+            update(separator + encode_basestring_ascii(key).encode("ascii") + b": ")
+            _feed(update, value[key], encode)
+            separator = b", "
+        update(b"}")
+    else:
+        # Encode STREAM_ITEMS members per C call; strip each chunk's brackets.
+        separator = b"["
+        for start in range(0, len(value), STREAM_ITEMS):
+            chunk = encode(list(value[start : start + STREAM_ITEMS]))
+            update(separator + chunk[1:-1].encode("utf-8"))
+            separator = b", "
+        update(b"]")
+
+
+def canonical_hash(value: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """sha256 hex digest of `json.dumps(value, sort_keys=True, default=default)`."""
+    entry = _frozen(value)
+    if entry is not None:
+        return entry[2]
+    digest = hashlib.sha256()
+    _feed(digest.update, value, _encoder(default))
+    return digest.hexdigest()
@@ -1,16 +1,65 @@
+"""Utility helpers for CLI."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from asi.util.codec import dumps, loads
+
 
 def read_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_text(encoding="utf-8"))
 
 
 def write_json(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    path.write_text(dumps(data, indent=True, sort_keys=True), encoding="utf-8")
+
+
+def error_payload(
+    message: str,
+    schema_cmd: str | None = None,
+    errors: list[dict[str, str]] | None = None,
+) -> dict[str, Any]:
+    """Error object shared by CLI output and the serve worker.
+
+    `errors` carries the per-field violations of a ValidationErrors.
+    """
+    payload: dict[str, Any] = {"error": message}
+    if schema_cmd:
+        payload["schema_cmd"] = schema_cmd
+    if errors:
+        payload["errors"] = errors
+    return payload
+
+
+OUTPUT_FORMATS = ("pretty", "compact", "ndjson")
+
+
+def project_fields(result: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    """Keep only the named top-level fields (in `fields` order); absent ones are skipped."""
+    if not fields:
+        return result
+    return {name: result[name] for name in fields if name in result}
+
+
+def render(result: dict[str, Any], fmt: str = "pretty") -> str:
+    """Text for a command result; `fmt` is one of OUTPUT_FORMATS.
+
+    `pretty` is indented, `compact` is one line. `ndjson` is one line for the
+    result without its list fields, then one `{"<field>": item}` line per item
+    of each list field, so consumers can stream long lists.
+    """
+    if fmt == "pretty":
+        return dumps(result, indent=True)
+    if fmt == "compact":
+        return dumps(result)
+    if fmt != "ndjson":
+        raise ValueError(f"Unknown output format: {fmt} (expected: {', '.join(OUTPUT_FORMATS)})")
+    lists = [name for name, value in result.items() if isinstance(value, list)]
+    lines = [dumps({k: v for k, v in result.items() if k not in lists})]
+    for name in lists:
+        lines.extend(dumps({name: item}) for item in result[name])
+    return "\n".join(lines)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
 
-def repo_root(start: Path | None = None) -> Path:
-    """Resolve repo root by walking up from start until .git or pyproject.toml."""
-    current = (start or Path.cwd()).resolve()
+REPO_ROOT_ENV = "ASI_REPO_ROOT"
+
+
+def _find_repo_root(start: Path) -> Path:
+    """Walk up from start until .git or pyproject.toml."""
+    current = start.resolve()
     for _ in range(20):
         if (current / ".git").exists():
             return current
@@ -14,7 +19,52 @@ def repo_root(start: Path | None = None) -> Path:
         if current.parent == current:
             break
         current = current.parent
-    return (start or Path.cwd()).resolve()
+    return start.resolve()
+
+
+@dataclass(frozen=True)
+class PathContext:
+    """Resolved repo root and the `.asi` artifact locations derived from it."""
+
+    repo_root: Path
+
+    @property
+    def asi_root(self) -> Path:
+        return self.repo_root / ".asi"
+
+    @property
+    def creator_root(self) -> Path:
+        return self.asi_root / "creator"
+
+
+_CONTEXTS: dict[tuple[str, str], PathContext] = {}
+
+
+def path_context() -> PathContext:
+    """Process-wide path context: $ASI_REPO_ROOT, else the repo root above cwd.
+
+    Resolved once per (override, cwd) pair, so repeated path lookups in one
+    command do not walk the filesystem again.
+    """
+    override = os.environ.get(REPO_ROOT_ENV, "")
+    cwd = os.getcwd()
+    key = (override, cwd)
+    ctx = _CONTEXTS.get(key)
+    if ctx is None:
+        if override:
+            root = Path(override).expanduser()
+            root = (root if root.is_absolute() else Path(cwd) / root).resolve()
+        else:
+            root = _find_repo_root(Path(cwd))
+        ctx = _CONTEXTS[key] = PathContext(root)
+    return ctx
+
+
+def repo_root(start: Path | None = None) -> Path:
+    """Resolve repo root; without `start`, uses the cached process path context."""
+    if start is None:
+        return path_context().repo_root
+    return _find_repo_root(start)
 
 
 def ensure_dir(path: Path) -> None:
@@ -0,0 +1,403 @@
+"""Compile the JSON Schemas this CLI emits into validators.
+
+Supports the subset the emitted schemas use: type (single or list), enum,
+default, minLength/maxLength/pattern, minimum/maximum, minItems/maxItems/items,
+properties/required. Annotation keywords (description, x-*) are ignored, and
+so is `additionalProperties`: as with the hand-written parsers these replaced,
+undeclared fields are dropped rather than rejected. Validators raise
+ValidationErrors (a ValueError) with `Field '<name>' ...` style messages and
+return the validated value; objects come back as new dicts holding the
+declared properties plus defaults.
+
+Each schema compiles once into two closure trees (regexes precompiled,
+keywords resolved up front). The fast tree is specialized per node and only
+accepts valid input; on any failure the reporting tree reruns to say where and
+why, and it is the only tree used when collecting every error.
+"""
+from __future__ import annotations
+
+import copy
+import re
+from collections.abc import Callable
+from typing import Any
+
+from asi.util.validate import ErrorCollector, ValidationErrors
+
+
+Validator = Callable[..., Any]
+_Check = Callable[[Any, "list[_Invalid] | None"], Any]
+
+_MISSING = object()
+_ABSENT = object()
+
+_PY_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+_TYPE_NAMES = {
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "a boolean",
+    "array": "a list",
+    "object": "an object",
+    "null": "null",
+}
+
+
+class _Invalid(Exception):
+    """A validation failure at a location (`at`: property names / item indexes)."""
+
+    def __init__(
+        self,
+        text: str,
+        at: tuple[str | int, ...],
+        *,
+        named: bool = True,
+        scalar: bool = True,
+    ) -> None:
+        super().__init__(text)
+        self.text = text
+        self.at = at
+        # named: message reads "<subject> <text>"; otherwise text stands alone.
+        self.named = named
+        self.scalar = scalar
+
+    def path(self) -> str:
+        return format_path(self.at)
+
+    def message(self) -> str:
+        if not self.named:
+            return self.text.replace("{path}", self.path())
+        # Scalar fields are named by key; objects and list items by full path.
+        if self.scalar and self.at and isinstance(self.at[-1], str):
+            return f"Field '{self.at[-1]}' {self.text}"
+        return f"{self.path()} {self.text}"
+
+
+def format_path(at: tuple[str | int, ...]) -> str:
+    """`("suggestions", 1, "options")` -> `suggestions[1].options`."""
+    out = ""
+    for part in at:
+        out += f"[{part}]" if isinstance(part, int) else (f".{part}" if out else part)
+    return out
+
+
+def _types(schema: dict[str, Any]) -> tuple[str, ...]:
+    raw = schema.get("type")
+    types = () if raw is None else (raw,) if isinstance(raw, str) else tuple(raw)
+    unknown = [t for t in types if t not in _PY_TYPES]
+    if unknown:
+        raise ValueError(f"Unsupported schema type: {unknown[0]}")
+    return types
+
+
+def _fresh(default: Any) -> Any:
+    # Only container defaults are copied per use; scalars are shared.
+    return copy.deepcopy(default) if default.__class__ in (dict, list) else default
+
+
+class _Fresh:
+    """A container default in the fast tree, copied for every use."""
+
+    __slots__ = ("default",)
+
+    def __init__(self, default: Any) -> None:
+        self.default = default
+
+    def __call__(self) -> Any:
+        return copy.deepcopy(self.default)
+
+
+def _checker(schema: dict[str, Any]) -> _Check:
+    """Closure tree that validates, normalizes and reports failures.
+
+    With `errors` None the first failure is raised; otherwise every failure is
+    appended and validation continues into sibling fields and items (the
+    returned value is then meaningless). A failure's location is relative to
+    the node that raised it; each enclosing object or list prepends its key on
+    the way out, so valid input never pays for building paths.
+    """
+    types = _types(schema)
+    py_types = tuple({t for name in types for t in _PY_TYPES[name]}) if types else None
+    # isinstance(True, int): bools pass only where "boolean" is allowed.
+    no_bool = "boolean" not in types and bool({"integer", "number"} & set(types))
+    scalar = "object" not in types
+    type_text = "must be " + " or ".join(_TYPE_NAMES[t] for t in types) + "."
+    allowed = list(schema["enum"]) if "enum" in schema else None
+    min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]).match if "pattern" in schema else None
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+    item_node = _checker(schema["items"]) if "items" in schema else None
+    required = set(schema.get("required", ()))
+    properties = [
+        (name, _checker(sub), name in required, sub.get("default", _MISSING))
+        for name, sub in schema.get("properties", {}).items()
+    ]
+    # Objects are rebuilt from their declared properties (plus defaults) only
+    # when the schema declares any; otherwise they pass through as given.
+    rebuild = bool(properties)
+    string_bounds = min_length is not None or max_length is not None or pattern is not None
+    number_bounds = minimum is not None or maximum is not None
+    item_bounds = min_items is not None or max_items is not None
+
+    def collect(child: _Check, value: Any, key: str | int, errors: list[_Invalid]) -> Any:
+        found: list[_Invalid] = []
+        result = child(value, found)
+        for exc in found:
+            exc.at = (key, *exc.at)
+        errors.extend(found)
+        return result
+
+    def build_object(value: dict[str, Any], errors: list[_Invalid] | None) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if errors is None:
+            name = None
+            try:
+                for name, prop_node, is_required, default in properties:
+                    if name in value:
+                        out[name] = prop_node(value[name], None)
+                    elif is_required:
+                        raise _Invalid(f"Missing required field: {name}", (), named=False)
+                    elif default is not _MISSING:
+                        out[name] = _fresh(default)
+            except _Invalid as exc:
+                exc.at = (name, *exc.at)
+                raise
+        else:
+            for name, prop_node, is_required, default in properties:
+                if name in value:
+                    out[name] = collect(prop_node, value[name], name, errors)
+                elif is_required:
+                    errors.append(_Invalid(f"Missing required field: {name}", (name,), named=False))
+                elif default is not _MISSING:
+                    out[name] = _fresh(default)
+        return out
+
+    def build_list(value: list[Any], errors: list[_Invalid] | None) -> list[Any]:
+        if errors is not None:
+            return [collect(item_node, item, i, errors) for i, item in enumerate(value)]
+        out = []
+        i = 0
+        try:
+            for i, item in enumerate(value):
+                out.append(item_node(item, None))
+        except _Invalid as exc:
+            exc.at = (i, *exc.at)
+            raise
+        return out
+
+    def node(value: Any, errors: list[_Invalid] | None) -> Any:
+        # One if/elif chain: the first failing keyword is this node's failure.
+        text = None
+        if py_types is not None and (
+            not isinstance(value, py_types) or (no_bool and value.__class__ is bool)
+        ):
+            text = type_text
+        elif allowed is not None and value not in allowed:
+            text = "must be one of: " + ", ".join(str(a) for a in allowed)
+        elif string_bounds and isinstance(value, str):
+            if min_length is not None and len(value) < min_length:
+                text = f"must be at least {min_length} characters."
+            elif max_length is not None and len(value) > max_length:
+                text = f"must be at most {max_length} characters."
+            elif pattern is not None and not pattern(value):
+                text = "does not match required pattern."
+        elif number_bounds and isinstance(value, (int, float)) and value.__class__ is not bool:
+            if minimum is not None and value < minimum:
+                text = f"must be >= {minimum}."
+            elif maximum is not None and value > maximum:
+                text = f"must be <= {maximum}."
+        elif item_bounds and isinstance(value, list):
+            if min_items is not None and len(value) < min_items:
+                text = f"must have at least {min_items} items."
+            elif max_items is not None and len(value) > max_items:
+                text = f"must have at most {max_items} items."
+        if text is not None:
+            exc = _Invalid(text, (), scalar=scalar)
+            if errors is None:
+                raise exc
+            errors.append(exc)
+            if text is type_text:
+                return value
+        if item_node is not None and isinstance(value, list):
+            return build_list(value, errors)
+        if rebuild and isinstance(value, dict):
+            return build_object(value, errors)
+        return value
+
+    return node
+
+
+class _Reject(Exception):
+    """Raised by the fast tree; the reporting tree then finds the failure."""
+
+
+def _leaf(schema: dict[str, Any]) -> tuple[type | None, Any, Any]:
+    """(class, low, high) for a plain bounded string, integer or boolean,
+    checked as `low <= (len(v) if class is str else v) <= high`; class is
+    None for every other schema."""
+    if "enum" in schema or "pattern" in schema:
+        return None, None, None
+    types = _types(schema)
+    if types == ("string",):
+        return str, schema.get("minLength", 0), schema.get("maxLength", float("inf"))
+    if types == ("integer",):
+        return int, schema.get("minimum", float("-inf")), schema.get("maximum", float("inf"))
+    if types == ("boolean",):
+        return bool, False, True
+    return None, None, None
+
+
+def _fast(schema: dict[str, Any]) -> Callable[[Any], Any]:
+    """Closure that validates and normalizes valid input, specialized per node.
+
+    It raises _Reject (or _Invalid from a fallback node) on anything else
+    without saying where; exact class checks keep the common case cheap and
+    send subclasses to the reporting tree, which accepts them.
+    """
+    types = _types(schema)
+    allowed = tuple(schema["enum"]) if "enum" in schema else None
+    if types == ("object",) and schema.get("properties") and allowed is None:
+        required = set(schema.get("required", ()))
+        # (name, class, low, high, fill): plain scalars are checked inline,
+        # saving a call each; anything else has class None and its fast
+        # closure in `low`. `fill` is _MISSING when required, _ABSENT when
+        # optional without a default, else the default (a _Fresh for
+        # containers, so the scalar case costs one identity check).
+        properties = []
+        for name, sub in schema["properties"].items():
+            cls, low, high = _leaf(sub)
+            if cls is None:
+                low = _fast(sub)
+            fill = _MISSING if name in required else sub.get("default", _ABSENT)
+            if fill.__class__ in (dict, list):
+                fill = _Fresh(fill)
+            properties.append((name, cls, low, high, fill))
+
+        def fast_object(value: Any) -> dict[str, Any]:
+            if value.__class__ is not dict:
+                raise _Reject
+            out = {}
+            for name, cls, low, high, fill in properties:
+                if name in value:
+                    item = value[name]
+                    if item.__class__ is cls and low <= (len(item) if cls is str else item) <= high:
+                        out[name] = item
+                    elif cls is None:
+                        out[name] = low(item)
+                    else:
+                        raise _Reject
+                elif fill is _MISSING:
+                    raise _Reject
+                elif fill is not _ABSENT:
+                    out[name] = fill() if fill.__class__ is _Fresh else fill
+            return out
+
+        return fast_object
+
+    if types == ("array",) and allowed is None:
+        low, high = schema.get("minItems", 0), schema.get("maxItems", float("inf"))
+        item = _fast(schema["items"]) if "items" in schema else None
+
+        def fast_array(value: Any) -> list[Any]:
+            if value.__class__ is not list or not low <= len(value) <= high:
+                raise _Reject
+            return value if item is None else list(map(item, value))
+
+        return fast_array
+
+    if types == ("string",):
+        low, high = schema.get("minLength", 0), schema.get("maxLength", float("inf"))
+        pattern = re.compile(schema["pattern"]).match if "pattern" in schema else None
+        if allowed is None and pattern is None:
+
+            def fast_string(value: Any) -> str:
+                if value.__class__ is str and low <= len(value) <= high:
+                    return value
+                raise _Reject
+
+            return fast_string
+
+        def fast_constrained_string(value: Any) -> str:
+            if (
+                value.__class__ is str
+                and low <= len(value) <= high
+                and (allowed is None or value in allowed)
+                and (pattern is None or pattern(value))
+            ):
+                return value
+            raise _Reject
+
+        return fast_constrained_string
+
+    if types == ("integer",) and allowed is None:
+        low, high = schema.get("minimum", float("-inf")), schema.get("maximum", float("inf"))
+
+        def fast_integer(value: Any) -> int:
+            if value.__class__ is int and low <= value <= high:
+                return value
+            raise _Reject
+
+        return fast_integer
+
+    if types == ("boolean",) and allowed is None:
+
+        def fast_boolean(value: Any) -> bool:
+            if value.__class__ is bool:
+                return value
+            raise _Reject
+
+        return fast_boolean
+
+    # Anything else (unions, numbers, enums on other types, untyped) goes
+    # through the reporting node in first-error mode.
+    check = _checker(schema)
+
+    def fast_fallback(value: Any) -> Any:
+        return check(value, None)
+
+    return fast_fallback
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """Compile `schema` once; the returned callable validates and normalizes input.
+
+    Call it as `validate(value, all_errors=False, collector=None)`. Failures
+    raise ValidationErrors; with `all_errors` it lists every violation,
+    otherwise just the first. Given an all-errors `collector`, violations are
+    recorded there instead and the partially validated value is returned, so
+    the caller can keep checking what did validate.
+    """
+    check = _checker(schema)
+    fast = _fast(schema)
+
+    def validate(
+        value: Any, *, all_errors: bool = False, collector: ErrorCollector | None = None
+    ) -> Any:
+        if collector is not None:
+            all_errors = collector.all_errors
+        if not all_errors:
+            try:
+                return fast(value)
+            except (_Reject, _Invalid):
+                pass
+        errors: list[_Invalid] = []
+        try:
+            result = check(value, errors if all_errors else None)
+        except _Invalid as exc:
+            errors.append(exc)
+        if errors:
+            found = [{"path": e.path(), "message": e.message()} for e in errors]
+            if collector is None or not all_errors:
+                raise ValidationErrors(found)
+            collector.errors.extend(found)
+        return result
+
+    return validate
@@ -0,0 +1,147 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+
+
+def run_batch(ops, *, cwd: Path, extra_args=()):
+    stdin = "".join(json.dumps(op) + "\n" for op in ops)
+    result = subprocess.run(
+        [PYTHON, "-m", "asi.cli", "batch", "--stdin", *extra_args],
+        cwd=str(cwd),
+        env=ENV_BASE,
+        input=stdin,
+        text=True,
+        capture_output=True,
+    )
+    lines = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+    return result.returncode, lines, result.stderr
+
+
+def _suggestions(question_ids):
+    return [
+        {
+            "question_id": qid,
+            "options": [
+                {
+                    "label": f"Option {n}",
+                    "value": f"value-{n}",
+                    "description": "Approach",
+                    "impact": "Risk",
+                }
+                for n in (1, 2, 3)
+            ],
+            "recommended": 1,
+        }
+        for qid in question_ids
+    ]
+
+
+class TestAsiBatchCli(unittest.TestCase):
+    def test_batch_runs_mixed_ops(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, lines, err = run_batch(
+                [
+                    {"op": "creator.next"},
+                    {"op": "creator.schema", "input": {"kind": "suggest"}},
+                    {"op": "onboard.run", "input": {"topic": "Read entrypoints"}},
+                    {"op": "doctor"},
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual([line["index"] for line in lines], [0, 1, 2, 3], err)
+            self.assertTrue(all(line["ok"] for line in lines))
+            self.assertEqual(lines[0]["result"]["status"], "need_suggestions")
+            self.assertFalse((cwd / ".asi" / "creator" / "state.json").exists())
+
+    def test_batch_suggest_apply_flushes_once(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            _, lines, _ = run_batch([{"op": "creator.next"}], cwd=cwd)
+            nxt = lines[0]["result"]
+            ids = [q["id"] for q in nxt["questions"]]
+            code, lines, err = run_batch(
+                [
+                    {
+                        "op": "creator.suggest",
+                        "input": {"iteration_id": nxt["iteration_id"], "suggestions": _suggestions(ids)},
+                    },
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            ask = lines[0]["result"]
+            answers = [{"question_id": qid, "selection": 1} for qid in ids]
+            code, lines, err = run_batch(
+                [
+                    {
+                        "op": "creator.apply",
+                        "input": {"ask_set_id": ask["ask_set_id"], "confirmed": True, "answers": answers},
+                    },
+                    {"op": "checkpoint"},
+                    {"op": "creator.next"},
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertTrue(lines[1]["result"]["flushed"])
+            self.assertEqual(lines[2]["result"]["status"], "ready")
+            state = json.loads((cwd / ".asi" / "creator" / "state.json").read_text())
+            self.assertEqual(state["decisions"]["skill_name"]["value"], "value-1")
+
+    def test_batch_stops_on_error_unless_continue(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            ops = [
+                {"op": "creator.apply", "input": {"ask_set_id": "x", "answers": [{"question_id": "q"}]}},
+                {"op": "creator.next"},
+            ]
+            code, lines, err = run_batch(ops, cwd=cwd)
+            self.assertNotEqual(code, 0)
+            self.assertEqual(len(lines), 1)
+            self.assertFalse(lines[0]["ok"])
+            self.assertIn("Missing required field: selection", lines[0]["error"])
+            self.assertEqual(lines[0]["schema_cmd"], "asi creator apply --schema")
+
+            code, lines, err = run_batch(ops, cwd=cwd, extra_args=["--continue-on-error"])
+            self.assertNotEqual(code, 0)
+            self.assertEqual(len(lines), 2)
+            self.assertTrue(lines[1]["ok"])
+
+    def test_batch_reports_unexpected_errors_without_flushing_them(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            state = cwd / ".asi" / "creator" / "state.json"
+            state.parent.mkdir(parents=True)
+            state.write_text("[]", encoding="utf-8")
+            ops = [{"op": "creator.next"}, {"op": "doctor"}]
+
+            code, lines, err = run_batch(ops, cwd=cwd)
+            self.assertNotEqual(code, 0)
+            self.assertNotIn("Traceback", err)
+            self.assertEqual(len(lines), 1)
+            self.assertFalse(lines[0]["ok"])
+            self.assertIn("Internal error", lines[0]["error"])
+
+            code, lines, err = run_batch(ops, cwd=cwd, extra_args=["--continue-on-error"])
+            self.assertNotEqual(code, 0)
+            self.assertEqual([line["ok"] for line in lines], [False, True])
+            self.assertEqual(state.read_text(encoding="utf-8"), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
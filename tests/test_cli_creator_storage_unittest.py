@@ -0,0 +1,337 @@
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+ENV_BASE.pop("ASI_CREATOR_STORAGE", None)
+
+
+def run_cli(args, *, cwd: Path, stdin: str | None = None, env=None):
+    result = subprocess.run(
+        [PYTHON, "-m", "asi.cli", *args],
+        cwd=str(cwd),
+        env=env or ENV_BASE,
+        input=stdin,
+        text=True,
+        capture_output=True,
+    )
+    return result.returncode, result.stdout, result.stderr
+
+
+def run_suggest(cwd: Path, *, env=None, variant: str = "value"):
+    """next -> suggest; returns the suggest payload."""
+    _, out, _ = run_cli(["creator", "next"], cwd=cwd, env=env)
+    payload = json.loads(out)
+    suggestions = [
+        {
+            "question_id": q["id"],
+            "options": [
+                {"label": f"Option {n}", "value": f"{variant}-{n}", "description": "d", "impact": "i"}
+                for n in (1, 2, 3)
+            ],
+            "recommended": 1,
+        }
+        for q in payload["questions"]
+    ]
+    _, out, _ = run_cli(
+        ["creator", "suggest", "--stdin"],
+        cwd=cwd,
+        env=env,
+        stdin=json.dumps({"iteration_id": payload["iteration_id"], "suggestions": suggestions}),
+    )
+    return json.loads(out)
+
+
+def run_loop_step(cwd: Path, *, env=None):
+    """One next -> suggest -> apply round; returns the apply payload."""
+    ask = run_suggest(cwd, env=env)
+    answers = [{"question_id": q["id"], "selection": 1} for q in ask["questions"]]
+    code, out, err = run_cli(
+        ["creator", "apply", "--stdin"],
+        cwd=cwd,
+        env=env,
+        stdin=json.dumps({"ask_set_id": ask["ask_set_id"], "confirmed": True, "answers": answers}),
+    )
+    assert code == 0, out + err
+    return json.loads(out)
+
+
+def snapshot_files(root: Path):
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file() and p.name != "config.json" and not p.name.startswith("creator.sqlite3")
+    }
+
+
+class TestAsiCreatorStorage(unittest.TestCase):
+    def test_sqlite_backend_runs_loop_and_reports_backend(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            env = dict(ENV_BASE, ASI_CREATOR_STORAGE="sqlite")
+            result = run_loop_step(cwd, env=env)
+            self.assertEqual(result["status"], "ready")
+            self.assertFalse((cwd / ".asi" / "creator" / "state.json").exists())
+            self.assertTrue((cwd / ".asi" / "creator" / "creator.sqlite3").exists())
+
+            _, out, _ = run_cli(["creator", "next"], cwd=cwd, env=env)
+            payload = json.loads(out)
+            self.assertEqual(payload["status"], "ready")
+            self.assertEqual(payload["artifact_model"]["storage"]["backend"], "sqlite")
+            self.assertEqual(
+                payload["artifact_model"]["canonical_paths"],
+                {"database": payload["artifact_model"]["storage"]["location"]},
+            )
+
+    def test_unknown_backend_is_a_clean_error(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            env = dict(ENV_BASE, ASI_CREATOR_STORAGE="bogus")
+            for args in (["creator", "next"], ["creator", "--schema"], ["serve"]):
+                code, out, err = run_cli(args, cwd=cwd, env=env)
+                self.assertEqual(code, 2, args)
+                self.assertIn("Unknown storage backend: bogus", err)
+                self.assertNotIn("Traceback", err)
+
+    def test_convert_round_trip_is_lossless(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            run_loop_step(cwd)
+            creator_dir = cwd / ".asi" / "creator"
+            before = snapshot_files(creator_dir)
+
+            code, out, err = run_cli(["creator", "storage", "convert", "--to", "sqlite"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            counts = json.loads(out)["counts"]
+            self.assertEqual(counts["decision_events"], 3)
+            self.assertEqual(counts["receipts"], 1)
+
+            _, out, _ = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(json.loads(out)["artifact_model"]["storage"]["backend"], "sqlite")
+
+            shutil.rmtree(creator_dir / "ask_sets")
+            shutil.rmtree(creator_dir / "receipts")
+            (creator_dir / "state.json").unlink()
+            (creator_dir / "decisions.log.jsonl").unlink()
+
+            code, out, err = run_cli(["creator", "storage", "convert", "--to", "json"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(snapshot_files(creator_dir), before)
+
+    def test_convert_over_existing_records_is_idempotent(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            run_loop_step(cwd)
+            creator_dir = cwd / ".asi" / "creator"
+            before = snapshot_files(creator_dir)
+
+            for _ in range(2):
+                for target in ("sqlite", "json"):
+                    code, out, err = run_cli(
+                        ["creator", "storage", "convert", "--to", target], cwd=cwd
+                    )
+                    self.assertEqual(code, 0, err)
+                    self.assertEqual(json.loads(out)["counts"]["receipts"], 1)
+                self.assertEqual(snapshot_files(creator_dir), before)
+
+    def test_config_is_read_once_until_it_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            run_loop_step(cwd)
+            script = (
+                "import json\n"
+                "from asi.creator import model, state\n"
+                "reads = []\n"
+                "read_json = model.read_json\n"
+                "model.read_json = lambda path: reads.append(path.name) or read_json(path)\n"
+                "for _ in range(3):\n"
+                "    model.artifact_model()\n"
+                "    state.get_storage()\n"
+                "state.convert_storage('sqlite')\n"
+                "print(json.dumps([reads, state.get_storage().name]))\n"
+            )
+            result = subprocess.run(
+                [PYTHON, "-c", script], cwd=str(cwd), env=ENV_BASE, text=True, capture_output=True
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            # Once for all six lookups, once more after the conversion rewrote it.
+            self.assertEqual(json.loads(result.stdout), [["config.json"] * 2, "sqlite"])
+
+            # A long-lived server follows a conversion made by another process.
+            proc = subprocess.Popen(
+                [PYTHON, "-m", "asi.cli", "serve"],
+                cwd=str(cwd),
+                env=ENV_BASE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+            def backend(req_id):
+                request = {"jsonrpc": "2.0", "id": req_id, "method": "creator.next"}
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                return json.loads(proc.stdout.readline())["result"]["artifact_model"]["storage"]["backend"]
+
+            try:
+                self.assertEqual(backend(1), "sqlite")
+                code, _, err = run_cli(["creator", "storage", "convert", "--to", "json"], cwd=cwd)
+                self.assertEqual(code, 0, err)
+                self.assertEqual(backend(2), "json")
+            finally:
+                proc.communicate(timeout=30)
+
+    def test_receipts_are_packed_and_indexed(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            creator_dir = cwd / ".asi" / "creator"
+            creator_dir.mkdir(parents=True)
+            (creator_dir / "config.json").write_text(json.dumps({"receipt_segment_bytes": 64}))
+
+            ask_set_ids = []
+            for _ in range(2):
+                (creator_dir / "state.json").unlink(missing_ok=True)
+                result = run_loop_step(cwd)
+                receipt_path = Path(result["artifacts"]["receipt_path"])
+                self.assertTrue(receipt_path.name.startswith("segment-"))
+                ask_set_ids.append(json.loads(receipt_path.read_text().splitlines()[-1])["ask_set_id"])
+
+            segments = sorted((creator_dir / "receipts").glob("segment-*.jsonl"))
+            self.assertEqual(len(segments), 2)
+            index = (creator_dir / "receipts" / "index.jsonl").read_text().splitlines()
+            self.assertEqual(len(index), 2)
+
+            code, out, err = run_cli(["creator", "receipt", "--ask-set-id", ask_set_ids[0]], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            receipt = json.loads(out)
+            self.assertEqual(receipt["ask_set_id"], ask_set_ids[0])
+            self.assertIn("decisions", receipt)
+
+            code, out, err = run_cli(["creator", "receipt", "--ask-set-id", "missing"], cwd=cwd)
+            self.assertNotEqual(code, 0)
+            self.assertIn("error", json.loads(out))
+
+    def test_receipts_store_deltas_and_reconstruct_in_full(self):
+        for backend in ("json", "sqlite"):
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as td:
+                cwd = Path(td)
+                (cwd / ".git").mkdir()
+                env = dict(ENV_BASE, ASI_CREATOR_STORAGE=backend)
+                state_path = cwd / ".asi" / "creator" / "state.json"
+                run_loop_step(cwd, env=env)
+
+                # Forget one decision so the next round re-asks only that question.
+                if backend == "json":
+                    state = json.loads(state_path.read_text())
+                    dropped = sorted(state["decisions"])[0]
+                    del state["decisions"][dropped]
+                    state_path.write_text(json.dumps(state))
+                else:
+                    conn = sqlite3.connect(cwd / ".asi" / "creator" / "creator.sqlite3")
+                    (body,) = conn.execute("SELECT body FROM state").fetchone()
+                    state = json.loads(body)
+                    dropped = sorted(state["decisions"])[0]
+                    del state["decisions"][dropped]
+                    conn.execute("UPDATE state SET body = ?", (json.dumps(state),))
+                    conn.commit()
+                    conn.close()
+                run_loop_step(cwd, env=env)
+
+                if backend == "json":
+                    segment = cwd / ".asi" / "creator" / "receipts" / "segment-000001.jsonl"
+                    records = [json.loads(line) for line in segment.read_text().splitlines()]
+                else:
+                    conn = sqlite3.connect(cwd / ".asi" / "creator" / "creator.sqlite3")
+                    records = [json.loads(b) for (b,) in conn.execute("SELECT body FROM receipts ORDER BY id")]
+                    conn.close()
+                self.assertIn("decisions", records[0])
+                self.assertNotIn("decisions", records[1])
+                self.assertEqual(list(records[1]["changes"]), [dropped])
+
+                for record in records:
+                    code, out, err = run_cli(
+                        ["creator", "receipt", "--ask-set-id", record["ask_set_id"]], cwd=cwd, env=env
+                    )
+                    self.assertEqual(code, 0, err)
+                    receipt = json.loads(out)
+                    self.assertEqual(set(receipt), {"ask_set_id", "applied_at", "answers", "decisions"})
+                    self.assertEqual(len(receipt["decisions"]), 3)
+
+    def test_ask_sets_are_sharded_and_not_rewritten(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            ask = run_suggest(cwd)
+            ask_set_id = ask["ask_set_id"]
+            path = Path(ask["artifacts"]["ask_set_path"])
+            self.assertEqual(
+                path.relative_to(cwd / ".asi" / "creator" / "ask_sets").parts,
+                (ask_set_id[:2], ask_set_id[2:4], f"{ask_set_id}.json"),
+            )
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(run_suggest(cwd)["ask_set_id"], ask_set_id)
+            self.assertEqual(path.stat().st_mtime_ns, 0)
+
+    def test_gc_collects_unreferenced_ask_sets(self):
+        for backend in ("json", "sqlite"):
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as td:
+                cwd = Path(td)
+                (cwd / ".git").mkdir()
+                env = dict(ENV_BASE, ASI_CREATOR_STORAGE=backend)
+                abandoned = run_suggest(cwd, env=env, variant="draft")["ask_set_id"]
+                run_loop_step(cwd, env=env)
+
+                code, out, err = run_cli(["creator", "gc", "--keep-recent", "1"], cwd=cwd, env=env)
+                self.assertEqual(code, 0, err)
+                result = json.loads(out)
+                self.assertEqual((result["scanned"], result["retained"]), (2, 1))
+                self.assertEqual(result["collected"], [])
+
+                code, out, err = run_cli(["creator", "gc", "--dry-run"], cwd=cwd, env=env)
+                self.assertEqual(json.loads(out)["collected"], [abandoned])
+
+                code, out, err = run_cli(["creator", "gc", "--archive"], cwd=cwd, env=env)
+                self.assertEqual(code, 0, err)
+                result = json.loads(out)
+                self.assertEqual(result["collected"], [abandoned])
+                archived = Path(result["archived_to"]).read_text().splitlines()
+                self.assertEqual([json.loads(line)["ask_set_id"] for line in archived], [abandoned])
+
+                _, out, _ = run_cli(["creator", "gc"], cwd=cwd, env=env)
+                result = json.loads(out)
+                self.assertEqual((result["scanned"], result["referenced"]), (1, 1))
+                self.assertEqual(result["collected"], [])
+
+    def test_receipt_lookup_reads_legacy_receipt_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            receipts_dir = cwd / ".asi" / "creator" / "receipts"
+            receipts_dir.mkdir(parents=True)
+            legacy = {"ask_set_id": "old", "answers": [], "decisions": {}, "applied_at": "t"}
+            (receipts_dir / "20240101T000000000000Z.json").write_text(json.dumps(legacy, indent=2))
+
+            code, out, err = run_cli(["creator", "receipt", "--ask-set-id", "old"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
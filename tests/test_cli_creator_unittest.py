@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import subprocess
@@ -13,11 +14,11 @@ ENV_BASE = os.environ.copy()
 ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
 
 
-def run_cli(args, *, cwd: Path, stdin: str | None = None):
+def run_cli(args, *, cwd: Path, stdin: str | None = None, env=None):
     result = subprocess.run(
         [PYTHON, "-m", "asi.cli", *args],
         cwd=str(cwd),
-        env=ENV_BASE,
+        env=env or ENV_BASE,
         input=stdin,
         text=True,
         capture_output=True,
@@ -81,6 +82,35 @@ class TestAsiCreatorCli(unittest.TestCase):
             answer_item = data["properties"]["answers"]["items"]
             self.assertEqual(answer_item.get("required"), ["question_id", "selection"])
 
+    def test_creator_schemas_are_prebuilt_and_fingerprinted(self):
+        result = subprocess.run(
+            [PYTHON, "-m", "asi.schemas.build", "--check"],
+            env=ENV_BASE,
+            text=True,
+            capture_output=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, out, err = run_cli(["creator", "suggest", "--schema"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            schema = json.loads(out)
+            fingerprint = schema.pop("x-fingerprint")
+            digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+            self.assertEqual(fingerprint, digest)
+
+            code, out, err = run_cli(
+                ["creator", "suggest", "--schema-if-changed", fingerprint], cwd=cwd
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out), {"not_modified": True, "x-fingerprint": fingerprint})
+
+            code, out, err = run_cli(["creator", "--schema-if-changed", "stale"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertIn("x-artifact-model", json.loads(out))
+
     def test_creator_next_option_constraints_are_complete(self):
         with tempfile.TemporaryDirectory() as td:
             cwd = Path(td)
@@ -187,6 +217,149 @@ class TestAsiCreatorCli(unittest.TestCase):
             self.assertTrue(decision_log_path.exists())
             self.assertTrue(receipt_path.exists())
 
+    def test_creator_ids_are_sha256_of_sorted_json(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+
+            def digest(value):
+                return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            payload = json.loads(out)
+            question_ids = [q["id"] for q in payload["questions"]]
+            self.assertEqual(payload["iteration_id"], digest({"questions": question_ids}))
+
+            suggestions = [
+                {
+                    "question_id": qid,
+                    "options": [
+                        {"label": f"Option {n}", "value": f"value-{n}", "description": "d", "impact": "i"}
+                        for n in (1, 2, 3)
+                    ],
+                    "recommended": 1,
+                }
+                for qid in question_ids
+            ]
+            code, out, err = run_cli(
+                ["creator", "suggest", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps({"iteration_id": payload["iteration_id"], "suggestions": suggestions}),
+            )
+            self.assertEqual(code, 0, err)
+            ask_payload = json.loads(out)
+            snapshot = json.loads(Path(ask_payload["artifacts"]["ask_set_path"]).read_text())
+            self.assertEqual(ask_payload["ask_set_id"], digest(snapshot["ask_set"]))
+
+    def test_creator_next_output_formats_and_fields(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            full = json.loads(out)
+
+            code, out, err = run_cli(["--format", "compact", "creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(len(out.splitlines()), 1)
+            self.assertEqual(json.loads(out), full)
+
+            # Compact means no separator spaces under either JSON backend.
+            code, out, err = run_cli(
+                ["--format", "compact", "creator", "next"],
+                cwd=cwd,
+                env=dict(ENV_BASE, ASI_JSON_BACKEND="stdlib"),
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual(out, json.dumps(json.loads(out), separators=(",", ":")) + "\n")
+
+            code, out, err = run_cli(
+                ["--format=compact", "--fields", "status,iteration_id,questions", "creator", "next"],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual(
+                json.loads(out),
+                {k: full[k] for k in ("status", "iteration_id", "questions")},
+            )
+            self.assertEqual(err, "")
+
+            code, out, err = run_cli(["--fields", "status,nope", "creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out), {"status": full["status"]})
+            self.assertIn("--fields not in this result: nope", err)
+
+            # Abbreviated top-level options still find the command.
+            code, out, err = run_cli(
+                ["--form", "compact", "--fie", "status", "creator", "next"], cwd=cwd
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual(len(out.splitlines()), 1)
+            self.assertEqual(json.loads(out), {"status": full["status"]})
+
+            code, out, err = run_cli(["--format", "ndjson", "creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            lines = [json.loads(line) for line in out.splitlines()]
+            self.assertNotIn("questions", lines[0])
+            self.assertEqual(lines[0]["iteration_id"], full["iteration_id"])
+            self.assertEqual([line["questions"] for line in lines[1:]], full["questions"])
+
+            code, out, _ = run_cli(
+                ["--format", "compact", "--fields", "status", "creator", "suggest", "--stdin"],
+                cwd=cwd,
+                stdin="{",
+            )
+            self.assertEqual(code, 1)
+            self.assertEqual(len(out.splitlines()), 1)
+            self.assertIn("error", json.loads(out))
+
+    def test_creator_next_if_none_match_sends_only_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            full = json.loads(out)
+            etag = full["etag"]
+
+            code, out, err = run_cli(["creator", "next", "--if-none-match", etag], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(
+                json.loads(out), {"status": "need_suggestions", "etag": etag, "not_modified": True}
+            )
+
+            code, out, err = run_cli(["creator", "next", "--if-none-match", "n0.stale"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out), full)
+
+            state_path = cwd / ".asi" / "creator" / "state.json"
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(
+                json.dumps(
+                    {
+                        "version": 3,
+                        "decisions": {"skill_name": {"value": "my-skill", "source": "option", "ask_set_id": "a"}},
+                        "last_ask_set": {},
+                        "decision_log_ref": {"seq": 0, "offset": 0},
+                    }
+                )
+            )
+            code, out, err = run_cli(["creator", "next", "--if-none-match", etag], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            delta = json.loads(out)
+            self.assertNotEqual(delta["etag"], etag)
+            self.assertEqual(
+                set(delta["unchanged"]), {"artifact_model", "schemas", "warnings", "requirements"}
+            )
+            self.assertEqual(
+                [q["id"] for q in delta["questions"]],
+                ["creator.skill_purpose", "creator.target_directory"],
+            )
+            self.assertNotIn("requirements", delta)
+
     def test_creator_suggest_allows_recommended_1_to_3(self):
         with tempfile.TemporaryDirectory() as td:
             cwd = Path(td)
@@ -525,6 +698,176 @@ class TestAsiCreatorCli(unittest.TestCase):
             self.assertIn("Missing required field: selection", payload["error"])
             self.assertEqual(payload.get("schema_cmd"), "asi creator apply --schema")
 
+    def test_creator_suggest_errors_carry_item_paths(self):
+        option = {"label": "L", "value": "v", "description": "d", "impact": "i"}
+        cases = [
+            (
+                [{"question_id": "q", "options": [option, "bad", option], "recommended": 1}],
+                "suggestions[0].options[1] must be an object.",
+            ),
+            (
+                [{"question_id": "q", "options": [option] * 3, "recommended": True}],
+                "Field 'recommended' must be an integer.",
+            ),
+            (
+                [{"question_id": "q", "options": [option] * 3, "recommended": 1, "rationale": []}],
+                "suggestions[0].rationale must be an object or null.",
+            ),
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            for suggestions, message in cases:
+                with self.subTest(message=message):
+                    code, out, err = run_cli(
+                        ["creator", "suggest", "--stdin"],
+                        cwd=cwd,
+                        stdin=json.dumps({"iteration_id": "i", "suggestions": suggestions}),
+                    )
+                    self.assertNotEqual(code, 0, out + err)
+                    self.assertEqual(json.loads(out)["error"], message)
+
+    def test_creator_suggest_all_errors_reports_every_violation(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            bad = {
+                "iteration_id": "",
+                "suggestions": [
+                    {
+                        "question_id": "q",
+                        "options": [
+                            {"label": "L", "value": "", "description": "d", "impact": "i"},
+                            {"label": "L", "value": "v", "description": "d"},
+                            {"label": "L", "value": "v", "description": "d", "impact": "i"},
+                        ],
+                        "recommended": 5,
+                    }
+                ],
+            }
+            code, out, err = run_cli(["creator", "suggest", "--stdin"], cwd=cwd, stdin=json.dumps(bad))
+            self.assertNotEqual(code, 0, out + err)
+            self.assertEqual(len(json.loads(out)["errors"]), 1)
+
+            code, out, err = run_cli(
+                ["creator", "suggest", "--stdin", "--all-errors"], cwd=cwd, stdin=json.dumps(bad)
+            )
+            self.assertNotEqual(code, 0, out + err)
+            payload = json.loads(out)
+            self.assertEqual(payload["error"], payload["errors"][0]["message"])
+            self.assertEqual(
+                [e["path"] for e in payload["errors"]],
+                [
+                    "iteration_id",
+                    "suggestions[0].options[0].value",
+                    "suggestions[0].options[1].impact",
+                    "suggestions[0].recommended",
+                    "suggestions",
+                ],
+            )
+
+            # Option values are checked against every question's constraints.
+            _, out, _ = run_cli(["creator", "next"], cwd=cwd)
+            nxt = json.loads(out)
+            suggestions = [
+                {
+                    "question_id": q["id"],
+                    "options": [
+                        {"label": "L", "value": f"Bad Name {n}", "description": "d", "impact": "i"}
+                        for n in (1, 2, 3)
+                    ],
+                    "recommended": 1,
+                }
+                for q in nxt["questions"]
+            ]
+            code, out, err = run_cli(
+                ["creator", "suggest", "--stdin", "--all-errors"],
+                cwd=cwd,
+                stdin=json.dumps({"iteration_id": nxt["iteration_id"], "suggestions": suggestions}),
+            )
+            self.assertNotEqual(code, 0, out + err)
+            paths = [e["path"] for e in json.loads(out)["errors"]]
+            self.assertEqual(paths, [f"suggestions[0].options[{j}].value" for j in range(3)])
+
+            # Schema errors do not stop the value checks on the fields that validated.
+            values = {
+                "creator.skill_name": ["Bad Name", "good-name", "other-name"],
+                "creator.skill_purpose": ["p1", "p2", "p3"],
+                "creator.target_directory": ["../x", "/abs", "skills/ok"],
+            }
+            suggestions = [
+                {
+                    "question_id": q["id"],
+                    "options": [
+                        {"label": "", "value": v, "description": "d", "impact": "i"}
+                        if v == "Bad Name"
+                        else {"label": "L", "value": v, "description": "d", "impact": "i"}
+                        for v in values[q["id"]]
+                    ],
+                    "recommended": 1,
+                }
+                for q in nxt["questions"]
+            ]
+            code, out, err = run_cli(
+                ["creator", "suggest", "--stdin", "--all-errors"],
+                cwd=cwd,
+                stdin=json.dumps({"iteration_id": nxt["iteration_id"], "suggestions": suggestions}),
+            )
+            self.assertNotEqual(code, 0, out + err)
+            ids = [q["id"] for q in nxt["questions"]]
+            name, target = ids.index("creator.skill_name"), ids.index("creator.target_directory")
+            self.assertEqual(
+                [e["path"] for e in json.loads(out)["errors"]],
+                [
+                    f"suggestions[{name}].options[0].label",
+                    f"suggestions[{name}].options[0].value",
+                    f"suggestions[{target}].options[0].value",
+                    f"suggestions[{target}].options[1].value",
+                ],
+            )
+
+    def test_creator_apply_all_errors_reports_every_violation(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            _, out, _ = run_cli(["creator", "next"], cwd=cwd)
+            nxt = json.loads(out)
+            suggestions = [
+                {
+                    "question_id": q["id"],
+                    "options": [
+                        {"label": "L", "value": f"value-{n}", "description": "d", "impact": "i"}
+                        for n in (1, 2, 3)
+                    ],
+                    "recommended": 1,
+                }
+                for q in nxt["questions"]
+            ]
+            _, out, _ = run_cli(
+                ["creator", "suggest", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps({"iteration_id": nxt["iteration_id"], "suggestions": suggestions}),
+            )
+            ask = json.loads(out)
+            answers = [
+                {"question_id": q["id"], "selection": 1}
+                if q["id"] != "creator.target_directory"
+                else {"question_id": q["id"], "selection": 4, "alternative_text": "../x"}
+                for q in ask["questions"]
+            ]
+            code, out, err = run_cli(
+                ["creator", "apply", "--stdin", "--all-errors"],
+                cwd=cwd,
+                stdin=json.dumps({"ask_set_id": ask["ask_set_id"], "answers": answers}),
+            )
+            self.assertNotEqual(code, 0, out + err)
+            target = [q["id"] for q in ask["questions"]].index("creator.target_directory")
+            self.assertEqual(
+                [e["path"] for e in json.loads(out)["errors"]],
+                [f"answers[{i}].user_confirmation" for i in range(len(answers))]
+                + [f"answers[{target}].alternative_text"],
+            )
+
     def test_creator_next_emits_legacy_warning_when_legacy_artifacts_exist(self):
         with tempfile.TemporaryDirectory() as td:
             cwd = Path(td)
@@ -540,6 +883,187 @@ class TestAsiCreatorCli(unittest.TestCase):
                 payload["warnings"][0]["code"], "creator_legacy_artifacts_detected"
             )
 
+    def test_creator_next_emits_global_legacy_warning(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            (cwd / ".asi" / "plan").mkdir(parents=True)
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(
+                json.loads(out)["warnings"][0]["code"], "creator_legacy_artifacts_detected"
+            )
+
+    def test_creator_honors_asi_repo_root_override(self):
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td) / "repo"
+            (repo / ".git").mkdir(parents=True)
+            elsewhere = Path(td) / "elsewhere"
+            (elsewhere / ".git").mkdir(parents=True)
+            env = dict(ENV_BASE, ASI_REPO_ROOT=str(repo))
+
+            code, out, err = run_cli(["creator", "next"], cwd=elsewhere, env=env)
+            self.assertEqual(code, 0, err)
+            paths = json.loads(out)["artifact_model"]["canonical_paths"]
+            self.assertEqual(Path(paths["state"]), (repo / ".asi" / "creator" / "state.json").resolve())
+            self.assertFalse((elsewhere / ".asi").exists())
+
+    def test_creator_session_survives_json_backend_switch(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            stdlib_env = dict(ENV_BASE, ASI_JSON_BACKEND="stdlib")
+            auto_env = dict(ENV_BASE, ASI_JSON_BACKEND="auto")
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd, env=stdlib_env)
+            self.assertEqual(code, 0, err)
+            payload = json.loads(out)
+            suggestions = [
+                {
+                    "question_id": q["id"],
+                    "options": [
+                        {"label": f"Option {n}", "value": f"value-{n}", "description": "Défaut", "impact": "—"}
+                        for n in (1, 2, 3)
+                    ],
+                    "recommended": 1,
+                }
+                for q in payload["questions"]
+            ]
+            code, out, err = run_cli(
+                ["creator", "suggest", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps({"iteration_id": payload["iteration_id"], "suggestions": suggestions}),
+                env=stdlib_env,
+            )
+            self.assertEqual(code, 0, err)
+            ask_payload = json.loads(out)
+
+            answers = [{"question_id": q["id"], "selection": 1} for q in ask_payload["questions"]]
+            code, out, err = run_cli(
+                ["creator", "apply", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps(
+                    {"ask_set_id": ask_payload["ask_set_id"], "confirmed": True, "answers": answers}
+                ),
+                env=auto_env,
+            )
+            self.assertEqual(code, 0, err)
+
+            code, out, err = run_cli(
+                ["creator", "receipt", "--ask-set-id", ask_payload["ask_set_id"]],
+                cwd=cwd,
+                env=stdlib_env,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out)["ask_set_id"], ask_payload["ask_set_id"])
+
+            code, out, err = run_cli(
+                ["creator", "next"], cwd=cwd, env=dict(ENV_BASE, ASI_JSON_BACKEND="yaml")
+            )
+            self.assertEqual(code, 2)
+            self.assertIn("Unknown JSON backend: yaml", err)
+
+    def test_json_backends_decode_the_same_values(self):
+        # Ints beyond 64 bits and NaN must not parse (and so hash) differently under orjson.
+        script = (
+            "import json, os, sys\n"
+            "from asi.util import codec\n"
+            "from asi.util.hashing import canonical_hash\n"
+            "raw = sys.stdin.read()\n"
+            "out = []\n"
+            "for backend in ('stdlib', 'auto'):\n"
+            "    os.environ[codec.BACKEND_ENV] = backend\n"
+            "    values = [codec.loads(line) for line in raw.splitlines()]\n"
+            "    values += [codec.loads(line.encode()) for line in raw.splitlines()]\n"
+            "    out.append([repr(v) for v in values] + [canonical_hash(values)])\n"
+            "fast = None\n"
+            "if codec.codec().name == 'orjson':\n"
+            "    # In-range 19- and 20-digit ints must not fall back to stdlib.\n"
+            "    codec.json = None\n"
+            "    fast = codec.loads(\n"
+            "        '[1700000000123456789, 18446744073709551615, -9223372036854775808]')\n"
+            "print(json.dumps([out, fast]))\n"
+        )
+        lines = [
+            '{"seq": 123456789012345678901234567890, "neg": -9223372036854775809}',
+            '{"ratio": NaN, "cap": Infinity, "ok": 18446744073709551615}',
+            '{"id": "run-1234567890123456789012", "n": 1.5}',
+            '{"over": 18446744073709551616, "max": 18446744073709551615,'
+            ' "min": -9223372036854775808}',
+        ]
+        result = subprocess.run(
+            [PYTHON, "-c", script],
+            env=ENV_BASE,
+            input="\n".join(lines),
+            text=True,
+            capture_output=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        (stdlib, auto), fast = json.loads(result.stdout)
+        self.assertEqual(auto, stdlib)
+        self.assertIn("123456789012345678901234567890", stdlib[0])
+        self.assertIn("18446744073709551616", stdlib[3])
+        if fast is not None:
+            self.assertEqual(
+                fast, [1700000000123456789, 18446744073709551615, -9223372036854775808]
+            )
+
+    def test_creator_next_does_not_rewrite_state(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            state_path = cwd / ".asi" / "creator" / "state.json"
+            state_path.parent.mkdir(parents=True)
+            raw = json.dumps(
+                {
+                    "version": 3,
+                    "decisions": {"skill_name": {"value": "my-skill", "source": "option", "ask_set_id": "a"}},
+                    "last_ask_set": {},
+                    "decision_log_ref": {"seq": 0, "offset": 0},
+                }
+            )
+            state_path.write_text(raw)
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            payload = json.loads(out)
+            self.assertNotIn("creator.skill_name", [q["id"] for q in payload["questions"]])
+            self.assertEqual(state_path.read_text(), raw)
+
+    def test_creator_state_v2_decision_log_moves_to_jsonl(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            creator_dir = cwd / ".asi" / "creator"
+            creator_dir.mkdir(parents=True)
+            applied = {"decision_key": "skill_name", "ask_set_id": "a", "value": "my-skill"}
+            (creator_dir / "decisions.log.jsonl").write_text(json.dumps(applied, sort_keys=True) + "\n")
+            (creator_dir / "state.json").write_text(
+                json.dumps(
+                    {
+                        "version": 2,
+                        "decisions": {"skill_name": {"value": "my-skill", "source": "option", "ask_set_id": "a"}},
+                        "decision_log": [{"event": "migrated_to_v2"}, applied],
+                        "last_ask_set": {},
+                    }
+                )
+            )
+
+            code, out, err = run_cli(["creator", "next"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            state = json.loads((creator_dir / "state.json").read_text())
+            self.assertEqual(state["version"], 3)
+            self.assertNotIn("decision_log", state)
+            lines = (creator_dir / "decisions.log.jsonl").read_text().splitlines()
+            events = [json.loads(line) for line in lines]
+            self.assertEqual(events, [applied, {"event": "migrated_to_v2"}, {"event": "migrated_to_v3"}])
+            self.assertEqual(state["decision_log_ref"]["seq"], 3)
+            self.assertEqual(
+                state["decision_log_ref"]["offset"],
+                (creator_dir / "decisions.log.jsonl").stat().st_size,
+            )
+
     def test_creator_suggest_rejects_iteration_mismatch(self):
         with tempfile.TemporaryDirectory() as td:
             cwd = Path(td)
@@ -700,6 +1224,121 @@ class TestAsiCreatorCli(unittest.TestCase):
             payload = json.loads(out)
             self.assertIn("error", payload)
 
+    def test_creator_migrate_parallel_copy_link_and_dry_run(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            legacy = cwd / ".asi"
+            for i in range(30):
+                path = legacy / "exec" / f"task_{i % 3}" / f"out_{i}.json"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(bytes([i]) * (i * 1000))
+            (legacy / "kickoff").mkdir()
+            (legacy / "kickoff" / "KICKOFF.md").write_text("kickoff\n", encoding="utf-8")
+            existing = legacy / "creator" / "exec" / "task_0" / "out_0.json"
+            existing.parent.mkdir(parents=True)
+            existing.write_text("keep", encoding="utf-8")
+
+            code, out, err = run_cli(["creator", "migrate", "--from", "legacy", "--dry-run"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            planned = json.loads(out)
+            self.assertTrue(planned["dry_run"])
+            self.assertEqual(len(planned["migrated"]), 30)
+            self.assertIn({"phase": "plan", "reason": "missing"}, planned["skipped"])
+            self.assertIn({"phase": "exec", "path": str(Path("task_0/out_0.json")), "reason": "exists"}, planned["skipped"])
+            self.assertFalse((legacy / "creator" / "kickoff").exists())
+            self.assertFalse((legacy / "creator" / "migration_report.json").exists())
+
+            code, out, err = run_cli(
+                ["creator", "migrate", "--from", "legacy", "--jobs", "4", "--progress"], cwd=cwd
+            )
+            self.assertEqual(code, 0, err)
+            result = json.loads(out)
+            events = [json.loads(line) for line in err.splitlines()]
+            self.assertEqual(len(events), 31)
+            self.assertEqual(sorted(e["done"] for e in events), list(range(1, 32)))
+            self.assertTrue(all(e["total"] == 31 for e in events))
+            self.assertEqual(sorted(e["event"] for e in events), ["migrated"] * 30 + ["skipped"])
+            report = json.loads((legacy / "creator" / "migration_report.json").read_text(encoding="utf-8"))
+            self.assertEqual(report, {k: planned[k] for k in ("migrated", "skipped", "errors")})
+            self.assertEqual({k: result[k] for k in report}, report)
+            self.assertEqual(existing.read_text(encoding="utf-8"), "keep")
+            for i in range(1, 30):
+                rel = Path(f"task_{i % 3}") / f"out_{i}.json"
+                self.assertEqual((legacy / "creator" / "exec" / rel).read_bytes(), (legacy / "exec" / rel).read_bytes())
+
+            code, out, err = run_cli(["creator", "migrate", "--from", "legacy", "--force", "--link"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(len(json.loads(out)["migrated"]), 31)
+            self.assertTrue((legacy / "creator" / "exec" / "task_1" / "out_1.json").samefile(legacy / "exec" / "task_1" / "out_1.json"))
+            self.assertEqual(existing.read_bytes(), b"")
+
+            code, out, err = run_cli(["creator", "migrate", "--from", "legacy", "--jobs", "0"], cwd=cwd)
+            self.assertEqual(code, 1)
+            self.assertIn("--jobs", json.loads(out)["error"])
+
+    def test_creator_migrate_reruns_incrementally_from_manifest(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            legacy = cwd / ".asi" / "exec"
+            legacy.mkdir(parents=True)
+            for name in ("a.json", "b.json", "c.json", "d.json"):
+                (legacy / name).write_text(name, encoding="utf-8")
+            migrate = ["creator", "migrate", "--from", "legacy"]
+
+            code, out, err = run_cli(migrate, cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(len(json.loads(out)["migrated"]), 4)
+            manifest = Path(json.loads(out)["manifest"])
+            records = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()]
+            records = {r["path"]: r for r in records}
+            self.assertEqual(sorted(records), ["a.json", "b.json", "c.json", "d.json"])
+            self.assertEqual(records["a.json"]["sha256"], hashlib.sha256(b"a.json").hexdigest())
+
+            target = cwd / ".asi" / "creator" / "exec"
+            (legacy / "a.json").write_text("a changed", encoding="utf-8")
+            os.utime(legacy / "b.json", ns=(1, 1))  # touched, same content
+            (target / "c.json").write_text("edited after migration", encoding="utf-8")
+            (legacy / "c.json").write_text("c changed", encoding="utf-8")
+            (legacy / "e.json").write_text("e", encoding="utf-8")
+
+            code, out, err = run_cli([*migrate, "--dry-run"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            planned = json.loads(out)
+            self.assertEqual((target / "a.json").read_text(encoding="utf-8"), "a.json")
+
+            code, out, err = run_cli(migrate, cwd=cwd)
+            self.assertEqual(code, 0, err)
+            result = json.loads(out)
+            self.assertEqual(sorted(m["path"] for m in result["migrated"]), ["a.json", "e.json"])
+            self.assertEqual(
+                {s["path"]: s["reason"] for s in result["skipped"] if "path" in s},
+                {"b.json": "unchanged", "c.json": "exists", "d.json": "unchanged"},
+            )
+            self.assertEqual({k: planned[k] for k in ("migrated", "skipped")}, {k: result[k] for k in ("migrated", "skipped")})
+            self.assertEqual((target / "a.json").read_text(encoding="utf-8"), "a changed")
+            self.assertEqual((target / "c.json").read_text(encoding="utf-8"), "edited after migration")
+            records = {json.loads(line)["path"]: json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()}
+            self.assertEqual(sorted(records), ["a.json", "b.json", "c.json", "d.json", "e.json"])
+            self.assertEqual(records["b.json"]["source"]["mtime_ns"], 1)
+
+            # Interrupted run: a torn journal line and a missing target are picked up.
+            with manifest.open("a", encoding="utf-8") as handle:
+                handle.write('{"phase": "exec", "pa')
+            (target / "d.json").unlink()
+            code, out, err = run_cli(migrate, cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out)["migrated"], [{"phase": "exec", "path": "d.json"}])
+            self.assertEqual(len(manifest.read_text(encoding="utf-8").splitlines()), 5)
+
+            # A target of unknown origin that matches its source is verified, not copied.
+            manifest.unlink()
+            code, out, err = run_cli(migrate, cwd=cwd)
+            self.assertEqual(code, 0, err)
+            reasons = {s["path"]: s["reason"] for s in json.loads(out)["skipped"] if "path" in s}
+            self.assertEqual(reasons, {"a.json": "unchanged", "b.json": "unchanged", "c.json": "exists", "d.json": "unchanged", "e.json": "unchanged"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+# Fake tools run with a PATH holding only themselves.
+SLEEP = shutil.which("sleep") or "/bin/sleep"
+
+
+def run_cli(args, *, cwd: Path, env: dict[str, str]):
+    result = subprocess.run(
+        [PYTHON, "-m", "asi.cli", *args],
+        cwd=str(cwd),
+        env=env,
+        text=True,
+        capture_output=True,
+    )
+    return result.returncode, result.stdout, result.stderr
+
+
+def write_tool(path: Path, output: str, *, sleep: float = 0) -> None:
+    path.write_text(f"#!/bin/sh\n{SLEEP} {sleep}\necho '{output}'\n", encoding="utf-8")
+    path.chmod(0o755)
+
+
+class TestAsiDoctorCli(unittest.TestCase):
+    def test_doctor_reports_versions_and_caches_until_a_tool_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            bin_dir = cwd / "bin"
+            bin_dir.mkdir()
+            write_tool(bin_dir / "git", "git version 2.40.1")
+            env = {**ENV_BASE, "PATH": str(bin_dir), "ASI_CACHE_DIR": str(cwd / "cache")}
+
+            code, out, err = run_cli(["doctor"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            first = json.loads(out)
+            self.assertFalse(first["cached"])
+            git = first["tools"]["git"]
+            self.assertEqual(git["version"], "2.40.1")
+            self.assertEqual(git["version_text"], "git version 2.40.1")
+            self.assertGreater(git["probe_ms"], 0)
+            self.assertFalse(first["tools"]["jq"]["available"])
+            self.assertIsNone(first["tools"]["jq"]["version"])
+
+            code, out, err = run_cli(["doctor"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            second = json.loads(out)
+            self.assertTrue(second["cached"])
+            self.assertEqual(second["tools"], first["tools"])
+
+            # Upgrading a binary in place and adding a tool both invalidate the cache.
+            write_tool(bin_dir / "git", "git version 2.45.0-rc1")
+            os.utime(bin_dir / "git", ns=(1, 1))
+            code, out, err = run_cli(["doctor"], cwd=cwd, env=env)
+            third = json.loads(out)
+            self.assertFalse(third["cached"])
+            self.assertEqual(third["tools"]["git"]["version"], "2.45.0")
+            write_tool(bin_dir / "jq", "jq-1.7.1")
+            code, out, err = run_cli(["doctor"], cwd=cwd, env=env)
+            fourth = json.loads(out)
+            self.assertFalse(fourth["cached"])
+            self.assertEqual(fourth["tools"]["jq"]["version"], "1.7.1")
+
+            code, out, err = run_cli(["doctor", "--refresh"], cwd=cwd, env=env)
+            self.assertFalse(json.loads(out)["cached"])
+
+            (bin_dir / "git").unlink()
+            code, out, err = run_cli(["doctor"], cwd=cwd, env=env)
+            self.assertEqual(code, 1)
+            self.assertFalse(json.loads(out)["tools"]["git"]["available"])
+
+    def test_doctor_probe_timeout_is_reported_and_not_cached(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            bin_dir = cwd / "bin"
+            bin_dir.mkdir()
+            write_tool(bin_dir / "git", "git version 2.40.1", sleep=5)
+            env = {**ENV_BASE, "PATH": str(bin_dir), "ASI_CACHE_DIR": str(cwd / "cache")}
+            script = (
+                "import json\n"
+                "from asi.commands import doctor\n"
+                "doctor.PROBE_TIMEOUT_S = 0.2\n"
+                "print(json.dumps(doctor.run_doctor()))\n"
+            )
+            result = subprocess.run([PYTHON, "-c", script], cwd=str(cwd), env=env, text=True, capture_output=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            git = json.loads(result.stdout)["tools"]["git"]
+            self.assertTrue(git["available"])
+            self.assertIsNone(git["version"])
+            self.assertIn("timed out", git["error"])
+            self.assertLess(git["probe_ms"], 4000)
+            self.assertFalse((cwd / "cache" / "doctor" / "tools.json").exists())
+
+    def test_cmd_doctor_prints_the_report(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            bin_dir = cwd / "bin"
+            bin_dir.mkdir()
+            write_tool(bin_dir / "git", "git version 2.40.1")
+            env = {**ENV_BASE, "PATH": str(bin_dir), "ASI_CACHE_DIR": str(cwd / "cache")}
+            script = "import sys\nfrom asi.commands import cmd_doctor\nsys.exit(cmd_doctor())\n"
+            result = subprocess.run([PYTHON, "-c", script], cwd=str(cwd), env=env, text=True, capture_output=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            report = json.loads(result.stdout)
+            self.assertTrue(report["ok"])
+            self.assertEqual(report["tools"]["git"]["version"], "2.40.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
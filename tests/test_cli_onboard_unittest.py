@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import subprocess
@@ -21,6 +22,7 @@ def run_cli(args, *, cwd: Path, stdin: str | None = None):
         input=stdin,
         text=True,
         capture_output=True,
+        timeout=120,
     )
     return result.returncode, result.stdout, result.stderr
 
@@ -56,12 +58,16 @@ class TestAsiOnboardCli(unittest.TestCase):
             code, out, err = run_cli(
                 ["onboard", "run", "--stdin"],
                 cwd=cwd,
-                stdin=json.dumps({"topic": "Read entrypoints", "entrypoints": ["llms.txt"]}),
+                stdin=json.dumps(
+                    {"topic": "Read entrypoints", "entrypoints": ["llms.txt"], "extra": 1}
+                ),
             )
             self.assertEqual(code, 0, err)
             payload = json.loads(out)
             self.assertEqual(payload["status"], "ready")
             self.assertEqual(payload["plan"]["topic"], "Read entrypoints")
+            # Undeclared fields are accepted and dropped, as the old parser did.
+            self.assertNotIn("extra", payload["plan"])
 
     def test_onboard_run_rejects_invalid_plan(self):
         with tempfile.TemporaryDirectory() as td:
@@ -77,6 +83,196 @@ class TestAsiOnboardCli(unittest.TestCase):
             payload = json.loads(out)
             self.assertIn("error", payload)
 
+    def test_onboard_run_errors_follow_the_schema(self):
+        cases = [
+            ({"topic": "t" * 201}, "Field 'topic' must be at most 200 characters."),
+            ({"topic": "t", "entrypoints": ["a", 3]}, "entrypoints[1] must be a string."),
+            ({}, "Missing required field: topic"),
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            for plan, message in cases:
+                with self.subTest(plan=plan):
+                    code, out, err = run_cli(
+                        ["onboard", "run", "--stdin"], cwd=cwd, stdin=json.dumps(plan)
+                    )
+                    self.assertNotEqual(code, 0, out + err)
+                    self.assertEqual(json.loads(out)["error"], message)
+
+    def test_onboard_run_reads_entrypoints_into_a_manifest(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            (cwd / "docs").mkdir()
+            guide = "# Guide\n\nfirst line\nsecond line\nlast line without newline"
+            (cwd / "docs" / "GUIDE.md").write_text(guide, encoding="utf-8")
+            (cwd / "tool.bin").write_bytes(b"\x7fELF\0\0binary")
+            (cwd / "empty.md").write_bytes(b"")
+            os.mkfifo(cwd / "pipe.md")
+            entrypoints = [
+                "docs/GUIDE.md",
+                "https://example.com/llms.txt",
+                "docs",
+                "../outside.md",
+                "missing.md",
+                "tool.bin",
+                "empty.md",
+                str(cwd / "docs" / "GUIDE.md"),
+                "docs/bad\0name.md",
+                "pipe.md",
+            ]
+
+            code, out, err = run_cli(
+                ["onboard", "run", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps({"topic": "t", "entrypoints": entrypoints, "excerpt_bytes": 20}),
+            )
+            self.assertEqual(code, 0, err)
+            manifest = json.loads(out)["entrypoints"]
+            self.assertEqual([m["entrypoint"] for m in manifest], entrypoints)
+            self.assertEqual(
+                manifest[0],
+                {
+                    "entrypoint": "docs/GUIDE.md",
+                    "path": "docs/GUIDE.md",
+                    "size": len(guide),
+                    "lines": 5,
+                    "sha256": hashlib.sha256(guide.encode("utf-8")).hexdigest(),
+                    "excerpt": "# Guide\n\nfirst line\n",
+                    "truncated": True,
+                },
+            )
+            self.assertEqual(
+                [m.get("skipped") for m in manifest[1:6]],
+                ["url", "directory", "outside_repo", "missing", "binary"],
+            )
+            self.assertEqual(manifest[6]["lines"], 0)
+            self.assertFalse(manifest[6]["truncated"])
+            self.assertEqual(manifest[7]["path"], "docs/GUIDE.md")
+            self.assertEqual(manifest[7]["sha256"], manifest[0]["sha256"])
+            self.assertEqual(manifest[8], {"entrypoint": "docs/bad\0name.md", "skipped": "invalid_path"})
+            # Opening the FIFO would block forever; run_cli's timeout fails the test instead.
+            self.assertEqual(
+                manifest[9], {"entrypoint": "pipe.md", "path": "pipe.md", "skipped": "special_file"}
+            )
+
+            code, out, err = run_cli(
+                ["onboard", "run", "--stdin"],
+                cwd=cwd,
+                stdin=json.dumps({"topic": "t", "entrypoints": ["docs/GUIDE.md"]}),
+            )
+            self.assertEqual(code, 0, err)
+            (entry,) = json.loads(out)["entrypoints"]
+            self.assertEqual(entry["excerpt"], guide)
+            self.assertFalse(entry["truncated"])
+
+    def test_onboard_index_updates_incrementally_and_answers_queries(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            # A bare `.git` directory is not a checkout, so files come from the walk.
+            (cwd / ".git").mkdir()
+            (cwd / "src" / "pkg").mkdir(parents=True)
+            (cwd / "src" / "pkg" / "core.py").write_text(
+                "import os\n\nclass Engine:\n    def run(self):\n        pass\n\ndef main():\n    pass\n",
+                encoding="utf-8",
+            )
+            (cwd / "src" / "app.ts").write_text("export function start() {}\nexport interface Options {}\n", encoding="utf-8")
+            (cwd / "README.md").write_text("# Demo\n\nText.\n\n## Usage\n", encoding="utf-8")
+            (cwd / "logo.png").write_bytes(b"\x89PNG\0" + b"x" * 4000)
+            (cwd / "node_modules").mkdir()
+            (cwd / "node_modules" / "dep.js").write_text("function dep() {}\n", encoding="utf-8")
+
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            built = json.loads(out)
+            self.assertEqual(built["source"], "walk")
+            self.assertEqual((built["files"], built["added"], built["unchanged"]), (4, 4, 0))
+            self.assertEqual(built["languages"], {"markdown": 1, "python": 1, "typescript": 1})
+            index_file = cwd / ".asi" / "onboard" / "index.json"
+            records = {record["path"]: record for record in json.loads(index_file.read_text(encoding="utf-8"))["files"]}
+            core = records["src/pkg/core.py"]
+            self.assertEqual(core["symbols"], ["Engine", "main"])
+            self.assertEqual(core["lines"], 8)
+            self.assertEqual(core["sha256"], hashlib.sha256((cwd / "src" / "pkg" / "core.py").read_bytes()).hexdigest())
+            self.assertEqual(records["src/app.ts"]["symbols"], ["start", "Options"])
+            self.assertEqual(records["README.md"]["symbols"], ["Demo", "Usage"])
+            self.assertTrue(records["logo.png"]["binary"])
+            self.assertIsNone(records["logo.png"]["language"])
+
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            again = json.loads(out)
+            self.assertEqual((again["added"], again["updated"], again["removed"], again["unchanged"]), (0, 0, 0, 4))
+
+            # Same size, new mtime: re-read. Deleted and new files are picked up.
+            core_path = cwd / "src" / "pkg" / "core.py"
+            core_path.write_text(core_path.read_text(encoding="utf-8").replace("main", "boot"), encoding="utf-8")
+            os.utime(core_path, ns=(1, 1))
+            (cwd / "README.md").unlink()
+            (cwd / "src" / "pkg" / "util.py").write_text("def helper():\n    pass\n", encoding="utf-8")
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            updated = json.loads(out)
+            self.assertEqual((updated["added"], updated["updated"], updated["removed"], updated["unchanged"]), (1, 1, 1, 2))
+
+            code, out, err = run_cli(["onboard", "query", "--language", "python"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            result = json.loads(out)
+            self.assertEqual([f["path"] for f in result["files"]], ["src/pkg/core.py", "src/pkg/util.py"])
+            self.assertEqual(result["files"][0]["symbols"], ["Engine", "boot"])
+
+            code, out, err = run_cli(["onboard", "query", "--glob", "src/**/*.py", "--largest", "1"], cwd=cwd)
+            result = json.loads(out)
+            self.assertEqual(result["matched"], 2)
+            self.assertEqual([f["path"] for f in result["files"]], ["src/pkg/core.py"])
+            code, out, err = run_cli(["onboard", "query", "--glob", "*.ts"], cwd=cwd)
+            self.assertEqual([f["path"] for f in json.loads(out)["files"]], ["src/app.ts"])
+            code, out, err = run_cli(["onboard", "query", "--largest", "1"], cwd=cwd)
+            self.assertEqual([f["path"] for f in json.loads(out)["files"]], ["logo.png"])
+
+            # Queries read the index, not the tree.
+            core_path.unlink()
+            code, out, err = run_cli(["onboard", "query", "--language", "python"], cwd=cwd)
+            self.assertEqual(json.loads(out)["matched"], 2)
+
+            index_file.unlink()
+            code, out, err = run_cli(["onboard", "query"], cwd=cwd)
+            self.assertEqual(code, 1)
+            self.assertIn("asi onboard index", json.loads(out)["error"])
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs FIFOs and symlinks")
+    def test_onboard_index_skips_special_files_and_links_out_of_the_repo(self):
+        with tempfile.TemporaryDirectory() as td, tempfile.TemporaryDirectory() as outside:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            (cwd / "src").mkdir()
+            (cwd / "src" / "main.py").write_text("def main():\n    pass\n", encoding="utf-8")
+            os.mkfifo(cwd / "src" / "pipe")
+            secret = Path(outside) / "secret.txt"
+            secret.write_text("not part of the repo\n", encoding="utf-8")
+            (cwd / "src" / "leak.txt").symlink_to(secret)
+            (cwd / "src" / "alias.py").symlink_to(cwd / "src" / "main.py")
+
+            # Opening the FIFO would block forever; run_cli's timeout fails the test instead.
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(json.loads(out)["files"], 2)
+            code, out, err = run_cli(["onboard", "query"], cwd=cwd)
+            files = {f["path"]: f for f in json.loads(out)["files"]}
+            self.assertEqual(sorted(files), ["src/alias.py", "src/main.py"])
+            self.assertEqual(files["src/alias.py"]["sha256"], files["src/main.py"]["sha256"])
+
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            again = json.loads(out)
+            self.assertEqual((again["updated"], again["unchanged"]), (0, 2))
+
+            # Retargeting an in-repo link outside drops it from the index.
+            (cwd / "src" / "alias.py").unlink()
+            (cwd / "src" / "alias.py").symlink_to(secret)
+            code, out, err = run_cli(["onboard", "index"], cwd=cwd)
+            self.assertEqual(json.loads(out)["removed"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
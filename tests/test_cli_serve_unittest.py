@@ -0,0 +1,249 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+
+
+def run_serve(requests, *, cwd: Path):
+    stdin = "".join(json.dumps(r) + "\n" for r in requests)
+    result = subprocess.run(
+        [PYTHON, "-m", "asi.cli", "serve"],
+        cwd=str(cwd),
+        env=ENV_BASE,
+        input=stdin,
+        text=True,
+        capture_output=True,
+    )
+    responses = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+    return result.returncode, responses, result.stderr
+
+
+def _suggestions(questions):
+    out = []
+    for idx, q in enumerate(questions, start=1):
+        out.append(
+            {
+                "question_id": q["id"],
+                "options": [
+                    {
+                        "label": f"Option {idx}.{n}",
+                        "value": f"value-{idx}-{n}",
+                        "description": "Approach",
+                        "impact": "Risk",
+                    }
+                    for n in (1, 2, 3)
+                ],
+                "recommended": 1,
+            }
+        )
+    return out
+
+
+class TestAsiServeCli(unittest.TestCase):
+    def test_serve_next_and_schema(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, responses, err = run_serve(
+                [
+                    {"jsonrpc": "2.0", "id": 1, "method": "creator.next"},
+                    {"jsonrpc": "2.0", "id": 2, "method": "creator.schema", "params": {"kind": "apply"}},
+                    {"jsonrpc": "2.0", "id": 3, "method": "doctor"},
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual([r["id"] for r in responses], [1, 2, 3])
+            self.assertEqual(responses[0]["result"]["status"], "need_suggestions")
+            self.assertIn("ask_set_id", responses[1]["result"]["properties"])
+            self.assertIn("tools", responses[2]["result"])
+
+    def test_serve_full_loop_in_one_process(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            proc = subprocess.Popen(
+                [PYTHON, "-m", "asi.cli", "serve"],
+                cwd=str(cwd),
+                env=ENV_BASE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+            def call(req_id, method, params=None):
+                request = {"jsonrpc": "2.0", "id": req_id, "method": method}
+                if params is not None:
+                    request["params"] = params
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                response = json.loads(proc.stdout.readline())
+                self.assertEqual(response["id"], req_id)
+                return response["result"]
+
+            try:
+                nxt = call(1, "creator.next")
+                ask = call(
+                    2,
+                    "creator.suggest",
+                    {"iteration_id": nxt["iteration_id"], "suggestions": _suggestions(nxt["questions"])},
+                )
+                self.assertEqual(ask["status"], "need_answers")
+                answers = [{"question_id": q["id"], "selection": 1} for q in ask["questions"]]
+                applied = call(
+                    3,
+                    "creator.apply",
+                    {
+                        "ask_set_id": ask["ask_set_id"],
+                        "confirmed": True,
+                        "answers": answers,
+                        "if_none_match": nxt["etag"],
+                    },
+                )
+                after = call(4, "creator.next")
+            finally:
+                _, err = proc.communicate(timeout=30)
+            self.assertEqual(proc.returncode, 0, err)
+            self.assertIn(applied["status"], ("ready", "need_suggestions"))
+            self.assertEqual(after["status"], "ready")
+            delta = applied["next"]
+            self.assertEqual(delta["etag"], after["etag"])
+            self.assertIn("schemas", delta["unchanged"])
+            self.assertEqual(delta["questions"], [])
+
+    def test_serve_keeps_its_session_until_another_process_writes_state(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            proc = subprocess.Popen(
+                [PYTHON, "-m", "asi.cli", "serve"],
+                cwd=str(cwd),
+                env=ENV_BASE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+            def call(req_id, method, params=None):
+                request = {"jsonrpc": "2.0", "id": req_id, "method": method, "params": params or {}}
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                return json.loads(proc.stdout.readline())
+
+            def cli(args, stdin=None):
+                result = subprocess.run(
+                    [PYTHON, "-m", "asi.cli", *args],
+                    cwd=str(cwd),
+                    env=ENV_BASE,
+                    input=stdin,
+                    text=True,
+                    capture_output=True,
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                return json.loads(result.stdout)
+
+            try:
+                nxt = call(1, "creator.next")["result"]
+                # The ask set the CLI records must be visible to the server's next apply.
+                ask = cli(
+                    ["creator", "suggest", "--stdin"],
+                    json.dumps(
+                        {"iteration_id": nxt["iteration_id"], "suggestions": _suggestions(nxt["questions"])}
+                    ),
+                )
+                answers = [{"question_id": q["id"], "selection": 1} for q in ask["questions"]]
+                applied = call(
+                    2,
+                    "creator.apply",
+                    {"ask_set_id": ask["ask_set_id"], "confirmed": True, "answers": answers},
+                )
+                self.assertIn("result", applied, applied)
+                after = cli(["creator", "next"])
+                served = call(3, "creator.next")["result"]
+            finally:
+                _, err = proc.communicate(timeout=30)
+            self.assertEqual(proc.returncode, 0, err)
+            self.assertEqual(after["status"], "ready")
+            self.assertEqual(served["etag"], after["etag"])
+
+        # Unchanged state is loaded once for the whole server.
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            script = (
+                "import io, sys\n"
+                "from asi.commands import serve\n"
+                "from asi.creator.session import CreatorSession\n"
+                "loads = []\n"
+                "load = CreatorSession.load\n"
+                "CreatorSession.load = classmethod(lambda cls: loads.append(1) or load())\n"
+                "requests = '{\"jsonrpc\": \"2.0\", \"id\": 1, \"method\": \"creator.next\"}\\n' * 3\n"
+                "serve.serve(io.StringIO(requests), io.StringIO())\n"
+                "print(len(loads))\n"
+            )
+            result = subprocess.run(
+                [PYTHON, "-c", script], cwd=str(cwd), env=ENV_BASE, text=True, capture_output=True
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout.strip(), "1")
+
+    def test_serve_survives_unexpected_handler_errors(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            state = cwd / ".asi" / "creator" / "state.json"
+            state.parent.mkdir(parents=True)
+            state.write_text("[]", encoding="utf-8")
+            code, responses, err = run_serve(
+                [
+                    {"jsonrpc": "2.0", "id": 1, "method": "creator.next"},
+                    {"jsonrpc": "2.0", "id": 2, "method": "doctor"},
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual([r["id"] for r in responses], [1, 2])
+            self.assertEqual(responses[0]["error"]["code"], -32603)
+            self.assertIn("error", responses[0]["error"]["data"])
+            self.assertIn("tools", responses[1]["result"])
+
+    def test_serve_error_payload_matches_cli(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, responses, err = run_serve(
+                [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "creator.apply",
+                        "params": {"ask_set_id": "x", "answers": [{"question_id": "creator.skill_name"}]},
+                    },
+                    {"jsonrpc": "2.0", "id": 2, "method": "creator.nope"},
+                    {"jsonrpc": "2.0", "method": "creator.next"},
+                    {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+                    {"jsonrpc": "2.0", "id": 4, "method": "creator.next"},
+                ],
+                cwd=cwd,
+            )
+            self.assertEqual(code, 0, err)
+            self.assertEqual([r["id"] for r in responses], [1, 2, 3])
+            data = responses[0]["error"]["data"]
+            self.assertIn("Missing required field: selection", data["error"])
+            self.assertEqual(data["schema_cmd"], "asi creator apply --schema")
+            self.assertEqual(responses[1]["error"]["code"], -32601)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+
+
+def run_cli(args, *, cwd: Path, env: dict[str, str]):
+    result = subprocess.run(
+        [PYTHON, "-m", "asi.cli", *args],
+        cwd=str(cwd),
+        env=env,
+        capture_output=True,
+    )
+    return result.returncode, result.stdout, result.stderr.decode("utf-8", "replace")
+
+
+class TestAsiSkillCli(unittest.TestCase):
+    def test_skill_init_output_is_cached_until_a_reference_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            refs = cwd / "skill" / "references"
+            refs.mkdir(parents=True)
+            (refs / "00_ROUTER.md").write_text("router\n", encoding="utf-8")
+            (refs / "01_SUMMARY.md").write_text(
+                "---\nname: summary\ndescription: What it does\n---\n\nSummary body.\n", encoding="utf-8"
+            )
+            (refs / "02_INTENT.md").write_text("Intent body.\n", encoding="utf-8")
+            env = {**ENV_BASE, "ASI_CACHE_DIR": str(cwd / "cache")}
+            args = ["skill", "init", "--skill-dir", str(cwd / "skill")]
+
+            code, first, err = run_cli(args, cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(
+                first.decode("utf-8"),
+                "# References\n\n1. **SUMMARY** — What it does\n2. **INTENT**\n\n---\n\n"
+                "---\nname: summary\ndescription: What it does\n---\n\nSummary body.\n\n\n"
+                "Intent body.\n\n\n",
+            )
+            entries = list((cwd / "cache" / "skill-init").iterdir())
+            self.assertEqual(len(entries), 1)
+
+            # A warm cache is served from the cache entry, not the references.
+            entry = entries[0]
+            stamp = entry.read_bytes().split(b"\n", 1)[0]
+            entry.write_bytes(stamp + b"\nfrom cache\n")
+            code, second, err = run_cli(args, cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(second, b"from cache\n")
+
+            code, uncached, err = run_cli([*args, "--no-cache"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(uncached, first)
+
+            (refs / "02_INTENT.md").write_text("Intent body, revised.\n", encoding="utf-8")
+            code, third, err = run_cli(args, cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertIn(b"Intent body, revised.", third)
+            self.assertEqual(len(list((cwd / "cache" / "skill-init").iterdir())), 1)
+
+    def test_skill_init_works_without_a_writable_cache(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            refs = cwd / "skill" / "references"
+            refs.mkdir(parents=True)
+            (refs / "01_SUMMARY.md").write_text("Summary body.\n", encoding="utf-8")
+            blocker = cwd / "not-a-dir"
+            blocker.write_text("", encoding="utf-8")
+            env = {**ENV_BASE, "ASI_CACHE_DIR": str(blocker)}
+            code, out, err = run_cli(["skill", "init", "--skill-dir", str(cwd / "skill")], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertIn(b"Summary body.", out)
+
+    def test_skill_init_budget_emits_whole_references_until_the_budget_runs_out(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            refs = cwd / "skill" / "references"
+            refs.mkdir(parents=True)
+            (refs / "01_SUMMARY.md").write_text("---\ndescription: Short\n---\n" + "s" * 400 + "\n", encoding="utf-8")
+            (refs / "02_PROCEDURE.md").write_text("---\ndescription: Long | wide\n---\n" + "p" * 4000 + "\n", encoding="utf-8")
+            (refs / "03_POLICIES.md").write_text("small\n", encoding="utf-8")
+            env = {**ENV_BASE, "ASI_CACHE_DIR": str(cwd / "cache")}
+            args = ["skill", "init", "--skill-dir", str(cwd / "skill"), "--budget", "300"]
+
+            code, out, err = run_cli(args, cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            text = out.decode("utf-8")
+            self.assertIn("| 1 | SUMMARY | 107 | Short |", text)
+            self.assertIn("| 2 | PROCEDURE | 1009 | Long \\| wide |", text)
+            self.assertIn("s" * 400, text)
+            self.assertNotIn("p" * 4000, text)
+            # Router order: nothing after the first reference that does not fit.
+            self.assertNotIn("small", text)
+            self.assertIn("1 of 3 references included", text)
+            self.assertIn("- **PROCEDURE** (`references/02_PROCEDURE.md`, ~1009 tokens) — Long | wide", text)
+            self.assertIn("- **POLICIES** (`references/03_POLICIES.md`, ~2 tokens)", text)
+
+            code, out, err = run_cli([*args[:-1], "5000"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertIn("p" * 4000, out.decode("utf-8"))
+            self.assertIn("3 of 3 references included", out.decode("utf-8"))
+
+            (index_file,) = (cwd / "cache" / "skill-index").iterdir()
+            before = {e["file"]: e for e in json.loads(index_file.read_text(encoding="utf-8"))["references"]}
+            (refs / "03_POLICIES.md").write_text("---\ndescription: Rules\n---\n", encoding="utf-8")
+            code, out, err = run_cli(args, cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            after = {e["file"]: e for e in json.loads(index_file.read_text(encoding="utf-8"))["references"]}
+            self.assertEqual(after["01_SUMMARY.md"], before["01_SUMMARY.md"])
+            self.assertEqual(after["03_POLICIES.md"]["description"], "Rules")
+            self.assertIn("| 3 | POLICIES | 7 | Rules |", out.decode("utf-8"))
+
+            code, _, err = run_cli([*args[:-1], "0"], cwd=cwd, env=env)
+            self.assertEqual(code, 2)
+            self.assertIn("positive number of tokens", err)
+
+    def test_skill_section_seeks_indexed_headings(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            refs = cwd / "skill" / "references"
+            refs.mkdir(parents=True)
+            procedure = (
+                "---\ndescription: Steps\n# not a heading\n---\n\n# Procedure\n\n"
+                "## Steps\n\nRun next.\n\n### Detail\n\n```bash\n# not a heading\n```\n\n"
+                "## Output\n\nArtifacts.\n"
+            )
+            (refs / "01_PROCEDURE.md").write_text(procedure, encoding="utf-8")
+            (refs / "02_POLICIES.md").write_text("# Policies\n\n## Output\n\nNever.\n", encoding="utf-8")
+            env = {**ENV_BASE, "ASI_CACHE_DIR": str(cwd / "cache")}
+            skill_dir = ["--skill-dir", str(cwd / "skill")]
+
+            code, out, err = run_cli(["skill", "index", *skill_dir], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            index = json.loads(out)
+            self.assertTrue(Path(index["index"]).exists())
+            # Served from the index, the same result comes back byte for byte.
+            code, again, err = run_cli(["skill", "index", *skill_dir], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(again, out)
+            sections = {s["id"]: s for ref in index["references"] for s in ref["sections"]}
+            self.assertEqual(
+                list(sections),
+                ["PROCEDURE/procedure", "PROCEDURE/steps", "PROCEDURE/output", "POLICIES/policies", "POLICIES/output"],
+            )
+            steps = sections["PROCEDURE/steps"]
+            self.assertEqual(steps["description"], "Run next.")
+            data = procedure.encode("utf-8")
+            self.assertEqual(data[steps["offset"] : steps["offset"] + steps["length"]].split(b"\n", 1)[0], b"## Steps")
+
+            code, out, err = run_cli(["skill", "section", *skill_dir, "steps"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(
+                out.decode("utf-8"),
+                "## Steps\n\nRun next.\n\n### Detail\n\n```bash\n# not a heading\n```\n\n",
+            )
+
+            code, out, err = run_cli(["skill", "section", *skill_dir, "output"], cwd=cwd, env=env)
+            self.assertEqual(code, 1)
+            self.assertIn("Ambiguous section", json.loads(out)["error"])
+            code, out, err = run_cli(["skill", "section", *skill_dir, "POLICIES/output"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(out, b"## Output\n\nNever.\n")
+
+            # A changed reference is re-indexed before seeking.
+            (refs / "02_POLICIES.md").write_text("# Policies\n\nIntro line.\n\n## Output\n\nAlways.\n", encoding="utf-8")
+            code, out, err = run_cli(["skill", "section", *skill_dir, "POLICIES/output"], cwd=cwd, env=env)
+            self.assertEqual(code, 0, err)
+            self.assertEqual(out, b"## Output\n\nAlways.\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
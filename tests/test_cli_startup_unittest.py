@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON = sys.executable
+ENV_BASE = os.environ.copy()
+ENV_BASE["PYTHONPATH"] = str(ROOT / "skills" / "cli" / "src")
+
+
+def loaded_asi_modules(argv, *, cwd: Path):
+    code = (
+        "import contextlib, io, json, sys\n"
+        "from asi.cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        f"    main({argv!r})\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('asi'))))\n"
+    )
+    result = subprocess.run(
+        [PYTHON, "-c", code],
+        cwd=str(cwd),
+        env=ENV_BASE,
+        text=True,
+        capture_output=True,
+    )
+    return result.returncode, json.loads(result.stdout.splitlines()[-1]), result.stderr
+
+
+class TestAsiCliStartup(unittest.TestCase):
+    def test_doctor_does_not_import_creator_stack(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, modules, err = loaded_asi_modules(["doctor"], cwd=cwd)
+            self.assertIn("asi.commands.doctor", modules, err)
+            for name in ("asi.commands.creator", "asi.creator.loop", "asi.commands.onboard"):
+                self.assertNotIn(name, modules)
+
+    def test_onboard_schema_does_not_import_creator_stack(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            code, modules, err = loaded_asi_modules(["onboard", "--schema"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            self.assertIn("asi.schemas", modules)
+            self.assertFalse([m for m in modules if m.startswith("asi.creator")])
+
+    def test_schema_commands_serve_prebuilt_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            cwd = Path(td)
+            (cwd / ".git").mkdir()
+            for argv in (["creator", "suggest", "--schema"], ["creator", "apply", "--schema"]):
+                code, modules, err = loaded_asi_modules(argv, cwd=cwd)
+                self.assertEqual(code, 0, err)
+                self.assertIn("asi.schemas", modules)
+                self.assertFalse([m for m in modules if m.startswith("asi.creator")], argv)
+            code, modules, err = loaded_asi_modules(["creator", "--schema"], cwd=cwd)
+            self.assertEqual(code, 0, err)
+            for name in ("asi.creator.state", "asi.creator.storage", "asi.creator.loop"):
+                self.assertNotIn(name, modules)
+
+    def test_lazy_parser_lists_every_command(self):
+        with tempfile.TemporaryDirectory() as td:
+            result = subprocess.run(
+                [PYTHON, "-m", "asi.cli", "--help"],
+                cwd=td,
+                env=ENV_BASE,
+                text=True,
+                capture_output=True,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            for name in ("doctor", "skill", "onboard", "creator", "serve", "batch"):
+                self.assertIn(name, result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()